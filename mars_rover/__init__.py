@@ -0,0 +1,4 @@
+import time
+
+# When the package started importing; ``--startup-profile`` reports from here.
+_import_started = time.perf_counter()
@@ -0,0 +1,295 @@
+"""Non-interactive batch execution with buffered output."""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, TextIO
+
+from mars_rover.commands import (
+    Command,
+    FailedCommand,
+    LeftCommand,
+    MoveCommand,
+    PlaceCommand,
+    ReportCommand,
+    RightCommand,
+)
+from mars_rover.compiler import compile_commands
+from mars_rover.exceptions import RoverException
+from mars_rover.parser import CommandParser
+from mars_rover.repeat import RepeatCommand
+from mars_rover.result import CommandResult, RepeatedOutput, repeat_blocks
+from mars_rover.rover import Rover
+from mars_rover.status import Status, format_status
+
+if TYPE_CHECKING:
+    from mars_rover.instrumentation import Stats
+
+READ_CHUNK_SIZE = 1 << 20
+DEFAULT_FLUSH_SIZE = 1 << 16
+EXIT_COMMAND = "EXIT"
+
+Result = CommandResult | str | RepeatedOutput
+
+
+@dataclass
+class BatchSummary:
+    """Counters collected while executing a batch of commands."""
+
+    commands: int = 0
+    failures: int = 0
+    # "path: error" for each input file that could not be read.
+    unreadable: list[str] = field(default_factory=list)
+
+    def add(self, other: "BatchSummary") -> None:
+        """Accumulate counters from another summary."""
+        self.commands += other.commands
+        self.failures += other.failures
+        self.unreadable.extend(other.unreadable)
+
+
+class OutputBuffer:
+    """Collects output text and writes it to a stream in large blocks.
+
+    The buffer is written out once it holds at least ``flush_size``
+    characters or, when ``flush_interval`` is set, once that many seconds
+    have passed since the last flush.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: Optional[float] = None,
+    ):
+        self.stream = stream
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        """Add text to the buffer, flushing when a threshold is reached."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.flush_size:
+            self.flush()
+        elif (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered text to the underlying stream."""
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        self.stream.flush()
+        self._last_flush = time.monotonic()
+
+
+def read_lines(in_stream: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Read lines from a stream in chunks of roughly ``chunk_size`` characters.
+
+    Args:
+        in_stream (TextIO): Input stream
+        chunk_size (int): Size hint passed to ``readlines``
+
+    Yields:
+        Raw input lines
+    """
+    while True:
+        lines = in_stream.readlines(chunk_size)
+        if not lines:
+            return
+        yield from lines
+
+
+def parse_lines(parser: CommandParser, lines: Iterable[str]) -> Iterator[Command]:
+    """Parse input lines into commands, stopping at EXIT.
+
+    Blank lines are skipped. Lines that fail to parse are yielded as
+    ``FailedCommand`` so errors keep their position in the stream.
+
+    Args:
+        parser (CommandParser): Command parser instance
+        lines (Iterable[str]): Raw input lines
+
+    Yields:
+        Command objects
+    """
+    for line in lines:
+        user_input = line.strip()
+        if not user_input:
+            continue
+        if user_input.upper() == EXIT_COMMAND:
+            return
+        try:
+            yield parser.parse(user_input)
+        except RoverException as e:
+            yield FailedCommand(e)
+
+
+def execute_stream(
+    commands: Iterable[Command],
+    rover: Rover,
+    summary: Optional[BatchSummary] = None,
+) -> Iterator[Result]:
+    """Execute commands one at a time, yielding each result.
+
+    The basic commands run through the rover's exception-free ``try_*``
+    methods; successes yield the shared ``CommandResult.ok()`` and errors
+    for the same status share one result. A REPEAT yields its output in
+    blocks, running further iterations only as they are taken. Other
+    commands run through ``execute``; compiled commands count as every
+    source command they stand for, and a result counts every failure it
+    stands for.
+
+    Args:
+        commands (Iterable[Command]): Commands to execute
+        rover (Rover): Rover instance
+        summary (Optional[BatchSummary]): Counters to update as commands run
+
+    Yields:
+        A ``CommandResult``, the REPORT string, or ``RepeatedOutput`` blocks
+    """
+    if summary is None:
+        summary = BatchSummary()
+    ok = CommandResult.ok()
+    errors: dict[int, CommandResult] = {}
+    for command in commands:
+        command_type = type(command)
+        if command_type is MoveCommand:
+            status = rover.try_move()
+        elif command_type is LeftCommand:
+            status = rover.try_left()
+        elif command_type is RightCommand:
+            status = rover.try_right()
+        elif command_type is ReportCommand:
+            report = rover.try_report()
+            if report is not None:
+                summary.commands += 1
+                yield report
+                continue
+            status = Status.ROVER_NOT_PLACED
+        elif command_type is PlaceCommand:
+            args = command.args
+            status = rover.try_place(args.x, args.y, args.direction)
+            if status:
+                summary.commands += 1
+                summary.failures += 1
+                yield CommandResult.error(format_status(status, args.x, args.y))
+                continue
+        elif command_type is RepeatCommand:
+            summary.commands += command.count
+            for block in command.execute_blocks(rover):
+                summary.failures += block.failures
+                yield block
+            continue
+        else:
+            summary.commands += getattr(command, "count", 1)
+            try:
+                result = command.execute(rover)
+            except RoverException as e:
+                result = CommandResult.error(str(e))
+            if isinstance(result, CommandResult):
+                if not result.success:
+                    summary.failures += result.count
+            elif isinstance(result, RepeatedOutput):
+                summary.failures += result.failures
+            yield result
+            continue
+
+        summary.commands += 1
+        if not status:
+            yield ok
+            continue
+        summary.failures += 1
+        error = errors.get(status)
+        if error is None:
+            error = errors[status] = CommandResult.error(format_status(status))
+        yield error
+
+
+def format_results(results: Iterable[Result]) -> Iterator[str]:
+    """Turn results into output text.
+
+    Successful results produce nothing. Results standing for many commands
+    are expanded in bounded blocks rather than one string.
+
+    Args:
+        results (Iterable[Result]): Results from ``execute_stream``
+
+    Yields:
+        Newline-terminated output text
+    """
+    for result in results:
+        if isinstance(result, CommandResult):
+            if result.success:
+                continue
+            if result.count == 1:
+                yield f"Error: {result.message}\n"
+            else:
+                yield from repeat_blocks(f"Error: {result.message}\n", result.count)
+        elif isinstance(result, RepeatedOutput):
+            yield from result.blocks()
+        elif isinstance(result, str):
+            yield f"{result}\n"
+
+
+def execute_commands(
+    commands: Iterable[Command],
+    rover: Rover,
+    write: Callable[[str], None],
+    stats: Optional["Stats"] = None,
+) -> BatchSummary:
+    """Execute commands against a rover, writing reports and errors.
+
+    This is ``execute_stream`` and ``format_results`` feeding ``write``.
+
+    Args:
+        commands (Iterable[Command]): Commands to execute
+        rover (Rover): Rover instance
+        write (Callable[[str], None]): Output sink
+        stats (Optional[Stats]): Time and count each command as it runs
+
+    Returns:
+        BatchSummary with command and failure counts
+    """
+    summary = BatchSummary()
+    if stats is None:
+        results = execute_stream(commands, rover, summary)
+    else:
+        results = stats.execute_stream(commands, rover, summary)
+    for text in format_results(results):
+        write(text)
+    return summary
+
+
+def run_batch(
+    parser: CommandParser,
+    rover: Rover,
+    in_stream: TextIO,
+    out: OutputBuffer,
+    compiled: bool = False,
+    stats: Optional["Stats"] = None,
+) -> BatchSummary:
+    """Run commands from a stream without prompts.
+
+    Args:
+        parser (CommandParser): Command parser instance
+        rover (Rover): Rover instance
+        in_stream (TextIO): Input stream
+        out (OutputBuffer): Buffered output
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+        stats (Optional[Stats]): Time and count each command as it runs
+
+    Returns:
+        BatchSummary with command and failure counts
+    """
+    commands = parse_lines(parser, read_lines(in_stream))
+    if compiled:
+        commands = compile_commands(commands)
+    return execute_commands(commands, rover, out.write, stats)
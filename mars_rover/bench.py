@@ -0,0 +1,417 @@
+"""Throughput benchmarks for the parser, rover and CLI loop.
+
+Run with ``python -m mars_rover.bench``. Workloads are synthetic and
+deterministic for a given seed, so results are comparable across commits.
+Each target is timed alongside a reference loop over the same lines that
+uses no mars_rover code, and results are compared to a baseline as speeds
+relative to it, so a baseline recorded on one machine still applies on a
+faster or slower one.
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from io import StringIO
+from typing import Callable, Optional
+
+from mars_rover.exceptions import RoverException
+from mars_rover.main import run_cli_loop
+from mars_rover.models import Direction, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+DEFAULT_COUNT = 20_000
+DEFAULT_SEED = 1
+DEFAULT_TOLERANCE = 0.3
+# Timed runs per target, each paired with a run of the reference loop.
+REPEATS = 7
+BOUNDS = TableBounds()
+
+
+def _place(rng: random.Random, spread: int = 0) -> str:
+    x = rng.randint(BOUNDS.min_x - spread, BOUNDS.max_x + spread)
+    y = rng.randint(BOUNDS.min_y - spread, BOUNDS.max_y + spread)
+    return f"PLACE {x},{y},{rng.choice(list(Direction)).value}"
+
+
+def _move_heavy(rng: random.Random, count: int) -> list[str]:
+    choices = ["MOVE"] * 8 + ["LEFT", "RIGHT"]
+    return ["PLACE 0,0,NORTH"] + [rng.choice(choices) for _ in range(count - 1)]
+
+
+def _rotate_heavy(rng: random.Random, count: int) -> list[str]:
+    choices = ["LEFT", "RIGHT"] * 4 + ["MOVE", "REPORT"]
+    return ["PLACE 2,2,NORTH"] + [rng.choice(choices) for _ in range(count - 1)]
+
+
+def _place_heavy(rng: random.Random, count: int) -> list[str]:
+    return [
+        _place(rng, spread=1) if rng.random() < 0.8 else "REPORT" for _ in range(count)
+    ]
+
+
+def _error_heavy(rng: random.Random, count: int) -> list[str]:
+    choices = ["MOVE", "LEFT", "REPORT", "JUMP", "PLACE 1,2", "PLACE X,1,NORTH"]
+    return [rng.choice(choices) for _ in range(count)]
+
+
+def _boundary_hugging(rng: random.Random, count: int) -> list[str]:
+    lines = []
+    while len(lines) < count:
+        lines.append(_place(rng))
+        lines.extend(["MOVE"] * (BOUNDS.max_x + 3))
+        lines.append(rng.choice(["LEFT", "RIGHT"]))
+    return lines[:count]
+
+
+WORKLOADS: dict[str, Callable[[random.Random, int], list[str]]] = {
+    "move_heavy": _move_heavy,
+    "rotate_heavy": _rotate_heavy,
+    "place_heavy": _place_heavy,
+    "error_heavy": _error_heavy,
+    "boundary_hugging": _boundary_hugging,
+}
+
+
+def generate_workload(name: str, count: int, seed: int = DEFAULT_SEED) -> list[str]:
+    """Return ``count`` deterministic command lines for a named workload."""
+    return WORKLOADS[name](random.Random(f"{name}:{seed}"), count)
+
+
+@dataclass
+class BenchResult:
+    """Measurements for one workload and target."""
+
+    workload: str
+    target: str
+    commands: int
+    ops_per_sec: float
+    relative_speed: float
+    p50_ns: int
+    p99_ns: int
+    peak_memory_bytes: int
+
+
+@dataclass
+class AllocationResult:
+    """New memory per command for one workload and target."""
+
+    workload: str
+    target: str
+    commands: int
+    bytes_per_command: float
+    blocks_per_command: float
+
+
+def _run_parse(lines: list[str]) -> None:
+    parser = CommandParser()
+    for line in lines:
+        try:
+            parser.parse(line)
+        except RoverException:
+            pass
+
+
+def _run_execute(lines: list[str]) -> None:
+    parser = CommandParser()
+    rover = Rover(BOUNDS)
+    for line in lines:
+        try:
+            parser.parse(line).execute(rover)
+        except RoverException:
+            pass
+
+
+def _run_cli(lines: list[str]) -> None:
+    script = "\n".join(lines) + "\n"
+    run_cli_loop(CommandParser(), Rover(BOUNDS), StringIO(script), StringIO())
+
+
+def _run_reference(lines: list[str]) -> None:
+    """Split and count command words using only the interpreter."""
+    counts: dict[str, int] = {}
+    for line in lines:
+        word, _, rest = line.strip().upper().partition(" ")
+        counts[word] = counts.get(word, 0) + len(rest.split(","))
+
+
+def _timed(run: Callable[[list[str]], None], lines: list[str]) -> float:
+    start = time.perf_counter()
+    run(lines)
+    return time.perf_counter() - start
+
+
+def measure_throughput(target: str, lines: list[str]) -> tuple[float, float]:
+    """Return a target's ops/sec and its speed relative to the reference loop.
+
+    The target and the reference loop over the same lines are timed in
+    ``REPEATS`` back-to-back pairs, so both halves of a pair see the same
+    machine load and clock speed. Throughput is the best run, and relative
+    speed the median of the pairs' ratios.
+    """
+    run = TARGETS[target]
+    best = math.inf
+    ratios = []
+    for _ in range(REPEATS):
+        reference = _timed(_run_reference, lines)
+        elapsed = _timed(run, lines)
+        best = min(best, elapsed)
+        ratios.append(reference / elapsed)
+    return len(lines) / best, statistics.median(ratios)
+
+
+TARGETS: dict[str, Callable[[list[str]], None]] = {
+    "parse": _run_parse,
+    "execute": _run_execute,
+    "cli": _run_cli,
+}
+
+
+def _latencies(target: str, lines: list[str]) -> list[int]:
+    """Time each command individually; the CLI loop is timed as a whole."""
+    timer = time.perf_counter_ns
+    if target == "cli":
+        start = timer()
+        _run_cli(lines)
+        return [(timer() - start) // len(lines)] * len(lines)
+
+    parser = CommandParser()
+    rover = Rover(BOUNDS)
+    latencies = []
+    for line in lines:
+        start = timer()
+        try:
+            command = parser.parse(line)
+            if target == "execute":
+                command.execute(rover)
+        except RoverException:
+            pass
+        latencies.append(timer() - start)
+    return latencies
+
+
+def _peak_memory(target: str, lines: list[str]) -> int:
+    tracemalloc.start()
+    try:
+        TARGETS[target](lines)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _keep_outputs(target: str, lines: list[str], kept: list[list]) -> None:
+    """Parse, and execute, every line, storing what each one creates."""
+    parser = CommandParser()
+    rover = Rover(BOUNDS)
+    commands, results, positions = kept
+    for i, line in enumerate(lines):
+        try:
+            commands[i] = command = parser.parse(line)
+            if target == "execute":
+                results[i] = command.execute(rover)
+                positions[i] = rover.position
+        except RoverException:
+            pass
+
+
+def measure_allocations(
+    workload: str, target: str, lines: list[str]
+) -> AllocationResult:
+    """Measure the new memory per command for its command, result and position.
+
+    Every one of those objects is kept alive until the end, so allocations
+    that would be freed straight away are counted too, while objects shared
+    between commands count once. Only the ``parse`` and ``execute`` targets
+    are supported.
+    """
+    kept: list[list] = [[None] * len(lines) for _ in range(3)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        _keep_outputs(target, lines, kept)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"
+    )
+    return AllocationResult(
+        workload=workload,
+        target=target,
+        commands=len(lines),
+        bytes_per_command=sum(s.size_diff for s in stats) / len(lines),
+        blocks_per_command=sum(s.count_diff for s in stats) / len(lines),
+    )
+
+
+def run_benchmark(workload: str, target: str, lines: list[str]) -> BenchResult:
+    """Measure one target on one workload.
+
+    Throughput and relative speed come from ``measure_throughput`` on
+    uninstrumented runs; latency percentiles and peak memory come from
+    separate passes.
+    """
+    ops_per_sec, relative_speed = measure_throughput(target, lines)
+    latencies = sorted(_latencies(target, lines))
+    return BenchResult(
+        workload=workload,
+        target=target,
+        commands=len(lines),
+        ops_per_sec=ops_per_sec,
+        relative_speed=relative_speed,
+        p50_ns=latencies[len(latencies) // 2],
+        p99_ns=latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+        peak_memory_bytes=_peak_memory(target, lines),
+    )
+
+
+def run_suite(
+    count: int = DEFAULT_COUNT,
+    seed: int = DEFAULT_SEED,
+    workloads: Optional[list[str]] = None,
+    targets: Optional[list[str]] = None,
+) -> list[BenchResult]:
+    """Run every selected target on every selected workload."""
+    results = []
+    for workload in workloads or list(WORKLOADS):
+        lines = generate_workload(workload, count, seed)
+        for target in targets or list(TARGETS):
+            results.append(run_benchmark(workload, target, lines))
+    return results
+
+
+def compare_to_baseline(
+    results: list[BenchResult], baseline: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> list[str]:
+    """Return a message for each result slower than the baseline allows.
+
+    Results are compared by relative speed, so the baseline does not need
+    to come from the same machine. The tolerance absorbs the remaining
+    run-to-run noise and the different ways workloads and the reference
+    loop respond to a change of CPU or interpreter version.
+
+    Args:
+        results (list[BenchResult]): Current results
+        baseline (dict): Output of a previous run, as written by ``--json``
+        tolerance (float): Allowed fractional drop in relative speed
+
+    Raises:
+        ValueError: If the baseline has no relative speeds
+    """
+    try:
+        expected = {
+            (r["workload"], r["target"]): r["relative_speed"]
+            for r in baseline["results"]
+        }
+    except KeyError:
+        raise ValueError("baseline has no relative speeds; re-record it with --json")
+    regressions = []
+    for result in results:
+        reference = expected.get((result.workload, result.target))
+        if reference is None:
+            continue
+        if result.relative_speed < reference * (1 - tolerance):
+            regressions.append(
+                f"{result.workload}/{result.target}: relative speed "
+                f"{result.relative_speed:.3f} is below baseline {reference:.3f} "
+                f"(tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+def _format_allocations(results: list[AllocationResult]) -> str:
+    rows = [f"{'workload':<18}{'target':<9}{'B/cmd':>10}{'blocks/cmd':>12}"]
+    for r in results:
+        rows.append(
+            f"{r.workload:<18}{r.target:<9}{r.bytes_per_command:>10.1f}"
+            f"{r.blocks_per_command:>12.2f}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def _format_table(results: list[BenchResult]) -> str:
+    rows = [
+        f"{'workload':<18}{'target':<9}{'ops/sec':>12}{'relative':>10}"
+        f"{'p50 ns':>9}{'p99 ns':>9}{'peak KiB':>10}"
+    ]
+    for r in results:
+        rows.append(
+            f"{r.workload:<18}{r.target:<9}{r.ops_per_sec:>12.0f}"
+            f"{r.relative_speed:>10.3f}{r.p50_ns:>9}"
+            f"{r.p99_ns:>9}{r.peak_memory_bytes / 1024:>10.1f}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover.bench``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover.bench", description="Mars Rover throughput benchmarks"
+    )
+    arg_parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    arg_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    arg_parser.add_argument(
+        "--workload", action="append", choices=list(WORKLOADS), dest="workloads"
+    )
+    arg_parser.add_argument(
+        "--target", action="append", choices=list(TARGETS), dest="targets"
+    )
+    arg_parser.add_argument("--json", help="write results as JSON to this path")
+    arg_parser.add_argument("--baseline", help="fail if slower than this JSON file")
+    arg_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    arg_parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="report new memory per parsed and executed command instead",
+    )
+    args = arg_parser.parse_args(argv)
+
+    if args.allocations:
+        allocations = []
+        for workload in args.workloads or list(WORKLOADS):
+            lines = generate_workload(workload, args.count, args.seed)
+            for target in ("parse", "execute"):
+                allocations.append(measure_allocations(workload, target, lines))
+        sys.stdout.write(_format_allocations(allocations))
+        return
+
+    results = run_suite(args.count, args.seed, args.workloads, args.targets)
+    sys.stdout.write(_format_table(results))
+
+    if args.json:
+        report = {
+            "count": args.count,
+            "seed": args.seed,
+            "python": sys.version.split()[0],
+            "results": [asdict(r) for r in results],
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        recorded = baseline.get("python", "")
+        if recorded.split(".")[:2] != sys.version.split()[0].split(".")[:2]:
+            sys.stderr.write(
+                f"note: baseline was recorded on Python {recorded or 'unknown'}; "
+                "relative speeds can shift between interpreter versions\n"
+            )
+        try:
+            regressions = compare_to_baseline(results, baseline, args.tolerance)
+        except ValueError as e:
+            arg_parser.error(str(e))
+        if regressions:
+            sys.stderr.write("\n".join(regressions) + "\n")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""Compact binary mission format, converters and a direct executor.
+
+A binary mission starts with ``MAGIC`` followed by records. Each record
+starts with one byte holding a 3-bit opcode (high bits) and a 5-bit operand:
+
+- ``RUN_*`` (MOVE, LEFT, RIGHT, REPORT): the command repeated
+  ``operand + 1`` times; operand 31 means the count follows as a varint.
+- ``PAIR``: two commands from MOVE/LEFT/RIGHT/REPORT, two bits each in
+  operand bits 4-3 and 2-1.
+- ``PLACE``: operand holds the direction code (N=0, E=1, S=2, W=3); zigzag
+  varints for x and y follow.
+- ``RAW``: a varint length and the UTF-8 text of a line that did not parse
+  or has no record of its own (such as ``ROVER``), kept verbatim and
+  replayed through the text parser.
+- ``EXIT``: no operand.
+
+Usage::
+
+    python -m mars_rover.binary encode mission.txt mission.mrb
+    python -m mars_rover.binary decode mission.mrb mission.txt
+    python -m mars_rover.binary run mission.mrb
+"""
+
+import argparse
+import sys
+from itertools import repeat
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+from mars_rover.batch import (
+    EXIT_COMMAND,
+    BatchSummary,
+    OutputBuffer,
+    execute_commands,
+    read_lines,
+)
+from mars_rover.commands import (
+    LEFT,
+    MOVE,
+    REPORT,
+    RIGHT,
+    Command,
+    FailedCommand,
+    LeftCommand,
+    MoveCommand,
+    PlaceCommand,
+    ReportCommand,
+    RightCommand,
+)
+from mars_rover.compiler import MoveRunCommand, RotateCommand
+from mars_rover.exceptions import InvalidCommandException, RoverException
+from mars_rover.models import Direction, Placement, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+MAGIC = b"MRB1"
+
+OP_MOVE = 0
+OP_LEFT = 1
+OP_RIGHT = 2
+OP_REPORT = 3
+OP_PLACE = 4
+OP_RAW = 5
+OP_EXIT = 6
+OP_PAIR = 7
+
+_EXTENDED_RUN = 31
+_FLUSH_SIZE = 1 << 16
+_DIRECTIONS = tuple(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+_BARE_OPS = {
+    MoveCommand: OP_MOVE,
+    LeftCommand: OP_LEFT,
+    RightCommand: OP_RIGHT,
+    ReportCommand: OP_REPORT,
+}
+_OP_NAMES = ("MOVE", "LEFT", "RIGHT", "REPORT")
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative int as an unsigned LEB128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class BinaryEncoder:
+    """Streams commands into the binary format.
+
+    Runs of three or more identical basic commands become ``RUN`` records;
+    shorter runs are packed two commands per byte in ``PAIR`` records.
+    """
+
+    def __init__(self, out: BinaryIO):
+        self.out = out
+        self._buffer = bytearray(MAGIC)
+        self._op: Optional[int] = None
+        self._run = 0
+        self._singles: list[int] = []
+
+    def add_basic(self, op: int) -> None:
+        """Add a MOVE, LEFT, RIGHT or REPORT opcode."""
+        if op == self._op:
+            self._run += 1
+            return
+        self._end_run()
+        self._op = op
+        self._run = 1
+
+    def add_place(self, x: int, y: int, direction: Direction) -> None:
+        """Add a PLACE record."""
+        self._flush_basic()
+        self._buffer.append(OP_PLACE << 5 | _DIRECTION_CODES[direction])
+        self._buffer += _varint(_zigzag(x))
+        self._buffer += _varint(_zigzag(y))
+        self._maybe_flush()
+
+    def add_raw(self, text: str) -> None:
+        """Add a line that is replayed through the text parser."""
+        self._flush_basic()
+        data = text.encode("utf-8")
+        self._buffer.append(OP_RAW << 5)
+        self._buffer += _varint(len(data))
+        self._buffer += data
+        self._maybe_flush()
+
+    def add_exit(self) -> None:
+        """Add an EXIT record."""
+        self._flush_basic()
+        self._buffer.append(OP_EXIT << 5)
+
+    def add_command(self, command: Command) -> None:
+        """Add a parsed basic or PLACE command."""
+        op = _BARE_OPS.get(type(command))
+        if op is not None:
+            self.add_basic(op)
+            return
+        if type(command) is PlaceCommand:
+            args = command.args
+            self.add_place(args.x, args.y, args.direction)
+            return
+        raise TypeError(f"Cannot encode command: {type(command).__name__}")
+
+    def finish(self) -> None:
+        """Write all pending records."""
+        self._flush_basic()
+        self.out.write(self._buffer)
+        self._buffer.clear()
+
+    def _end_run(self) -> None:
+        if self._op is None:
+            return
+        if self._run >= 3:
+            self._flush_singles()
+            self._emit_run(self._op, self._run)
+        else:
+            self._singles.extend([self._op] * self._run)
+        self._op = None
+        self._run = 0
+
+    def _flush_basic(self) -> None:
+        self._end_run()
+        self._flush_singles()
+
+    def _flush_singles(self) -> None:
+        singles = self._singles
+        for i in range(0, len(singles) - 1, 2):
+            self._buffer.append(OP_PAIR << 5 | singles[i] << 3 | singles[i + 1] << 1)
+        if len(singles) % 2:
+            self._emit_run(singles[-1], 1)
+        singles.clear()
+        self._maybe_flush()
+
+    def _emit_run(self, op: int, count: int) -> None:
+        if count <= _EXTENDED_RUN:
+            self._buffer.append(op << 5 | (count - 1))
+        else:
+            self._buffer.append(op << 5 | _EXTENDED_RUN)
+            self._buffer += _varint(count)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._buffer) >= _FLUSH_SIZE:
+            self.out.write(self._buffer)
+            self._buffer.clear()
+
+
+def encode_lines(parser: CommandParser, lines: Iterable[str], out: BinaryIO) -> None:
+    """Convert text command lines to the binary format.
+
+    Args:
+        parser (CommandParser): Command parser instance
+        lines (Iterable[str]): Raw input lines
+        out (BinaryIO): Binary output stream
+    """
+    encoder = BinaryEncoder(out)
+    for line in lines:
+        user_input = line.strip()
+        if not user_input:
+            continue
+        if user_input.upper() == EXIT_COMMAND:
+            encoder.add_exit()
+            continue
+        try:
+            command = parser.parse(user_input)
+        except RoverException:
+            encoder.add_raw(user_input)
+            continue
+        if type(command) in _BARE_OPS or type(command) is PlaceCommand:
+            encoder.add_command(command)
+        else:
+            encoder.add_raw(user_input)
+    encoder.finish()
+
+
+def iter_records(data: bytes) -> Iterator[tuple[int, object]]:
+    """Decode binary mission data into (opcode, value) records.
+
+    Values are the run count for ``RUN_*`` opcodes, a ``Placement`` for
+    PLACE, the line text for RAW and None for EXIT. PAIR records are
+    yielded as two runs of one.
+
+    Raises:
+        ValueError: If the data is not a binary mission or is truncated
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a binary mission: bad magic number")
+    pos = len(MAGIC)
+    size = len(data)
+
+    def varint() -> int:
+        nonlocal pos
+        value = shift = 0
+        while True:
+            if pos >= size:
+                raise ValueError("Binary mission is truncated")
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    while pos < size:
+        byte = data[pos]
+        pos += 1
+        op, operand = byte >> 5, byte & 0x1F
+        if op <= OP_REPORT:
+            yield op, varint() if operand == _EXTENDED_RUN else operand + 1
+        elif op == OP_PAIR:
+            yield operand >> 3, 1
+            yield (operand >> 1) & 0x3, 1
+        elif op == OP_PLACE:
+            x = _unzigzag(varint())
+            y = _unzigzag(varint())
+            yield op, Placement(x, y, _DIRECTIONS[operand & 0x3])
+        elif op == OP_RAW:
+            length = varint()
+            if pos + length > size:
+                raise ValueError("Binary mission is truncated")
+            yield op, bytes(data[pos : pos + length]).decode("utf-8")  # noqa: E203
+            pos += length
+        else:
+            yield OP_EXIT, None
+
+
+def iter_text(data: bytes) -> Iterator[str]:
+    """Decode binary mission data into canonical text lines."""
+    for op, value in iter_records(data):
+        if op <= OP_REPORT:
+            yield from repeat(_OP_NAMES[op] + "\n", value)
+        elif op == OP_PLACE:
+            yield f"PLACE {value.x},{value.y},{value.direction.value}\n"
+        elif op == OP_RAW:
+            yield value + "\n"
+        else:
+            yield EXIT_COMMAND + "\n"
+
+
+def iter_commands(parser: CommandParser, data: bytes) -> Iterator[Command]:
+    """Decode binary mission data straight into commands, stopping at EXIT.
+
+    MOVE and rotation runs become compiled run commands; only RAW lines
+    go through the text parser.
+    """
+    singles = {OP_MOVE: MOVE, OP_LEFT: LEFT, OP_RIGHT: RIGHT, OP_REPORT: REPORT}
+    for op, value in iter_records(data):
+        if op <= OP_REPORT and value == 1:
+            yield singles[op]
+        elif op == OP_MOVE:
+            yield MoveRunCommand(value)
+        elif op == OP_LEFT:
+            yield RotateCommand(-value % 4, value)
+        elif op == OP_RIGHT:
+            yield RotateCommand(value % 4, value)
+        elif op == OP_REPORT:
+            yield from repeat(singles[OP_REPORT], value)
+        elif op == OP_PLACE:
+            yield PlaceCommand(value)
+        elif op == OP_RAW:
+            try:
+                yield parser.parse(value)
+            except InvalidCommandException as e:
+                yield FailedCommand(e)
+        else:
+            return
+
+
+def execute_binary(
+    parser: CommandParser, data: bytes, rover: Rover, write: Callable[[str], None]
+) -> BatchSummary:
+    """Execute a binary mission against a rover, writing reports and errors.
+
+    Produces the same output as running the original text in batch mode.
+    """
+    return execute_commands(iter_commands(parser, data), rover, write)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover.binary``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover.binary", description="Binary mission format tools"
+    )
+    sub = arg_parser.add_subparsers(dest="action", required=True)
+    encode = sub.add_parser("encode", help="convert a text mission to binary")
+    encode.add_argument("source")
+    encode.add_argument("target")
+    decode = sub.add_parser("decode", help="convert a binary mission to text")
+    decode.add_argument("source")
+    decode.add_argument("target")
+    run = sub.add_parser("run", help="execute a binary mission")
+    run.add_argument("source")
+    args = arg_parser.parse_args(argv)
+
+    parser = CommandParser()
+    if args.action == "encode":
+        with (
+            open(args.source, encoding="utf-8") as src,
+            open(args.target, "wb") as dst,
+        ):
+            encode_lines(parser, read_lines(src), dst)
+        return
+
+    with open(args.source, "rb") as src:
+        data = src.read()
+    if args.action == "decode":
+        with open(args.target, "w", encoding="utf-8") as dst:
+            dst.writelines(iter_text(data))
+        return
+
+    out = OutputBuffer(sys.stdout)
+    try:
+        summary = execute_binary(parser, data, Rover(TableBounds()), out.write)
+    finally:
+        out.flush()
+    if summary.failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 """Command pattern implementation for rover operations."""
 
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from mars_rover.models import PlaceArgs
+from mars_rover.exceptions import InvalidCommandException, RoverException
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import Placement
 from mars_rover.rover import Rover
 from mars_rover.result import CommandResult
 
+if TYPE_CHECKING:
+    from mars_rover.validation import PlaceArgs
+
 
 class Command(Protocol):
     """Protocol for a rover command execution."""
@@ -16,7 +21,7 @@ class Command(Protocol):
 class PlaceCommand:
     """Command to place rover at a position."""
 
-    def __init__(self, args: PlaceArgs):
+    def __init__(self, args: "PlaceArgs | Placement"):
         self.args = args
 
     def execute(self, rover: Rover) -> CommandResult:
@@ -54,3 +59,49 @@ class ReportCommand:
     def execute(self, rover: Rover) -> str:
         """Execute REPORT command."""
         return rover.report()
+
+
+# Shared instances of the stateless commands; parsers return these instead
+# of creating a command per line.
+MOVE = MoveCommand()
+LEFT = LeftCommand()
+RIGHT = RightCommand()
+REPORT = ReportCommand()
+
+
+class FailedCommand:
+    """Stand-in for input that could not be parsed.
+
+    Lets a stream of parsed commands carry parse errors in input order; the
+    original error is raised when the command is executed.
+    """
+
+    def __init__(self, error: RoverException):
+        self.error = error
+
+    def execute(self, rover: Rover) -> CommandResult:
+        """Raise the original parse error."""
+        raise self.error
+
+
+class RoverCommand:
+    """Command addressed to one rover of a multi-rover table.
+
+    Executed against any rover of a ``World``; the command runs on the rover
+    with ``rover_id``.
+    """
+
+    def __init__(self, rover_id: int, command: Command):
+        self.rover_id = rover_id
+        self.command = command
+
+    def execute(self, rover: Rover) -> CommandResult | str:
+        """Execute the wrapped command on the addressed rover.
+
+        Raises:
+            InvalidCommandException: If the rover is not part of a world
+        """
+        slot = getattr(rover, "occupancy", None)
+        if slot is None:
+            raise InvalidCommandException(ErrorMessages.ROVER_REQUIRES_WORLD)
+        return self.command.execute(slot.world.rover(self.rover_id))
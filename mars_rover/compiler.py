@@ -0,0 +1,107 @@
+"""Compilation of command streams into fewer, coarser commands."""
+
+from typing import Iterable, Iterator
+
+from mars_rover.commands import Command, LeftCommand, MoveCommand, RightCommand
+from mars_rover.exceptions import RoverNotPlacedException
+from mars_rover.result import CommandResult
+from mars_rover.rover import Rover
+
+
+class RotateCommand:
+    """Net rotation standing in for a run of LEFT and RIGHT commands."""
+
+    def __init__(self, quarter_turns: int, count: int):
+        self.quarter_turns = quarter_turns
+        self.count = count
+
+    def execute(self, rover: Rover) -> CommandResult:
+        """Execute the net rotation.
+
+        Returns:
+            CommandResult; if the rover is not placed, an error counting
+            every folded command
+        """
+        try:
+            return rover.rotate(self.quarter_turns)
+        except RoverNotPlacedException as e:
+            return CommandResult.error(str(e), self.count)
+
+
+class MoveRunCommand:
+    """A run of consecutive MOVE commands executed in closed form."""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def execute(self, rover: Rover) -> CommandResult:
+        """Execute the run of moves.
+
+        Returns:
+            CommandResult; on error, its count is the number of rejected moves
+        """
+        try:
+            return rover.move_many(self.count)
+        except RoverNotPlacedException as e:
+            return CommandResult.error(str(e), self.count)
+
+
+_TURNS = {LeftCommand: -1, RightCommand: 1}
+
+
+def compile_commands(commands: Iterable[Command]) -> Iterator[Command]:
+    """Fold runs of rotations and moves into single commands.
+
+    Consecutive LEFT/RIGHT commands become one ``RotateCommand`` and
+    consecutive MOVE commands become one ``MoveRunCommand``. Every other
+    command ends the current run and is passed through unchanged, as are
+    runs of length one. Executing the compiled stream produces the same
+    rover state and the same errors as the original.
+
+    Args:
+        commands (Iterable[Command]): Parsed commands
+
+    Yields:
+        Compiled commands
+    """
+    moves = 0
+    turns = 0
+    rotations = 0
+    last_rotation = None
+
+    for command in commands:
+        command_type = type(command)
+        if command_type is MoveCommand:
+            if rotations:
+                yield _rotation(turns, rotations, last_rotation)
+                turns = rotations = 0
+            moves += 1
+            last_move = command
+        elif command_type in _TURNS:
+            if moves:
+                yield _move_run(moves, last_move)
+                moves = 0
+            turns += _TURNS[command_type]
+            rotations += 1
+            last_rotation = command
+        else:
+            if moves:
+                yield _move_run(moves, last_move)
+                moves = 0
+            if rotations:
+                yield _rotation(turns, rotations, last_rotation)
+                turns = rotations = 0
+            yield command
+
+    if moves:
+        yield _move_run(moves, last_move)
+    if rotations:
+        yield _rotation(turns, rotations, last_rotation)
+
+
+def _move_run(moves: int, command: Command) -> Command:
+    return command if moves == 1 else MoveRunCommand(moves)
+
+
+def _rotation(turns: int, rotations: int, command: Command) -> Command:
+    return command if rotations == 1 else RotateCommand(turns % 4, rotations)
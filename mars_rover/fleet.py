@@ -0,0 +1,197 @@
+"""Vectorized simulation of many rovers at once.
+
+Requires NumPy (``pip install -e ".[numpy]"``).
+"""
+
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import numpy as np
+
+from mars_rover.commands import (
+    Command,
+    LeftCommand,
+    MoveCommand,
+    PlaceCommand,
+    ReportCommand,
+    RightCommand,
+)
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.rover import Rover
+
+if TYPE_CHECKING:
+    from mars_rover.heatmap import VisitHeatmap
+
+# Direction codes follow the clockwise order of the enum: N=0, E=1, S=2, W=3.
+DIRECTIONS = tuple(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+_DX = np.array([0, 1, 0, -1], dtype=np.int64)
+_DY = np.array([1, 0, -1, 0], dtype=np.int64)
+
+
+def direction_codes(directions: Direction | Sequence[Direction]) -> np.ndarray:
+    """Convert one or more directions to integer direction codes."""
+    if isinstance(directions, Direction):
+        return np.array(_DIRECTION_CODES[directions], dtype=np.int8)
+    return np.array([_DIRECTION_CODES[d] for d in directions], dtype=np.int8)
+
+
+class FleetEngine:
+    """A fleet of rovers stored as NumPy arrays.
+
+    Each command is applied to every rover selected by ``mask`` (all rovers
+    when omitted) in a single vectorized step. Rovers behave exactly like
+    ``Rover``: moves off the table are rejected and rovers that have not
+    been placed ignore MOVE, LEFT, RIGHT and REPORT.
+
+    Commands return a boolean array marking rovers for which the command
+    failed, i.e. where ``Rover`` would return an error result or raise
+    ``RoverNotPlacedException``. Rovers outside the mask never fail.
+
+    A ``recorder`` with ``record_cells(xs, ys)``, such as ``VisitHeatmap``,
+    receives the cells entered by each PLACE and MOVE step.
+    """
+
+    def __init__(
+        self,
+        bounds: TableBounds,
+        size: int,
+        recorder: Optional["VisitHeatmap"] = None,
+    ):
+        self.bounds = bounds
+        self.size = size
+        self.recorder = recorder
+        self.x = np.zeros(size, dtype=np.int64)
+        self.y = np.zeros(size, dtype=np.int64)
+        self.direction = np.zeros(size, dtype=np.int8)
+        self.placed = np.zeros(size, dtype=bool)
+
+    def _select(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        if mask is None:
+            return np.ones(self.size, dtype=bool)
+        return np.asarray(mask, dtype=bool)
+
+    def _inside(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        b = self.bounds
+        return (b.min_x <= x) & (x <= b.max_x) & (b.min_y <= y) & (y <= b.max_y)
+
+    def place(
+        self,
+        x: int | np.ndarray,
+        y: int | np.ndarray,
+        direction: Direction | Sequence[Direction] | np.ndarray,
+        mask: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Place selected rovers; scalars are broadcast across the fleet.
+
+        Args:
+            x (int | np.ndarray): X coordinate(s)
+            y (int | np.ndarray): Y coordinate(s)
+            direction: Direction, sequence of directions or direction codes
+            mask (Optional[np.ndarray]): Rovers to place
+
+        Returns:
+            Boolean array marking rovers whose placement was rejected
+        """
+        selected = self._select(mask)
+        if not isinstance(direction, np.ndarray):
+            direction = direction_codes(direction)
+        x = np.broadcast_to(np.asarray(x, dtype=np.int64), self.size)
+        y = np.broadcast_to(np.asarray(y, dtype=np.int64), self.size)
+        direction = np.broadcast_to(direction.astype(np.int8), self.size)
+
+        ok = selected & self._inside(x, y)
+        self.x[ok] = x[ok]
+        self.y[ok] = y[ok]
+        self.direction[ok] = direction[ok]
+        self.placed |= ok
+        if self.recorder is not None:
+            self.recorder.record_cells(self.x[ok], self.y[ok])
+        return selected & ~ok
+
+    def move(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Move selected rovers one unit forward.
+
+        Returns:
+            Boolean array marking rovers whose move failed
+        """
+        active = self._select(mask) & self.placed
+        new_x = self.x + _DX[self.direction]
+        new_y = self.y + _DY[self.direction]
+        ok = active & self._inside(new_x, new_y)
+        self.x[ok] = new_x[ok]
+        self.y[ok] = new_y[ok]
+        if self.recorder is not None:
+            self.recorder.record_cells(self.x[ok], self.y[ok])
+        return self._select(mask) & ~ok
+
+    def left(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rotate selected rovers 90° counter-clockwise.
+
+        Returns:
+            Boolean array marking unplaced rovers
+        """
+        selected = self._select(mask)
+        active = selected & self.placed
+        self.direction[active] = (self.direction[active] + 3) % 4
+        return selected & ~self.placed
+
+    def right(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rotate selected rovers 90° clockwise.
+
+        Returns:
+            Boolean array marking unplaced rovers
+        """
+        selected = self._select(mask)
+        active = selected & self.placed
+        self.direction[active] = (self.direction[active] + 1) % 4
+        return selected & ~self.placed
+
+    def report(self) -> list[Optional[str]]:
+        """Report every rover in ``Rover.report`` format, None if unplaced."""
+        return [
+            f"{x},{y},{DIRECTIONS[d].value}" if placed else None
+            for x, y, d, placed in zip(
+                self.x.tolist(),
+                self.y.tolist(),
+                self.direction.tolist(),
+                self.placed.tolist(),
+            )
+        ]
+
+    def execute(
+        self, command: Command, mask: Optional[np.ndarray] = None
+    ) -> np.ndarray | list[Optional[str]]:
+        """Apply a parsed command to the selected rovers.
+
+        Args:
+            command (Command): Command produced by ``CommandParser``
+            mask (Optional[np.ndarray]): Rovers to command
+
+        Returns:
+            Failure mask, or the report list for REPORT
+
+        Raises:
+            TypeError: If the command is not supported by the fleet engine
+        """
+        if isinstance(command, MoveCommand):
+            return self.move(mask)
+        if isinstance(command, LeftCommand):
+            return self.left(mask)
+        if isinstance(command, RightCommand):
+            return self.right(mask)
+        if isinstance(command, PlaceCommand):
+            args = command.args
+            return self.place(args.x, args.y, args.direction, mask)
+        if isinstance(command, ReportCommand):
+            return self.report()
+        raise TypeError(f"Unsupported fleet command: {type(command).__name__}")
+
+    def to_rover(self, index: int) -> Rover:
+        """Return a ``Rover`` holding the state of one fleet member."""
+        if not self.placed[index]:
+            return Rover(bounds=self.bounds)
+        return Rover(
+            bounds=self.bounds,
+            position=Position(int(self.x[index]), int(self.y[index])),
+            direction=DIRECTIONS[int(self.direction[index])],
+        )
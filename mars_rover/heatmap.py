@@ -0,0 +1,190 @@
+"""Per-cell visit counts and coverage, kept in sparse tiles and saved as NumPy arrays.
+
+Requires NumPy (``pip install -e ".[numpy]"``).
+"""
+
+import os
+from typing import Optional
+
+import numpy as np
+
+from mars_rover.models import Direction, TableBounds
+from mars_rover.recorder import Opcode
+from mars_rover.status import Status
+from mars_rover.tiles import TiledGrid
+
+VISITS_FILE = "visits.npy"
+FIRST_VISIT_FILE = "first_visit.npy"
+UNVISITED = -1
+# Largest table whose arrays are saved; each array takes 8 bytes per cell.
+MAX_SAVED_CELLS = 1 << 28
+# Tiles of 16 x 16 cells keep long straight runs from allocating much unused.
+TILE_SHIFT = 4
+
+_DX = {Direction.NORTH: 0, Direction.EAST: 1, Direction.SOUTH: 0, Direction.WEST: -1}
+_DY = {Direction.NORTH: 1, Direction.EAST: 0, Direction.SOUTH: -1, Direction.WEST: 0}
+
+
+class VisitHeatmap:
+    """Recorder counting how often each cell is entered.
+
+    A successful PLACE visits its cell and each successful MOVE visits the
+    cell it enters. Time counts PLACE and MOVE commands, rejected or not,
+    so the first visit of a cell is the 1-based index among them of the
+    command that first reached it.
+
+    Counts and first visits live in ``TiledGrid`` tiles, so memory follows
+    the cells visited rather than the table area, and any table works,
+    open ones included. ``visits`` and ``first_visit`` build dense arrays
+    indexed ``[y - min_y, x - min_x]``, with ``UNVISITED`` for cells never
+    reached; they and ``save`` need a finite table.
+    """
+
+    def __init__(self, bounds: TableBounds, directory: Optional[str] = None):
+        self.bounds = bounds
+        self.directory = directory
+        self.visit_counts = TiledGrid(tile_shift=TILE_SHIFT)
+        # Time of each cell's first visit; 0 until it is visited.
+        self.first_visits = TiledGrid(tile_shift=TILE_SHIFT)
+        self.time = 0
+
+    @classmethod
+    def open(cls, bounds: TableBounds, directory: str) -> "VisitHeatmap":
+        """Create a heatmap that ``flush`` writes to ``.npy`` files in a directory.
+
+        Args:
+            bounds (TableBounds): Table bounds
+            directory (str): Directory for ``visits.npy`` and ``first_visit.npy``
+        """
+        heatmap = cls(bounds, directory)
+        heatmap.flush()
+        return heatmap
+
+    def _visit(self, x: int, y: int) -> None:
+        if self.visit_counts.add(x, y) == 1:
+            self.first_visits.set(x, y, self.time)
+
+    def record(
+        self, x: int, y: int, direction: Direction, opcode: int, status: int
+    ) -> None:
+        """Count the cell entered by a successful PLACE or MOVE."""
+        if opcode != Opcode.MOVE and opcode != Opcode.PLACE:
+            return
+        self.time += 1
+        if status == Status.OK:
+            self._visit(x, y)
+
+    def record_moves(
+        self, x: int, y: int, direction: Direction, count: int, steps: int, status: int
+    ) -> None:
+        """Count the cells entered by a run of MOVEs, one slice per tile."""
+        start = self.time
+        self.time += count
+        dx, dy = _DX[direction], _DY[direction]
+        for tile, cells, _ in self.visit_counts.runs(x, y, dx, dy, steps):
+            np.frombuffer(tile, dtype=np.int64)[cells] += 1
+        for tile, cells, k in self.first_visits.runs(x, y, dx, dy, steps):
+            view = np.frombuffer(tile, dtype=np.int64)
+            first = view[cells]
+            times = np.arange(start + k, start + k + len(first))
+            view[cells] = np.where(first == 0, times, first)
+
+    def record_cells(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Count one step of a vectorized engine: each (x, y) was entered once.
+
+        The step counts as one unit of time.
+        """
+        self.time += 1
+        xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+        shift = self.visit_counts.tile_shift
+        mask = (1 << shift) - 1
+        tile_xs, tile_ys = xs >> shift, ys >> shift
+        offsets = (ys & mask) << shift | xs & mask
+        for tile_x, tile_y in set(zip(tile_xs.tolist(), tile_ys.tolist())):
+            cells = offsets[(tile_xs == tile_x) & (tile_ys == tile_y)]
+            x, y = tile_x << shift, tile_y << shift
+            visits = np.frombuffer(self.visit_counts.tile(x, y), dtype=np.int64)
+            np.add.at(visits, cells, 1)
+            first = np.frombuffer(self.first_visits.tile(x, y), dtype=np.int64)
+            first[cells] = np.where(first[cells] == 0, self.time, first[cells])
+
+    def coverage(self) -> float:
+        """Return the percentage of cells visited at least once.
+
+        Raises:
+            ValueError: If the table is not finite
+        """
+        if not self.bounds.is_finite:
+            raise ValueError(f"Coverage needs finite table bounds: {self.bounds}")
+        return 100.0 * self.visit_counts.count_nonzero() / self.bounds.cells
+
+    @property
+    def visits(self) -> np.ndarray:
+        """Visit counts as a dense array over the table."""
+        return self._fill(self.visit_counts, self._new_array())
+
+    @property
+    def first_visit(self) -> np.ndarray:
+        """First visit times as a dense array over the table."""
+        return self._fill(self.first_visits, self._new_array(UNVISITED))
+
+    def _new_array(self, fill: int = 0) -> np.ndarray:
+        if not self.bounds.is_finite:
+            raise ValueError(f"Heatmap arrays need finite table bounds: {self.bounds}")
+        b = self.bounds
+        return np.full((b.max_y - b.min_y + 1, b.max_x - b.min_x + 1), fill, np.int64)
+
+    def _fill(self, grid: TiledGrid, out: np.ndarray) -> np.ndarray:
+        """Copy the non-zero cells of a grid into an array over the table."""
+        b = self.bounds
+        size = 1 << grid.tile_shift
+        for (tile_x, tile_y), tile in grid.tiles.items():
+            left, bottom = tile_x * size, tile_y * size
+            x0, x1 = max(left, b.min_x), min(left + size - 1, b.max_x)
+            y0, y1 = max(bottom, b.min_y), min(bottom + size - 1, b.max_y)
+            if x0 > x1 or y0 > y1:
+                continue
+            view = np.frombuffer(tile, dtype=np.int64).reshape(size, size)
+            rows = slice(y0 - bottom, y1 - bottom + 1)
+            cols = slice(x0 - left, x1 - left + 1)
+            cells = view[rows, cols]
+            rows = slice(y0 - b.min_y, y1 - b.min_y + 1)
+            cols = slice(x0 - b.min_x, x1 - b.min_x + 1)
+            target = out[rows, cols]
+            np.copyto(target, cells, where=cells != 0)
+        return out
+
+    def save(self, directory: str) -> None:
+        """Write ``visits.npy`` and ``first_visit.npy`` to a directory.
+
+        The arrays are written through memory-mapped files, tile by tile.
+
+        Raises:
+            ValueError: If the table is not finite or has more than
+                MAX_SAVED_CELLS cells
+        """
+        if not self.bounds.is_finite:
+            raise ValueError(f"Heatmaps need finite table bounds: {self.bounds}")
+        if self.bounds.cells > MAX_SAVED_CELLS:
+            raise ValueError(
+                f"Table has {self.bounds.cells} cells, more than {MAX_SAVED_CELLS}"
+            )
+        os.makedirs(directory, exist_ok=True)
+        b = self.bounds
+        shape = (b.max_y - b.min_y + 1, b.max_x - b.min_x + 1)
+        for name, grid, fill in (
+            (VISITS_FILE, self.visit_counts, 0),
+            (FIRST_VISIT_FILE, self.first_visits, UNVISITED),
+        ):
+            array = np.lib.format.open_memmap(
+                os.path.join(directory, name), "w+", np.int64, shape
+            )
+            array[:] = fill
+            self._fill(grid, array)
+            array.flush()
+            del array
+
+    def flush(self) -> None:
+        """Write the arrays to the directory given to ``open``, if any."""
+        if self.directory is not None:
+            self.save(self.directory)
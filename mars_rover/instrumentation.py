@@ -0,0 +1,287 @@
+"""Opt-in instrumentation: command counters, error rates and latency histograms.
+
+Parsing is timed by wrapping a ``CommandParser`` in ``InstrumentedParser``,
+which still returns the parsed commands themselves. Execution is timed by
+``Stats.execute_stream`` after parsing and compiling, so commands keep their
+types and the fast paths that dispatch on them. Nothing is recorded, and
+nothing costs anything, unless these are used.
+"""
+
+import atexit
+import json
+import re
+import signal
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, TextIO
+
+from mars_rover.batch import BatchSummary, Result, execute_stream
+from mars_rover.commands import Command, FailedCommand
+from mars_rover.messages import ErrorMessages
+from mars_rover.parser import CommandParser
+from mars_rover.result import CommandResult, RepeatedOutput
+from mars_rover.rover import Rover
+
+if TYPE_CHECKING:
+    from mars_rover.parse_cache import CachingParser
+
+_PLACEHOLDER = re.compile(r"\{\w+\}")
+
+
+def _template_pattern(template: str) -> re.Pattern:
+    """Return a pattern matching exactly the messages built from a template."""
+    literals = _PLACEHOLDER.split(template)
+    return re.compile(".*".join(re.escape(literal) for literal in literals), re.S)
+
+
+# ErrorMessages names with a pattern for each template, most literal text
+# first so that templates nested in others' placeholders, such as
+# POSITION_BLOCKED in INVALID_PLACE_COMMAND, win.
+_ERROR_PATTERNS = [
+    (name, _template_pattern(value))
+    for name, value in sorted(
+        (item for item in vars(ErrorMessages).items() if item[0].isupper()),
+        key=lambda item: len(_PLACEHOLDER.sub("", item[1])),
+        reverse=True,
+    )
+]
+OTHER_ERROR = "OTHER"
+# Name under which input that failed to parse is counted.
+INVALID_COMMAND = "Invalid"
+ERROR_PREFIX = "Error: "
+# Distinct error messages counted before they are classified.
+MAX_ERROR_MESSAGES = 1024
+
+
+def classify_error(message: str) -> str:
+    """Return the ``ErrorMessages`` attribute name a message was built from."""
+    for name, pattern in _ERROR_PATTERNS:
+        if pattern.fullmatch(message):
+            return name
+    return OTHER_ERROR
+
+
+class LatencyHistogram:
+    """Latency histogram with power-of-two nanosecond buckets.
+
+    Bucket ``i`` counts samples in ``[2**(i-1), 2**i)`` ns, so recording a
+    sample is a single ``int.bit_length`` and list increment.
+    """
+
+    BUCKETS = 64
+
+    def __init__(self):
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, ns: int) -> None:
+        """Record one sample in nanoseconds."""
+        self.buckets[min(ns.bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += ns
+
+    def percentile(self, fraction: float) -> int:
+        """Return the upper bound in ns of the bucket holding a percentile."""
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return 1 << i
+        return 1 << (self.BUCKETS - 1)
+
+    def snapshot(self) -> dict:
+        """Return the histogram as a JSON-serializable dict."""
+        return {
+            "count": self.count,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "p50_ns": self.percentile(0.5),
+            "p99_ns": self.percentile(0.99),
+            "buckets": {1 << i: n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+class Stats:
+    """Counters and histograms collected while parsing and executing.
+
+    A ``CachingParser``, if given, has its counters included in snapshots.
+    """
+
+    def __init__(self, parse_cache: Optional["CachingParser"] = None):
+        self.parse_cache = parse_cache
+        self.parse = LatencyHistogram()
+        self.execute: dict[str, LatencyHistogram] = {}
+        self.commands: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.loop_seconds = 0.0
+        # Error counts by message text, classified into ``errors`` once too
+        # many distinct messages have piled up; snapshots classify a copy.
+        self._error_messages: dict[str, int] = {}
+
+    def record_error(self, message: str, count: int = 1) -> None:
+        """Count an error; it is classified by ``ErrorMessages`` type later."""
+        messages = self._error_messages
+        messages[message] = messages.get(message, 0) + count
+        if len(messages) > MAX_ERROR_MESSAGES:
+            self._classify_errors()
+
+    def _classify_errors(self) -> None:
+        """Move the pending error counts into ``errors`` by type."""
+        for message, count in self._error_messages.items():
+            self.errors[classify_error(message)] += count
+        self._error_messages.clear()
+
+    def record_result(self, result: Result) -> None:
+        """Count the errors a command result stands for."""
+        if isinstance(result, CommandResult):
+            if not result.success:
+                self.record_error(result.message, result.count)
+        elif isinstance(result, RepeatedOutput):
+            for lines, times in (
+                (result.prefix, 1),
+                (result.cycle, result.cycles),
+                (result.suffix, 1),
+            ):
+                for line in lines if times else ():
+                    if line.startswith(ERROR_PREFIX):
+                        message = line.removeprefix(ERROR_PREFIX).rstrip("\n")
+                        self.record_error(message, times)
+
+    def execute_stream(
+        self,
+        commands: Iterable[Command],
+        rover: Rover,
+        summary: Optional[BatchSummary] = None,
+    ) -> Iterator[Result]:
+        """Execute commands through ``batch.execute_stream``, timing each one.
+
+        Each command is timed from when the stream takes it to when its
+        last result comes out, leaving out the time spent consuming its
+        results. Commands are counted by type, as every source command they
+        stand for, and their errors by ``ErrorMessages`` type.
+
+        Args:
+            commands (Iterable[Command]): Parsed or compiled commands
+            rover (Rover): Rover instance
+            summary (Optional[BatchSummary]): Counters to update as commands run
+
+        Yields:
+            The same results as ``batch.execute_stream``
+        """
+        clock = time.perf_counter_ns
+        ok = CommandResult.ok()
+        counters: dict[type, tuple[str, LatencyHistogram]] = {}
+        # The command just taken and when execution last resumed.
+        current: list = [None, 0]
+        # Histogram and time so far of the command still producing results.
+        running: Optional[list] = None
+
+        def taken() -> Iterator[Command]:
+            for command in commands:
+                current[0] = command
+                current[1] = clock()
+                yield command
+
+        try:
+            for result in execute_stream(taken(), rover, summary):
+                elapsed = clock() - current[1]
+                command = current[0]
+                if command is None:
+                    running[1] += elapsed
+                else:
+                    current[0] = None
+                    if running is not None:
+                        running[0].record(running[1])
+                    command_type = type(command)
+                    counter = counters.get(command_type)
+                    if counter is None:
+                        counter = counters[command_type] = self._counter(command_type)
+                    name, histogram = counter
+                    self.commands[name] += getattr(command, "count", 1)
+                    running = [histogram, elapsed]
+                if result is not ok:
+                    self.record_result(result)
+                yield result
+                current[1] = clock()
+        finally:
+            if running is not None:
+                running[0].record(running[1])
+
+    def _counter(self, command_type: type) -> tuple[str, LatencyHistogram]:
+        """Return the name and latency histogram for a command type."""
+        if command_type is FailedCommand:
+            name = INVALID_COMMAND
+        else:
+            name = command_type.__name__
+        histogram = self.execute.get(name)
+        if histogram is None:
+            histogram = self.execute[name] = LatencyHistogram()
+        return name, histogram
+
+    @contextmanager
+    def time_loop(self) -> Iterator[None]:
+        """Add the wall time of the enclosed command loop to ``loop_seconds``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.loop_seconds += time.perf_counter() - start
+
+    def snapshot(self) -> dict:
+        """Return all statistics as a JSON-serializable dict."""
+        errors_by_type = self.errors.copy()
+        for message, count in list(self._error_messages.items()):
+            errors_by_type[classify_error(message)] += count
+        total = sum(self.commands.values())
+        errors = sum(errors_by_type.values())
+        snapshot = {
+            "commands": dict(self.commands),
+            "errors": dict(errors_by_type),
+            "error_rate": errors / total if total else 0.0,
+            "parse": self.parse.snapshot(),
+            "execute": {name: h.snapshot() for name, h in self.execute.items()},
+            "loop_seconds": self.loop_seconds,
+        }
+        if self.parse_cache is not None:
+            snapshot["parse_cache"] = self.parse_cache.snapshot()
+        return snapshot
+
+    def dump(self, stream: TextIO) -> None:
+        """Write the statistics to a stream as JSON."""
+        stream.write(json.dumps(self.snapshot(), indent=2) + "\n")
+        stream.flush()
+
+
+class InstrumentedParser:
+    """A ``CommandParser`` wrapper recording parse latency.
+
+    Parse errors are counted when the ``FailedCommand`` standing for them is
+    executed through ``Stats.execute_stream``.
+    """
+
+    def __init__(self, parser: CommandParser, stats: Optional[Stats] = None):
+        self.parser = parser
+        self.stats = stats or Stats()
+
+    def parse(self, user_input: str) -> Command:
+        """Parse user input with the wrapped parser.
+
+        Raises:
+            InvalidCommandException: If command is unknown or invalid
+        """
+        start = time.perf_counter_ns()
+        try:
+            return self.parser.parse(user_input)
+        finally:
+            self.stats.parse.record(time.perf_counter_ns() - start)
+
+
+def install_dump_handlers(stats: Stats, stream: TextIO) -> None:
+    """Dump statistics to a stream on exit and, where supported, on SIGUSR1."""
+    atexit.register(stats.dump, stream)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: stats.dump(stream))
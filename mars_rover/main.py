@@ -1,17 +1,50 @@
 """CLI interface for Mars Rover Simulator."""
 
+import argparse
+import importlib
+import math
 import sys
-from typing import TextIO
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Optional, TextIO
 
+import mars_rover
 from mars_rover.models import TableBounds
 from mars_rover.rover import Rover
 from mars_rover.parser import CommandParser
 from mars_rover.exceptions import RoverException
-from mars_rover.result import CommandResult
+from mars_rover.result import CommandResult, RepeatedOutput
+from mars_rover.batch import (
+    DEFAULT_FLUSH_SIZE,
+    BatchSummary,
+    OutputBuffer,
+    execute_commands,
+    format_results,
+    run_batch,
+)
+from mars_rover.commands import FailedCommand
+from mars_rover.compiler import compile_commands
+from mars_rover.recorder import Recorder
+from mars_rover.repeat import RepeatCommand
+
+if TYPE_CHECKING:
+    from mars_rover.instrumentation import Stats
+    from mars_rover.obstacles import Obstacles
+    from mars_rover.trajectory import TrajectoryLog
+
+_imports_done = time.perf_counter()
+
+
+# Subcommands dispatched to their own module's ``main(argv)``.
+SUBCOMMANDS = {"run": "mars_rover.runner", "serve": "mars_rover.server"}
 
 
 def run_cli_loop(
-    parser: CommandParser, rover: Rover, in_stream: TextIO, out_stream: TextIO
+    parser: CommandParser,
+    rover: Rover,
+    in_stream: TextIO,
+    out_stream: TextIO,
+    stats: Optional["Stats"] = None,
 ) -> None:
     """Run interactive command loop.
 
@@ -20,6 +53,7 @@ def run_cli_loop(
         rover (Rover): Rover instance
         in_stream (TextIO): Input stream (typically stdin)
         out_stream (TextIO): Output stream (typically stdout)
+        stats (Optional[Stats]): Time and count each command as it runs
     """
     out_stream.write("Mars Rover Simulator\n")
     out_stream.write("Commands: PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | EXIT\n\n")
@@ -42,12 +76,22 @@ def run_cli_loop(
                 out_stream.write("Goodbye!\n")
                 return
 
+            if stats is not None:
+                _run_instrumented(parser, rover, user_input, out_stream, stats)
+                continue
+
             command = parser.parse(user_input)
+            if type(command) is RepeatCommand:
+                for block in command.execute_blocks(rover):
+                    block.write_to(out_stream.write)
+                continue
             result = command.execute(rover)
 
             if isinstance(result, CommandResult):
                 if not result.success:
                     out_stream.write(f"Error: {result.message}\n")
+            elif isinstance(result, RepeatedOutput):
+                result.write_to(out_stream.write)
             elif isinstance(result, str):
                 out_stream.write(f"{result}\n")
 
@@ -58,9 +102,416 @@ def run_cli_loop(
             return
 
 
-def main() -> None:
+def _run_instrumented(
+    parser: CommandParser,
+    rover: Rover,
+    user_input: str,
+    out_stream: TextIO,
+    stats: "Stats",
+) -> None:
+    """Run one interactive line through ``Stats.execute_stream``."""
+    try:
+        command = parser.parse(user_input)
+    except RoverException as e:
+        command = FailedCommand(e)
+    for text in format_results(stats.execute_stream((command,), rover)):
+        out_stream.write(text)
+
+
+def report_startup(stream: TextIO) -> None:
+    """Write how long importing the CLI took and what it loaded."""
+    elapsed = _imports_done - mars_rover._import_started
+    third_party = sorted(
+        {name.partition(".")[0] for name in sys.modules}
+        - set(sys.stdlib_module_names)
+        - {"__main__", "mars_rover"}
+    )
+    stream.write(
+        f"Imported mars_rover in {elapsed * 1000:.1f} ms; "
+        f"{len(sys.modules)} modules loaded, "
+        f"third-party: {', '.join(third_party) or 'none'}\n"
+    )
+
+
+def _dump_first_error(log: "TrajectoryLog") -> None:
+    """Dump a trajectory log to stderr, then stop dumping on later errors."""
+    log.on_error = None
+    log.dump(sys.stderr)
+
+
+def _new_rover(
+    bounds: TableBounds,
+    obstacles: Optional["Obstacles"] = None,
+    multi_rover: bool = False,
+    recorder: Optional[Recorder] = None,
+) -> Rover:
+    """Create a standalone rover, or rover 0 of a new ``World``."""
+    if multi_rover:
+        from mars_rover.world import World
+
+        return World(bounds, obstacles, recorder).rover()
+    return Rover(bounds=bounds, obstacles=obstacles, recorder=recorder)
+
+
+# Errors reading one input file; the batch reports them and moves on.
+_UNREADABLE = (
+    UnicodeDecodeError,
+    FileNotFoundError,
+    IsADirectoryError,
+    PermissionError,
+)
+
+
+def run_batch_files(
+    parser: CommandParser,
+    bounds: TableBounds,
+    paths: list[str],
+    in_stream: TextIO,
+    out: OutputBuffer,
+    compiled: bool = False,
+    workers: Optional[int] = None,
+    mapped: bool = False,
+    obstacles: Optional["Obstacles"] = None,
+    multi_rover: bool = False,
+    recorder: Optional[Recorder] = None,
+    stats: Optional["Stats"] = None,
+) -> BatchSummary:
+    """Run each input in batch mode with a freshly created rover.
+
+    Args:
+        parser (CommandParser): Command parser instance
+        bounds (TableBounds): Table bounds for each rover
+        paths (list[str]): Input files; ``-`` or an empty list reads in_stream
+        in_stream (TextIO): Input stream used for ``-``
+        out (OutputBuffer): Buffered output
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+        workers (Optional[int]): Split each file across this many processes;
+            if parser is a ``CachingParser``, each worker gets one of its size
+        mapped (bool): Read files through a memory map at the bytes level
+        obstacles (Optional[Obstacles]): Blocked cells shared by every rover;
+            not supported with workers
+        multi_rover (bool): Give each input a ``World`` so ROVER commands
+            work; unprefixed commands drive rover 0. Not supported with workers
+        recorder (Optional[Recorder]): Receives every rover's PLACE, MOVE,
+            LEFT and RIGHT
+            commands; not supported with workers
+        stats (Optional[Stats]): Time and count each command as it runs;
+            not supported with workers
+
+    Returns:
+        BatchSummary aggregated over all inputs, listing files that could not
+        be read or decoded instead of stopping at them
+
+    Raises:
+        ValueError: If workers are combined with obstacles, worlds,
+            recorders or stats
+    """
+    if workers and (
+        obstacles is not None
+        or multi_rover
+        or recorder is not None
+        or stats is not None
+    ):
+        raise ValueError(
+            "Parallel batch runs support no obstacles, worlds, recorders or stats"
+        )
+    summary = BatchSummary()
+    for path in paths or ["-"]:
+        rover = _new_rover(bounds, obstacles, multi_rover, recorder)
+        try:
+            summary.add(
+                _run_batch_file(
+                    parser,
+                    rover,
+                    path,
+                    in_stream,
+                    out,
+                    compiled,
+                    workers,
+                    mapped,
+                    stats,
+                )
+            )
+        except _UNREADABLE as e:
+            summary.unreadable.append(f"{path}: {e}")
+    return summary
+
+
+def _run_batch_file(
+    parser: CommandParser,
+    rover: Rover,
+    path: str,
+    in_stream: TextIO,
+    out: OutputBuffer,
+    compiled: bool,
+    workers: Optional[int],
+    mapped: bool,
+    stats: Optional["Stats"],
+) -> BatchSummary:
+    """Run one input of ``run_batch_files``."""
+    if workers and path != "-":
+        from mars_rover.parallel import run_parallel
+        from mars_rover.parse_cache import CachingParser
+
+        # Workers parse with their own parsers; give them the same cache.
+        cache_size = parser.max_size if isinstance(parser, CachingParser) else None
+        return run_parallel(
+            path,
+            rover.bounds,
+            out,
+            workers,
+            compiled=compiled,
+            parse_cache=cache_size,
+        )
+    if mapped and path != "-":
+        from mars_rover.mapped import parse_mapped
+
+        commands = parse_mapped(parser, path)
+        if compiled:
+            commands = compile_commands(commands)
+        return execute_commands(commands, rover, out.write, stats)
+    if path == "-":
+        return run_batch(parser, rover, in_stream, out, compiled, stats)
+    with open(path, encoding="utf-8") as f:
+        return run_batch(parser, rover, f, out, compiled, stats)
+
+
+def parse_bounds(text: str) -> TableBounds:
+    """Parse ``MIN_X,MIN_Y,MAX_X,MAX_Y`` table bounds; ``*`` leaves an edge open.
+
+    Raises:
+        argparse.ArgumentTypeError: If the bounds are malformed or empty
+    """
+    parts = text.split(",")
+    if len(parts) != 4:
+        raise argparse.ArgumentTypeError(f"expected MIN_X,MIN_Y,MAX_X,MAX_Y: {text}")
+    edges = []
+    for part, open_edge in zip(parts, (-math.inf, -math.inf, math.inf, math.inf)):
+        part = part.strip()
+        try:
+            edges.append(open_edge if part == "*" else int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid table edge: {part}") from None
+    bounds = TableBounds(*edges)
+    if bounds.min_x > bounds.max_x or bounds.min_y > bounds.max_y:
+        raise argparse.ArgumentTypeError(f"table bounds are empty: {text}")
+    return bounds
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover", description="Mars Rover Simulator"
+    )
+    arg_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="run without prompts, buffering output; exit status 1 on any error",
+    )
+    arg_parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="command files to run in batch mode ('-' for stdin)",
+    )
+    arg_parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="fold runs of MOVE/LEFT/RIGHT before execution (batch mode)",
+    )
+    arg_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        metavar="N",
+        help="split each FILE across N processes (batch mode, requires numpy)",
+    )
+    arg_parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="memory-map FILEs and tokenize them as bytes (batch mode)",
+    )
+    arg_parser.add_argument(
+        "--bounds",
+        type=parse_bounds,
+        default=None,
+        metavar="MIN_X,MIN_Y,MAX_X,MAX_Y",
+        help="table bounds (default 0,0,5,5); '*' leaves an edge open",
+    )
+    arg_parser.add_argument(
+        "--obstacles",
+        metavar="FILE",
+        help="obstacle grid file; its bounds replace the default table",
+    )
+    arg_parser.add_argument(
+        "--multi-rover",
+        action="store_true",
+        help="share the table between rovers addressed as ROVER N COMMAND",
+    )
+    arg_parser.add_argument(
+        "--heatmap",
+        metavar="DIR",
+        help="save per-cell visit counts and first visits as .npy files "
+        "(requires numpy)",
+    )
+    arg_parser.add_argument(
+        "--trajectory",
+        type=int,
+        metavar="N",
+        help="keep the last N rover commands and dump them to stderr at the "
+        "first rejected one",
+    )
+    arg_parser.add_argument(
+        "--parse-cache",
+        type=int,
+        metavar="N",
+        help="reuse parsed commands for the last N distinct lines; counters "
+        "appear in --stats",
+    )
+    arg_parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="report import time and loaded modules to stderr",
+    )
+    arg_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="record command statistics; dumped to stderr on exit and SIGUSR1",
+    )
+    arg_parser.add_argument(
+        "--flush-size",
+        type=int,
+        default=DEFAULT_FLUSH_SIZE,
+        help="batch output buffer size in characters",
+    )
+    arg_parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=None,
+        help="flush batch output at least every N seconds",
+    )
+    return arg_parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Main entry point for the application."""
-    bounds = TableBounds()
-    rover = Rover(bounds=bounds)
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        importlib.import_module(SUBCOMMANDS[argv[0]]).main(argv[1:])
+        return
+
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.startup_profile:
+        report_startup(sys.stderr)
+    if args.files and not args.batch:
+        arg_parser.error("FILE arguments require --batch")
+    if args.parallel and (not args.files or "-" in args.files):
+        arg_parser.error("--parallel requires FILE arguments")
+    if args.parallel and (
+        args.obstacles
+        or args.multi_rover
+        or args.heatmap
+        or args.trajectory
+        or args.stats
+    ):
+        arg_parser.error(
+            "--parallel does not support --obstacles, --multi-rover, --heatmap, "
+            "--trajectory or --stats"
+        )
+    if args.heatmap and args.trajectory:
+        arg_parser.error("--heatmap and --trajectory cannot be combined")
+    if args.parse_cache is not None and args.parse_cache < 1:
+        arg_parser.error("--parse-cache must be at least 1")
+    if args.bounds and args.obstacles:
+        arg_parser.error("--obstacles takes its bounds from the grid file")
+    if args.bounds and not args.bounds.is_finite and (args.parallel or args.heatmap):
+        arg_parser.error("--parallel and --heatmap need finite --bounds")
+    if args.bounds and args.parallel:
+        from mars_rover.transitions import MAX_STATES
+
+        if args.bounds.cells * 4 > MAX_STATES:
+            arg_parser.error(
+                f"--parallel supports tables of at most {MAX_STATES // 4} cells"
+            )
+
+    bounds = args.bounds or TableBounds()
+    obstacles = None
+    if args.obstacles:
+        from mars_rover.obstacles import ObstacleGrid
+
+        obstacles = ObstacleGrid.load(args.obstacles)
+        bounds = obstacles.bounds
+    heatmap = None
+    if args.heatmap:
+        from mars_rover.heatmap import MAX_SAVED_CELLS, VisitHeatmap
+
+        if bounds.cells > MAX_SAVED_CELLS:
+            arg_parser.error(
+                f"--heatmap supports tables of at most {MAX_SAVED_CELLS} cells"
+            )
+        heatmap = VisitHeatmap(bounds)
+    recorder: Optional[Recorder] = heatmap
+    if args.trajectory:
+        from mars_rover.trajectory import TrajectoryLog
+
+        recorder = TrajectoryLog(args.trajectory, _dump_first_error)
     parser = CommandParser()
-    run_cli_loop(parser, rover, sys.stdin, sys.stdout)
+    parse_cache = None
+    if args.parse_cache:
+        from mars_rover.parse_cache import CachingParser
+
+        parser = parse_cache = CachingParser(parser, args.parse_cache)
+    stats = None
+    timing = nullcontext()
+    if args.stats:
+        from mars_rover.instrumentation import (
+            InstrumentedParser,
+            Stats,
+            install_dump_handlers,
+        )
+
+        stats = Stats(parse_cache)
+        parser = InstrumentedParser(parser, stats)
+        install_dump_handlers(stats, sys.stderr)
+        timing = stats.time_loop()
+
+    if not args.batch:
+        rover = _new_rover(bounds, obstacles, args.multi_rover, recorder)
+        try:
+            with timing:
+                run_cli_loop(parser, rover, sys.stdin, sys.stdout, stats)
+        finally:
+            if heatmap is not None:
+                heatmap.save(args.heatmap)
+        return
+
+    out = OutputBuffer(sys.stdout, args.flush_size, args.flush_interval)
+    try:
+        with timing:
+            summary = run_batch_files(
+                parser,
+                bounds,
+                args.files,
+                sys.stdin,
+                out,
+                args.compile,
+                args.parallel,
+                args.mmap,
+                obstacles,
+                args.multi_rover,
+                recorder,
+                stats,
+            )
+    finally:
+        out.flush()
+        if heatmap is not None:
+            heatmap.save(args.heatmap)
+    for message in summary.unreadable:
+        sys.stderr.write(f"Error: {message}\n")
+    if summary.failures:
+        sys.stderr.write(
+            f"{summary.failures} of {summary.commands} commands failed\n"
+        )
+    if summary.failures or summary.unreadable:
+        sys.exit(1)
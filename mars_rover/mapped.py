@@ -0,0 +1,97 @@
+"""Memory-mapped, bytes-level reading of large command logs."""
+
+import mmap
+from typing import Iterator
+
+from mars_rover.batch import EXIT_COMMAND
+from mars_rover.commands import LEFT, MOVE, REPORT, RIGHT, Command, FailedCommand
+from mars_rover.exceptions import RoverException
+from mars_rover.parser import CommandParser
+
+# ASCII characters removed by str.strip(); non-ASCII lines take the str path.
+_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+_EXIT = EXIT_COMMAND.encode()
+_BARE_COMMANDS = {b"MOVE": MOVE, b"LEFT": LEFT, b"RIGHT": RIGHT, b"REPORT": REPORT}
+# Consumed pages are released from the mapping every this many bytes.
+RELEASE_INTERVAL = 1 << 26
+
+
+def iter_mapped_lines(path: str) -> Iterator[bytes]:
+    """Yield the raw lines of a file through a read-only memory map.
+
+    Lines are split on ``\\n``. Pages that have been read are periodically
+    released so resident memory stays flat regardless of file size.
+
+    Args:
+        path (str): File to read
+
+    Yields:
+        Lines as bytes, without the trailing newline
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped.
+            return
+    with mm:
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mm)
+        pos = 0
+        released = 0
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                end = size
+            yield mm[pos:end]
+            pos = end + 1
+            if hasattr(mm, "madvise") and pos - released >= RELEASE_INTERVAL:
+                release_end = pos - pos % mmap.PAGESIZE
+                mm.madvise(mmap.MADV_DONTNEED, released, release_end - released)
+                released = release_end
+
+
+def parse_mapped(parser: CommandParser, path: str) -> Iterator[Command]:
+    """Parse a command log straight from its bytes, stopping at EXIT.
+
+    MOVE, LEFT, RIGHT, REPORT and EXIT are matched as bytes without
+    decoding; only other lines (PLACE and invalid input) are decoded and
+    handed to the parser. Produces the same commands as
+    ``batch.parse_lines`` for files with ``\\n`` or ``\\r\\n`` line endings.
+
+    Args:
+        parser (CommandParser): Command parser instance
+        path (str): Log file
+
+    Yields:
+        Command objects, with parse errors as ``FailedCommand``
+    """
+    for raw in iter_mapped_lines(path):
+        line = raw.strip(_WHITESPACE)
+        if not line:
+            continue
+        command = _BARE_COMMANDS.get(line)
+        if command is not None:
+            yield command
+            continue
+
+        if line.isascii():
+            upper = line.upper()
+            command = _BARE_COMMANDS.get(upper)
+            if command is not None:
+                yield command
+                continue
+            if upper == _EXIT:
+                return
+            user_input = line.decode("ascii")
+        else:
+            user_input = line.decode("utf-8").strip()
+            if not user_input:
+                continue
+            if user_input.upper() == EXIT_COMMAND:
+                return
+
+        try:
+            yield parser.parse(user_input)
+        except RoverException as e:
+            yield FailedCommand(e)
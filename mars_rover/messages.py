@@ -9,6 +9,22 @@ class ErrorMessages:
         "Invalid PLACE command: position ({x},{y}) is outside table bounds"
     )
     MOVE_OUT_OF_BOUNDS = "Invalid MOVE command: would move rover outside table bounds"
+    POSITION_BLOCKED = (
+        "Invalid PLACE command: position ({x},{y}) is blocked by an obstacle"
+    )
+    MOVE_BLOCKED = "Invalid MOVE command: path is blocked by an obstacle"
+    POSITION_OCCUPIED = (
+        "Invalid PLACE command: position ({x},{y}) is occupied by another rover"
+    )
+    MOVE_COLLISION = "Invalid MOVE command: would collide with another rover"
     UNKNOWN_COMMAND = "Unknown command: '{command}'"
     PLACE_REQUIRES_ARGS = "PLACE requires exactly 3 arguments: PLACE X,Y,F"
     INVALID_PLACE_COMMAND = "Invalid PLACE command: {text}"
+    ROVER_REQUIRES_ARGS = "ROVER requires an ID and a command: ROVER N COMMAND"
+    INVALID_ROVER_COMMAND = "Invalid ROVER command: {text}"
+    ROVER_REQUIRES_WORLD = "ROVER commands require a multi-rover table"
+    REPEAT_REQUIRES_BLOCK = "REPEAT requires a count and a block: REPEAT N { C1; C2 }"
+    INVALID_REPEAT_COMMAND = "Invalid REPEAT command: {text}"
+    GOTO_REQUIRES_ARGS = "GOTO requires 2 or 3 arguments: GOTO X,Y[,F]"
+    INVALID_GOTO_COMMAND = "Invalid GOTO command: {text}"
+    GOTO_UNREACHABLE = "Invalid GOTO command: no route to ({x},{y})"
@@ -1,8 +1,9 @@
 """Models for rover simulation."""
 
+import math
 from dataclasses import dataclass
 from enum import StrEnum
-from pydantic import BaseModel
+from typing import NamedTuple
 
 
 class Direction(StrEnum):
@@ -31,8 +32,16 @@ class Direction(StrEnum):
         }
         return rotations[self]
 
+    def rotate(self, quarter_turns: int) -> "Direction":
+        """Return direction after a number of 90° clockwise turns.
 
-@dataclass(frozen=True)
+        Negative values rotate counter-clockwise.
+        """
+        members = list(Direction)
+        return members[(members.index(self) + quarter_turns) % len(members)]
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     """Position on the table."""
 
@@ -42,21 +51,53 @@ class Position:
 
 @dataclass(frozen=True)
 class TableBounds:
-    """Table boundary definition."""
+    """Table boundary definition.
+
+    An edge may be ``math.inf`` or ``-math.inf`` to leave that side of the
+    table open; ``UNBOUNDED_TABLE`` has no edges at all. Nothing is stored
+    per cell, so rovers run at the same speed on any table size.
+    """
+
+    min_x: int | float = 0
+    min_y: int | float = 0
+    max_x: int | float = 5
+    max_y: int | float = 5
+
+    @property
+    def is_finite(self) -> bool:
+        """True if all four edges are finite."""
+        return all(
+            math.isfinite(edge)
+            for edge in (self.min_x, self.min_y, self.max_x, self.max_y)
+        )
 
-    min_x: int = 0
-    min_y: int = 0
-    max_x: int = 5
-    max_y: int = 5
+    @property
+    def cells(self) -> int | float:
+        """Number of cells on the table, ``math.inf`` if an edge is open."""
+        if not self.is_finite:
+            return math.inf
+        return (self.max_x - self.min_x + 1) * (self.max_y - self.min_y + 1)
 
     def contains(self, pos: Position) -> bool:
         """Check if position is within table bounds."""
         return self.min_x <= pos.x <= self.max_x and self.min_y <= pos.y <= self.max_y
 
 
-class PlaceArgs(BaseModel):
-    """Validate PLACE command arguments."""
+UNBOUNDED_TABLE = TableBounds(-math.inf, -math.inf, math.inf, math.inf)
+
+
+class Placement(NamedTuple):
+    """Pre-validated PLACE arguments built by the parser's fast path."""
 
     x: int
     y: int
     direction: Direction
+
+
+def __getattr__(name: str):
+    # PlaceArgs needs pydantic, which is slow to import; load it on first use.
+    if name == "PlaceArgs":
+        from mars_rover.validation import PlaceArgs
+
+        return PlaceArgs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,221 @@
+"""Obstacle grids stored as packed bitmaps, or as sparse tiles for huge tables.
+
+Usage::
+
+    python -m mars_rover.obstacles create cells.txt table.obs --max-x 5 --max-y 5
+
+where ``cells.txt`` holds one blocked ``X,Y`` cell per line.
+"""
+
+import argparse
+import struct
+from typing import Iterable, Optional, Union
+
+from mars_rover.models import TableBounds
+from mars_rover.tiles import TiledGrid
+
+MAGIC = b"MROB"
+# magic, table bounds
+_HEADER = struct.Struct("<4sqqqq")
+
+
+class ObstacleGrid:
+    """Blocked cells of a table, one bit per cell.
+
+    Bits are stored row by row from ``(min_x, min_y)`` in a ``bytearray``,
+    so checking a cell is constant time and a 100k x 100k table takes about
+    1.25 GB. ``version`` increases on every change.
+    """
+
+    def __init__(self, bounds: TableBounds, bits: Optional[bytearray] = None):
+        if not bounds.is_finite:
+            raise ValueError(f"Bitmap obstacle grids need finite bounds: {bounds}")
+        width = bounds.max_x - bounds.min_x + 1
+        height = bounds.max_y - bounds.min_y + 1
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Table bounds are empty: {bounds}")
+        size = (width * height + 7) // 8
+        if bits is not None and len(bits) != size:
+            raise ValueError(f"Expected {size} bytes of obstacle bits, got {len(bits)}")
+        self.bounds = bounds
+        self.width = width
+        self.bits = bits if bits is not None else bytearray(size)
+        self.version = 0
+
+    @classmethod
+    def from_cells(
+        cls, bounds: TableBounds, cells: Iterable[tuple[int, int]]
+    ) -> "ObstacleGrid":
+        """Create a grid with the given cells blocked."""
+        grid = cls(bounds)
+        for x, y in cells:
+            grid.block(x, y)
+        return grid
+
+    def _bit(self, x: int, y: int) -> int:
+        """Return the bit index of a cell.
+
+        Raises:
+            ValueError: If the cell is outside the table
+        """
+        b = self.bounds
+        if not (b.min_x <= x <= b.max_x and b.min_y <= y <= b.max_y):
+            raise ValueError(f"Cell ({x},{y}) is outside table bounds")
+        return (y - b.min_y) * self.width + (x - b.min_x)
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        """Return True if the cell is blocked; cells off the table are not."""
+        b = self.bounds
+        if not (b.min_x <= x <= b.max_x and b.min_y <= y <= b.max_y):
+            return False
+        bit = (y - b.min_y) * self.width + (x - b.min_x)
+        return bool(self.bits[bit >> 3] & (1 << (bit & 7)))
+
+    def first_blocked(
+        self, x: int, y: int, dx: int, dy: int, steps: int
+    ) -> Optional[int]:
+        """Return the first step of a run that lands on a blocked cell, or None.
+
+        Steps ``k`` from 1 to ``steps`` visit ``(x + dx * k, y + dy * k)``.
+        """
+        for k in range(1, steps + 1):
+            if self.is_blocked(x + dx * k, y + dy * k):
+                return k
+        return None
+
+    def extent(self) -> Optional[TableBounds]:
+        """Return bounds covering every blocked cell: the grid's own bounds."""
+        return self.bounds
+
+    def block(self, x: int, y: int) -> None:
+        """Mark a cell as blocked."""
+        bit = self._bit(x, y)
+        self.bits[bit >> 3] |= 1 << (bit & 7)
+        self.version += 1
+
+    def unblock(self, x: int, y: int) -> None:
+        """Mark a cell as free."""
+        bit = self._bit(x, y)
+        self.bits[bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+        self.version += 1
+
+    def save(self, path: str) -> None:
+        """Write the grid to a file: a small header followed by the bitmap."""
+        b = self.bounds
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, b.min_x, b.min_y, b.max_x, b.max_y))
+            f.write(self.bits)
+
+    @classmethod
+    def load(cls, path: str) -> "ObstacleGrid":
+        """Read a grid written by ``save``.
+
+        Raises:
+            ValueError: If the file is not an obstacle grid
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError("Not an obstacle grid: file too short")
+            magic, *edges = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError("Not an obstacle grid: bad magic number")
+            bounds = TableBounds(*edges)
+            grid = cls(bounds)
+            if f.readinto(grid.bits) != len(grid.bits):
+                raise ValueError("Not an obstacle grid: bitmap truncated")
+        return grid
+
+
+class SparseObstacleGrid:
+    """Blocked cells of a table of any size, possibly unbounded.
+
+    Cells are kept in a ``TiledGrid``, so memory grows with the tiles that
+    hold obstacles rather than with the table. Offers the same checks and
+    edits as ``ObstacleGrid``, but is not saved to files.
+    """
+
+    def __init__(self, bounds: TableBounds):
+        self.bounds = bounds
+        self.cells = TiledGrid("B")
+        self.version = 0
+
+    @classmethod
+    def from_cells(
+        cls, bounds: TableBounds, cells: Iterable[tuple[int, int]]
+    ) -> "SparseObstacleGrid":
+        """Create a grid with the given cells blocked."""
+        grid = cls(bounds)
+        for x, y in cells:
+            grid.block(x, y)
+        return grid
+
+    def _check(self, x: int, y: int) -> None:
+        b = self.bounds
+        if not (b.min_x <= x <= b.max_x and b.min_y <= y <= b.max_y):
+            raise ValueError(f"Cell ({x},{y}) is outside table bounds")
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        """Return True if the cell is blocked."""
+        return bool(self.cells.get(x, y))
+
+    def first_blocked(
+        self, x: int, y: int, dx: int, dy: int, steps: int
+    ) -> Optional[int]:
+        """Return the first step of a run that lands on a blocked cell, or None.
+
+        Long runs only look at the tiles holding obstacles.
+        """
+        return self.cells.first_nonzero(x, y, dx, dy, steps)
+
+    def extent(self) -> Optional[TableBounds]:
+        """Return bounds covering every blocked cell, or None if there are none.
+
+        The bounds are rounded out to whole tiles.
+        """
+        return self.cells.extent()
+
+    def block(self, x: int, y: int) -> None:
+        """Mark a cell as blocked."""
+        self._check(x, y)
+        self.cells.set(x, y, 1)
+        self.version += 1
+
+    def unblock(self, x: int, y: int) -> None:
+        """Mark a cell as free."""
+        self._check(x, y)
+        self.cells.set(x, y, 0)
+        self.version += 1
+
+
+# Either kind of grid; both offer ``is_blocked``, ``block``, ``unblock``,
+# ``first_blocked``, ``extent``, ``bounds`` and ``version``.
+Obstacles = Union[ObstacleGrid, SparseObstacleGrid]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover.obstacles``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover.obstacles", description="Obstacle grid tools"
+    )
+    sub = arg_parser.add_subparsers(dest="action", required=True)
+    create = sub.add_parser("create", help="build a grid from a list of X,Y cells")
+    create.add_argument("cells")
+    create.add_argument("target")
+    defaults = TableBounds()
+    for edge in ("min_x", "min_y", "max_x", "max_y"):
+        create.add_argument(
+            f"--{edge.replace('_', '-')}", type=int, default=getattr(defaults, edge)
+        )
+    args = arg_parser.parse_args(argv)
+
+    bounds = TableBounds(args.min_x, args.min_y, args.max_x, args.max_y)
+    with open(args.cells, encoding="utf-8") as f:
+        cells = [
+            tuple(int(part) for part in line.split(",")) for line in f if line.strip()
+        ]
+    ObstacleGrid.from_cells(bounds, cells).save(args.target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+"""Parallel execution of a single command log by composing chunk transforms.
+
+Every run of commands between placements is a function from rover state to
+rover state, and a successful PLACE resets the state. A log is therefore
+split into chunks that are summarized in parallel (pass 1), the summaries
+are composed in order to find the state at the start of each chunk, and the
+chunks are replayed in parallel from those states to produce their output
+(pass 2). The output is identical to a sequential batch run.
+
+Requires NumPy (``pip install -e ".[numpy]"``) and a table small enough for
+``TransitionTables``.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+from mars_rover.batch import (
+    EXIT_COMMAND,
+    BatchSummary,
+    OutputBuffer,
+    execute_commands,
+    parse_lines,
+)
+from mars_rover.commands import (
+    Command,
+    FailedCommand,
+    LeftCommand,
+    MoveCommand,
+    PlaceCommand,
+    ReportCommand,
+    RightCommand,
+    RoverCommand,
+)
+from mars_rover.compiler import compile_commands
+from mars_rover.exceptions import RoverException
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.parse_cache import CachingParser
+from mars_rover.parser import CommandParser
+from mars_rover.planner import GotoCommand, plan_route
+from mars_rover.repeat import RepeatCommand
+from mars_rover.rover import Rover
+from mars_rover.transitions import TableRover, TransitionTables, transition_tables
+
+CHUNKS_PER_WORKER = 4
+
+_DIRECTIONS = tuple(Direction)
+# Unit move along x or y for each direction code.
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+
+_parser: Optional[CommandParser | CachingParser] = None
+
+
+# A coordinate map x -> min(max(x + shift, low), high), as (shift, low, high).
+Clamp = tuple[int, int, int]
+
+
+def _compose(first: Clamp, then: Clamp) -> Clamp:
+    """Compose two clamped shifts of a coordinate.
+
+    A clamp of a clamp is a clamp with its ends clamped, so the result
+    stays a single (shift, low, high) however many are composed.
+    """
+    shift, low, high = then
+    return (
+        first[0] + shift,
+        min(max(first[1] + shift, low), high),
+        min(max(first[2] + shift, low), high),
+    )
+
+
+def _trimmed(clamps: list[Clamp], low: int, high: int) -> list[Clamp]:
+    """Cap shifts so coordinates in ``[low, high]`` stay in int64."""
+    return [
+        (min(max(shift, lo - high), hi - low), lo, hi) for shift, lo, hi in clamps
+    ]
+
+
+class Walk:
+    """MOVE, LEFT and RIGHT commands from an unknown state, in closed form.
+
+    Rotations do not depend on position and a straight run of moves on an
+    empty table shifts one coordinate and clamps it to the table, so for
+    each start direction the commands reduce to a net turn and a clamped
+    shift of x and of y. Commands are folded in constant time, whatever the
+    size of the table; an unplaced rover stays unplaced.
+    """
+
+    def __init__(self, bounds: TableBounds):
+        self.bounds = bounds
+        self.width = int(bounds.max_x - bounds.min_x) + 1
+        self.unplaced = int(bounds.cells) * 4
+        self.turns = 0
+        self.xs = [(0, bounds.min_x, bounds.max_x)] * 4
+        self.ys = [(0, bounds.min_y, bounds.max_y)] * 4
+        self._moves = 0
+
+    def move(self) -> None:
+        """Fold in one MOVE."""
+        self._moves += 1
+
+    def turn(self, quarter_turns: int) -> None:
+        """Fold in a net rotation; negative values turn left."""
+        self._settle()
+        self.turns = (self.turns + quarter_turns) % 4
+
+    def then(self, other: "Walk") -> "Walk":
+        """Return this walk followed by ``other``."""
+        self._settle()
+        other._settle()
+        walk = Walk(self.bounds)
+        walk.turns = (self.turns + other.turns) % 4
+        for code in range(4):
+            heading = (code + self.turns) % 4
+            walk.xs[code] = _compose(self.xs[code], other.xs[heading])
+            walk.ys[code] = _compose(self.ys[code], other.ys[heading])
+        return walk
+
+    def power(self, times: int) -> "Walk":
+        """Return this walk repeated ``times`` times, by repeated squaring."""
+        result = Walk(self.bounds)
+        step = self
+        while times:
+            if times & 1:
+                result = result.then(step)
+            step = step.then(step)
+            times >>= 1
+        return result
+
+    def apply(self, state: int) -> int:
+        """Return the state after the walk, starting from ``state``."""
+        self._settle()
+        if state == self.unplaced:
+            return state
+        cell, code = divmod(state, 4)
+        row, col = divmod(cell, self.width)
+        bounds = self.bounds
+        shift, low, high = self.xs[code]
+        x = min(max(col + bounds.min_x + shift, low), high)
+        shift, low, high = self.ys[code]
+        y = min(max(row + bounds.min_y + shift, low), high)
+        cell = (y - bounds.min_y) * self.width + (x - bounds.min_x)
+        return int(cell * 4 + (code + self.turns) % 4)
+
+    def table(self) -> np.ndarray:
+        """Return the state after the walk from every state, unplaced included."""
+        self._settle()
+        bounds = self.bounds
+        table = np.arange(self.unplaced + 1, dtype=np.int64)
+        cells, codes = np.divmod(table[: self.unplaced], 4)
+        rows, cols = np.divmod(cells, self.width)
+        xs = np.array(_trimmed(self.xs, bounds.min_x, bounds.max_x), dtype=np.int64)
+        ys = np.array(_trimmed(self.ys, bounds.min_y, bounds.max_y), dtype=np.int64)
+        x = np.clip(cols + xs[codes, 0], xs[codes, 1] - bounds.min_x, None)
+        x = np.minimum(x, xs[codes, 2] - bounds.min_x)
+        y = np.clip(rows + ys[codes, 0], ys[codes, 1] - bounds.min_y, None)
+        y = np.minimum(y, ys[codes, 2] - bounds.min_y)
+        table[: self.unplaced] = (y * self.width + x) * 4 + (codes + self.turns) % 4
+        return table
+
+    def _settle(self) -> None:
+        """Fold the pending run of moves into each start direction's shifts.
+
+        Clamp ends lie on the table, so a run toward the far edge can only
+        be clamped by that edge and a run toward the near edge by the other.
+        """
+        moves = self._moves
+        if not moves:
+            return
+        self._moves = 0
+        bounds = self.bounds
+        for code in range(4):
+            heading = (code + self.turns) % 4
+            if heading % 2:
+                axis, near, far = self.xs, bounds.min_x, bounds.max_x
+            else:
+                axis, near, far = self.ys, bounds.min_y, bounds.max_y
+            shift, low, high = axis[code]
+            if heading < 2:
+                low, high = min(low + moves, far), min(high + moves, far)
+                axis[code] = (shift + moves, low, high)
+            else:
+                low, high = max(low - moves, near), max(high - moves, near)
+                axis[code] = (shift - moves, low, high)
+
+
+@dataclass
+class ChunkTransform:
+    """Effect of one chunk on the rover state.
+
+    States are ``TransitionTables`` indices, with ``TransitionTables.states``
+    standing for an unplaced rover. If the chunk contains a successful
+    PLACE, ``constant`` is the final state whatever the starting state;
+    if it holds only MOVE, LEFT, RIGHT and REPEATs of those, ``walk`` gives
+    the final state in closed form; otherwise ``mapping[state]`` is the
+    final state for each start state.
+    """
+
+    exited: bool
+    constant: Optional[int] = None
+    mapping: Optional[list[int]] = None
+    walk: Optional[Walk] = None
+
+    def apply(self, state: int) -> int:
+        """Return the state after this chunk, starting from ``state``."""
+        if self.constant is not None:
+            return self.constant
+        if self.walk is not None:
+            return self.walk.apply(state)
+        return self.mapping[state]
+
+
+def split_file(path: str, chunks: int) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path (str): File to split
+        chunks (int): Desired number of ranges
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(path)
+    step = max(1, size // max(1, chunks))
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + step, size) - 1)
+            f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _read_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """Read the lines of a byte range with universal newline handling."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    yield from io.StringIO(data.decode("utf-8"), newline=None)
+
+
+# Commands that cannot change the state of a rover outside a world.
+_NO_STATE_CHANGE = (ReportCommand, FailedCommand, RoverCommand)
+_WALK_COMMANDS = (MoveCommand, LeftCommand, RightCommand) + _NO_STATE_CHANGE
+
+
+def _init_worker(parse_cache: Optional[int] = None) -> None:
+    global _parser
+    _parser = CommandParser()
+    if parse_cache:
+        _parser = CachingParser(_parser, parse_cache)
+
+
+def summarize_chunk(
+    path: str, start: int, end: int, bounds: TableBounds
+) -> ChunkTransform:
+    """Compute the state transform of one chunk (pass 1).
+
+    Args:
+        path (str): Log file
+        start (int): First byte of the chunk
+        end (int): End byte of the chunk
+        bounds (TableBounds): Table bounds
+
+    Returns:
+        ChunkTransform for the chunk
+    """
+    parser = _parser or CommandParser()
+    # Commands fold into a closed-form walk; only GOTO and REPEATs of other
+    # commands need a mapping over every state, built as they occur.
+    walk = Walk(bounds)
+    mapping: Optional[np.ndarray] = None
+    rover: Optional[TableRover] = None
+    exited = False
+
+    for line in _read_lines(path, start, end):
+        user_input = line.strip()
+        if not user_input:
+            continue
+        if user_input.upper() == EXIT_COMMAND:
+            exited = True
+            break
+        try:
+            command = parser.parse(user_input)
+        except RoverException:
+            continue
+
+        if rover is not None:
+            try:
+                command.execute(rover)
+            except RoverException:
+                pass
+            continue
+
+        command_type = type(command)
+        if command_type is MoveCommand:
+            walk.move()
+        elif command_type is LeftCommand:
+            walk.turn(-1)
+        elif command_type is RightCommand:
+            walk.turn(1)
+        elif command_type is RepeatCommand and _is_walk(command.body):
+            walk = walk.then(_walk(command.body, bounds).power(command.times))
+        elif command_type is GotoCommand or command_type is RepeatCommand:
+            tables = transition_tables(bounds)
+            mapping = walk.table() if mapping is None else walk.table()[mapping]
+            walk = Walk(bounds)
+            if command_type is GotoCommand:
+                mapping = _goto_table(tables, command)[mapping]
+            else:
+                mapping = _repeat_mapping(command, mapping, tables)
+        elif command_type is PlaceCommand:
+            candidate = TableRover(bounds)
+            if command.execute(candidate).success:
+                rover = candidate
+        elif command_type not in _NO_STATE_CHANGE:
+            raise ValueError(f"Unsupported in parallel mode: {command_type.__name__}")
+
+    if rover is not None:
+        return ChunkTransform(exited, constant=rover.state)
+    if mapping is None:
+        return ChunkTransform(exited, walk=walk)
+    return ChunkTransform(exited, mapping=walk.table()[mapping].tolist())
+
+
+def _is_walk(body: list[Command]) -> bool:
+    """Return whether a REPEAT body only moves, turns or leaves the rover be."""
+    return all(type(inner) in _WALK_COMMANDS for inner in body)
+
+
+def _walk(body: list[Command], bounds: TableBounds) -> Walk:
+    """Return the walk of one pass through a REPEAT body."""
+    walk = Walk(bounds)
+    for inner in body:
+        inner_type = type(inner)
+        if inner_type is MoveCommand:
+            walk.move()
+        elif inner_type is LeftCommand:
+            walk.turn(-1)
+        elif inner_type is RightCommand:
+            walk.turn(1)
+    return walk
+
+
+def _goto_table(tables: TransitionTables, command: GotoCommand) -> np.ndarray:
+    """Return the state after a GOTO from every state, unplaced included.
+
+    Without obstacles the rover always ends on the target cell, and the
+    direction it ends in depends only on the start direction and on which
+    side of the target it starts, so one planned route per case covers
+    every state.
+    """
+    bounds = tables.bounds
+    unplaced = tables.states
+    table = np.arange(unplaced + 1, dtype=np.int64)
+    if not bounds.contains(Position(command.x, command.y)):
+        return table
+
+    # headings[sx + 1, sy + 1, d]: final direction code when starting in
+    # direction d at (x - sx, y - sy) relative to the target (x, y).
+    headings = np.empty((3, 3, 4), dtype=np.int64)
+    for sx in (-1, 0, 1):
+        for sy in (-1, 0, 1):
+            for code, direction in enumerate(_DIRECTIONS):
+                start = (command.x - sx, command.y - sy, direction)
+                route = plan_route(
+                    bounds, start, command.x, command.y, command.direction
+                )
+                turns = sum(turns for turns, _ in route)
+                headings[sx + 1, sy + 1, code] = (code + turns) % 4
+
+    cells, codes = np.divmod(table[:unplaced], 4)
+    rows, cols = np.divmod(cells, tables.width)
+    sx = np.sign(command.x - bounds.min_x - cols)
+    sy = np.sign(command.y - bounds.min_y - rows)
+    target = tables.encode(command.x, command.y, _DIRECTIONS[0])
+    table[:unplaced] = target + headings[sx + 1, sy + 1, codes]
+    return table
+
+
+def _repeat_mapping(
+    command: RepeatCommand, mapping: np.ndarray, tables: TransitionTables
+) -> np.ndarray:
+    """Apply a REPEAT block to a mapping by repeated squaring of its body.
+
+    Raises:
+        ValueError: If the block contains commands other than PLACE, MOVE,
+            LEFT, RIGHT, GOTO and commands that cannot change the rover
+    """
+    unplaced = tables.states
+    basic = {
+        MoveCommand: np.append(np.frombuffer(tables.move, dtype=np.int64), unplaced),
+        LeftCommand: np.append(np.frombuffer(tables.left, dtype=np.int64), unplaced),
+        RightCommand: np.append(np.frombuffer(tables.right, dtype=np.int64), unplaced),
+    }
+    body = np.arange(len(mapping), dtype=np.int64)
+    for inner in command.body:
+        table = basic.get(type(inner))
+        if table is not None:
+            body = table[body]
+        elif type(inner) is GotoCommand:
+            body = _goto_table(tables, inner)[body]
+        elif type(inner) is PlaceCommand:
+            candidate = TableRover(tables.bounds)
+            if inner.execute(candidate).success:
+                body = np.full_like(body, candidate.state)
+        elif type(inner) not in _NO_STATE_CHANGE:
+            raise ValueError(
+                f"Unsupported in parallel mode: REPEAT of {type(inner).__name__}"
+            )
+    times = command.times
+    while times:
+        if times & 1:
+            mapping = body[mapping]
+        body = body[body]
+        times >>= 1
+    return mapping
+
+
+def replay_chunk(
+    path: str,
+    start: int,
+    end: int,
+    bounds: TableBounds,
+    state: int,
+    compiled: bool = False,
+) -> tuple[str, BatchSummary]:
+    """Replay one chunk from a known starting state (pass 2).
+
+    Args:
+        path (str): Log file
+        start (int): First byte of the chunk
+        end (int): End byte of the chunk
+        bounds (TableBounds): Table bounds
+        state (int): Starting state index
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+
+    Returns:
+        The chunk's output and its BatchSummary
+    """
+    parser = _parser or CommandParser()
+    tables = transition_tables(bounds)
+    rover = Rover(bounds=bounds)
+    if state != tables.states:
+        x, y, direction = tables.decode(state)
+        rover = Rover(bounds=bounds, position=Position(x, y), direction=direction)
+
+    parts: list[str] = []
+    commands = parse_lines(parser, _read_lines(path, start, end))
+    if compiled:
+        commands = compile_commands(commands)
+    summary = execute_commands(commands, rover, parts.append)
+    return "".join(parts), summary
+
+
+def run_parallel(
+    path: str,
+    bounds: TableBounds,
+    out: OutputBuffer,
+    workers: int,
+    chunks: Optional[int] = None,
+    compiled: bool = False,
+    parse_cache: Optional[int] = None,
+) -> BatchSummary:
+    """Run a command log across worker processes.
+
+    Args:
+        path (str): Log file
+        bounds (TableBounds): Table bounds
+        out (OutputBuffer): Buffered output
+        workers (int): Number of worker processes
+        chunks (Optional[int]): Number of chunks; defaults to
+            CHUNKS_PER_WORKER per worker
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+        parse_cache (Optional[int]): Give each worker a ``CachingParser``
+            keeping this many lines
+
+    Returns:
+        BatchSummary with command and failure counts
+
+    Raises:
+        ValueError: If the table is too large for transition tables or the
+            log holds a command that cannot be summarized
+    """
+    tables = transition_tables(bounds)
+    ranges = split_file(path, chunks or workers * CHUNKS_PER_WORKER)
+    if not ranges:
+        return BatchSummary()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(parse_cache,)
+    ) as pool:
+        transforms = pool.map(
+            summarize_chunk,
+            *zip(*[(path, start, end, bounds) for start, end in ranges]),
+        )
+
+        starts = []
+        state = tables.states
+        for (start, end), transform in zip(ranges, transforms):
+            starts.append((start, end, state))
+            if transform.exited:
+                break
+            state = transform.apply(state)
+
+        results = pool.map(
+            replay_chunk,
+            *zip(*[(path, s, e, bounds, st, compiled) for s, e, st in starts]),
+        )
+        summary = BatchSummary()
+        for text, chunk_summary in results:
+            out.write(text)
+            summary.add(chunk_summary)
+    return summary
@@ -0,0 +1,90 @@
+"""Memoizing front end for ``CommandParser``, keyed on the raw input line."""
+
+from collections import OrderedDict
+from typing import Optional
+
+from mars_rover.commands import Command
+from mars_rover.exceptions import InvalidCommandException
+from mars_rover.parser import CommandParser
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class CachingParser:
+    """A ``CommandParser`` wrapper that remembers what each line parsed to.
+
+    Commands are never modified once built, so a repeated line gets the
+    command built the first time. Lines that failed to parse are cached too
+    and raise their original ``InvalidCommandException`` again. At most
+    ``max_size`` lines are kept, least recently used evicted first;
+    ``hits``, ``misses`` and ``evictions`` count what happened.
+    """
+
+    def __init__(
+        self,
+        parser: Optional[CommandParser] = None,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        if max_size < 1:
+            raise ValueError("Parse cache size must be at least 1")
+        self.parser = parser or CommandParser()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, Command | InvalidCommandException] = (
+            OrderedDict()
+        )
+
+    def parse(self, user_input: str) -> Command:
+        """Parse user input, reusing the result for a line seen before.
+
+        Raises:
+            InvalidCommandException: If command is unknown or invalid
+        """
+        entries = self._entries
+        entry = entries.get(user_input)
+        if entry is None:
+            return self._parse_new(user_input)
+        entries.move_to_end(user_input)
+        self.hits += 1
+        if isinstance(entry, InvalidCommandException):
+            raise entry.with_traceback(None)
+        return entry
+
+    def _parse_new(self, user_input: str) -> Command:
+        self.misses += 1
+        try:
+            command = self.parser.parse(user_input)
+        except InvalidCommandException as e:
+            self._store(user_input, e)
+            raise
+        self._store(user_input, command)
+        return command
+
+    def _store(self, user_input: str, entry: Command | InvalidCommandException):
+        entries = self._entries
+        entries[user_input] = entry
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -1,31 +1,36 @@
 """Command parser for converting user input to command objects."""
 
-from pydantic import ValidationError
+from typing import TYPE_CHECKING
 
 from mars_rover.commands import (
+    LEFT,
+    MOVE,
+    REPORT,
+    RIGHT,
     Command,
-    MoveCommand,
-    LeftCommand,
-    RightCommand,
-    ReportCommand,
     PlaceCommand,
+    RoverCommand,
 )
-from mars_rover.models import Direction, PlaceArgs
+from mars_rover.models import Direction, Placement
+from mars_rover.repeat import RepeatCommand
 from mars_rover.exceptions import InvalidCommandException
 from mars_rover.messages import ErrorMessages
 
+if TYPE_CHECKING:
+    from mars_rover.planner import GotoCommand
+
 
 class CommandParser:
     """Parses user input into commands."""
 
     PLACE_PREFIX = "PLACE"
+    ROVER_PREFIX = "ROVER"
+    REPEAT_PREFIX = "REPEAT"
+    GOTO_PREFIX = "GOTO"
+
+    _DIRECTIONS = {direction.value: direction for direction in Direction}
 
-    _COMMANDS = {
-        "MOVE": MoveCommand,
-        "LEFT": LeftCommand,
-        "RIGHT": RightCommand,
-        "REPORT": ReportCommand,
-    }
+    _COMMANDS = {"MOVE": MOVE, "LEFT": LEFT, "RIGHT": RIGHT, "REPORT": REPORT}
 
     def parse(self, user_input: str) -> Command:
         """Parse user input into a command.
@@ -44,8 +49,26 @@ class CommandParser:
         if cmd.startswith(self.PLACE_PREFIX):
             return self._parse_place(cmd)
 
+        if (
+            cmd.startswith(self.ROVER_PREFIX)
+            and cmd.split(None, 1)[0] == self.ROVER_PREFIX
+        ):
+            return self._parse_rover(cmd)
+
+        if (
+            cmd.startswith(self.REPEAT_PREFIX)
+            and cmd.split(None, 1)[0] == self.REPEAT_PREFIX
+        ):
+            return self._parse_repeat(cmd)
+
+        if (
+            cmd.startswith(self.GOTO_PREFIX)
+            and cmd.split(None, 1)[0] == self.GOTO_PREFIX
+        ):
+            return self._parse_goto(cmd)
+
         if cmd in self._COMMANDS:
-            return self._COMMANDS[cmd]()
+            return self._COMMANDS[cmd]
 
         raise InvalidCommandException(
             ErrorMessages.UNKNOWN_COMMAND.format(command=user_input)
@@ -54,6 +77,10 @@ class CommandParser:
     def _parse_place(self, text: str) -> PlaceCommand:
         """Parse PLACE command arguments.
 
+        Arguments are validated by hand rather than through ``PlaceArgs``,
+        which stays the validation surface for external input; both accept
+        exactly the same text.
+
         Args:
             text (str): PLACE command text
 
@@ -69,15 +96,97 @@ class CommandParser:
         if len(parts) != 3:
             raise InvalidCommandException(ErrorMessages.PLACE_REQUIRES_ARGS)
 
+        direction = self._DIRECTIONS.get(parts[2])
         try:
-            args = PlaceArgs(
-                x=int(parts[0]),
-                y=int(parts[1]),
-                direction=Direction(parts[2]),
-            )
-        except (ValueError, ValidationError) as exc:
+            if direction is None:
+                raise ValueError(f"Invalid direction: {parts[2]!r}")
+            args = Placement(int(parts[0]), int(parts[1]), direction)
+        except ValueError as exc:
             raise InvalidCommandException(
                 ErrorMessages.INVALID_PLACE_COMMAND.format(text=text)
             ) from exc
 
         return PlaceCommand(args)
+
+    def _parse_rover(self, text: str) -> RoverCommand:
+        """Parse a ``ROVER N COMMAND`` prefix and the command it addresses.
+
+        Args:
+            text (str): ROVER command text
+
+        Returns:
+            RoverCommand object
+
+        Raises:
+            InvalidCommandException: If the ROVER prefix or command is malformed
+        """
+        parts = text.split(None, 2)
+        if len(parts) != 3:
+            raise InvalidCommandException(ErrorMessages.ROVER_REQUIRES_ARGS)
+        if not parts[1].isdecimal() or parts[2].startswith(self.ROVER_PREFIX):
+            raise InvalidCommandException(
+                ErrorMessages.INVALID_ROVER_COMMAND.format(text=text)
+            )
+        return RoverCommand(int(parts[1]), self.parse(parts[2]))
+
+    def _parse_repeat(self, text: str) -> RepeatCommand:
+        """Parse ``REPEAT N { C1; C2; ... }``.
+
+        Blocks cannot be nested.
+
+        Args:
+            text (str): REPEAT command text
+
+        Returns:
+            RepeatCommand object
+
+        Raises:
+            InvalidCommandException: If the count or block is malformed
+        """
+        raw_args = text[len(self.REPEAT_PREFIX) :]  # noqa: E203
+        raw_count, brace, block = raw_args.partition("{")
+        if not brace or not block.endswith("}"):
+            raise InvalidCommandException(ErrorMessages.REPEAT_REQUIRES_BLOCK)
+        raw_count = raw_count.strip()
+        parts = [p.strip() for p in block[:-1].split(";")]
+        body = [p for p in parts if p]
+        if (
+            not raw_count.isdecimal()
+            or not body
+            or any("{" in p or "}" in p for p in body)
+        ):
+            raise InvalidCommandException(
+                ErrorMessages.INVALID_REPEAT_COMMAND.format(text=text)
+            )
+        return RepeatCommand(int(raw_count), [self.parse(p) for p in body])
+
+    def _parse_goto(self, text: str) -> "GotoCommand":
+        """Parse GOTO command arguments.
+
+        Args:
+            text (str): GOTO command text
+
+        Returns:
+            GotoCommand object
+
+        Raises:
+            InvalidCommandException: If GOTO command is malformed
+        """
+        # The planner is imported on first use to keep CLI startup light.
+        from mars_rover.planner import GotoCommand
+
+        raw_args = text[len(self.GOTO_PREFIX) :].strip()  # noqa: E203
+        parts = [p.strip() for p in raw_args.split(",")]
+
+        if len(parts) not in (2, 3):
+            raise InvalidCommandException(ErrorMessages.GOTO_REQUIRES_ARGS)
+
+        direction = self._DIRECTIONS.get(parts[2]) if len(parts) == 3 else None
+        try:
+            if len(parts) == 3 and direction is None:
+                raise ValueError(f"Invalid direction: {parts[2]!r}")
+            return GotoCommand(int(parts[0]), int(parts[1]), direction)
+        except ValueError as exc:
+            raise InvalidCommandException(
+                ErrorMessages.INVALID_GOTO_COMMAND.format(text=text)
+            ) from exc
@@ -0,0 +1,99 @@
+"""Composable streaming stages: lines to commands, commands to results, to text.
+
+Each stage is a generator over any iterable, so input can come from a list,
+a file, a socket or another generator and is processed in constant memory::
+
+    results = execute_stream(iter_commands(lines), rover)
+    for text in format_results(results):
+        sink.write(text)
+
+The execution and formatting stages live in ``mars_rover.batch``, where
+batch mode runs on them, and are re-exported here.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from mars_rover.batch import execute_stream, format_results, parse_lines
+from mars_rover.commands import Command
+from mars_rover.compiler import compile_commands
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+DEFAULT_CHUNK_SIZE = 4096
+MAX_TEXT_SIZE = 1 << 20
+
+T = TypeVar("T")
+
+
+def iter_commands(
+    lines: Iterable[str],
+    parser: Optional[CommandParser] = None,
+    compiled: bool = False,
+) -> Iterator[Command]:
+    """Parse raw lines into commands, stopping at EXIT.
+
+    Args:
+        lines (Iterable[str]): Raw input lines
+        parser (Optional[CommandParser]): Parser to use, a new one by default
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs into single commands
+
+    Returns:
+        Iterator of commands; lines that fail to parse become ``FailedCommand``
+    """
+    commands = parse_lines(parser or CommandParser(), lines)
+    if compiled:
+        commands = compile_commands(commands)
+    return commands
+
+
+def chunked(items: Iterable[T], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[T]]:
+    """Group items into lists of at most ``size``.
+
+    Raises:
+        ValueError: If size is less than 1
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_output(
+    lines: Iterable[str],
+    rover: Rover,
+    parser: Optional[CommandParser] = None,
+    compiled: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Run the whole pipeline, yielding the output of each chunk of commands.
+
+    Commands are parsed, executed and formatted ``chunk_size`` at a time, so
+    a sink receives one string per chunk rather than one per line; chunks
+    that produce no output are skipped. Output from a single chunk is split
+    once it reaches ``MAX_TEXT_SIZE`` characters, which bounds memory when
+    compiled commands expand into many lines.
+
+    Args:
+        lines (Iterable[str]): Raw input lines
+        rover (Rover): Rover instance
+        parser (Optional[CommandParser]): Parser to use, a new one by default
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+        chunk_size (int): Commands per chunk
+
+    Yields:
+        Output text for a chunk of commands
+    """
+    for chunk in chunked(iter_commands(lines, parser, compiled), chunk_size):
+        parts: list[str] = []
+        size = 0
+        for text in format_results(execute_stream(chunk, rover)):
+            parts.append(text)
+            size += len(text)
+            if size >= MAX_TEXT_SIZE:
+                yield "".join(parts)
+                parts.clear()
+                size = 0
+        if parts:
+            yield "".join(parts)
@@ -0,0 +1,287 @@
+"""Shortest-path planning to a target cell, and the GOTO command.
+
+Routes minimize the number of MOVE, LEFT and RIGHT commands over the
+rover's (x, y, direction) states. On an empty table the optimal route is
+an L shape and is built in closed form; around obstacles it is found by
+A* with the empty-table cost as heuristic.
+
+A route is a tuple of (quarter turns, moves) legs: the rover turns by the
+net clockwise quarter turns, then drives the moves in a straight line, so
+its size does not grow with the distance covered.
+"""
+
+import heapq
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from mars_rover.exceptions import RoverNotPlacedException
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.result import CommandResult
+from mars_rover.rover import Rover
+
+if TYPE_CHECKING:
+    from mars_rover.obstacles import Obstacles
+
+CACHE_SIZE = 4096
+
+_DIRECTIONS = tuple(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+# Net quarter turns from one direction code to another, by clockwise turns.
+_TURNS = (0, 1, 2, -1)
+
+# Net clockwise quarter turns, then moves straight ahead.
+Leg = tuple[int, int]
+Route = tuple[Leg, ...]
+# Target x, y and direction code (None for any direction).
+Goal = tuple[int, int, Optional[int]]
+
+
+def _legs(x: int, y: int, goal_x: int, goal_y: int) -> list[list[tuple[int, int]]]:
+    """Return the candidate L-shaped routes as lists of (direction, moves)."""
+    dx, dy = goal_x - x, goal_y - y
+    leg_x = (1 if dx > 0 else 3, abs(dx))
+    leg_y = (0 if dy > 0 else 2, abs(dy))
+    if dx and dy:
+        return [[leg_x, leg_y], [leg_y, leg_x]]
+    if dx:
+        return [[leg_x]]
+    if dy:
+        return [[leg_y]]
+    return [[]]
+
+
+def _empty_cost(x: int, y: int, code: int, goal: Goal) -> int:
+    """Return the command count of the best route on an empty table."""
+    goal_x, goal_y, goal_code = goal
+    best = None
+    for legs in _legs(x, y, goal_x, goal_y):
+        heading = code
+        cost = 0
+        for leg_code, moves in legs:
+            cost += abs(_TURNS[(leg_code - heading) % 4]) + moves
+            heading = leg_code
+        if goal_code is not None:
+            cost += abs(_TURNS[(goal_code - heading) % 4])
+        if best is None or cost < best:
+            best = cost
+    return best
+
+
+def _empty_route(x: int, y: int, code: int, goal: Goal) -> Route:
+    """Build the best route on an empty table."""
+    goal_x, goal_y, goal_code = goal
+    best: Optional[list[Leg]] = None
+    best_cost = 0
+    for legs in _legs(x, y, goal_x, goal_y):
+        heading = code
+        route: list[Leg] = []
+        cost = 0
+        for leg_code, moves in legs:
+            turns = _TURNS[(leg_code - heading) % 4]
+            route.append((turns, moves))
+            cost += abs(turns) + moves
+            heading = leg_code
+        if goal_code is not None and goal_code != heading:
+            turns = _TURNS[(goal_code - heading) % 4]
+            route.append((turns, 0))
+            cost += abs(turns)
+        if best is None or cost < best_cost:
+            best, best_cost = route, cost
+    return tuple(best)
+
+
+def _fold_steps(steps: list[int]) -> Route:
+    """Fold single steps (-1 LEFT, 1 RIGHT, 0 MOVE) into route legs."""
+    route: list[Leg] = []
+    turns = moves = 0
+    for step in steps:
+        if not step:
+            moves += 1
+            continue
+        if moves:
+            route.append((turns, moves))
+            turns = moves = 0
+        turns += step
+    if turns or moves:
+        route.append((turns, moves))
+    return tuple(route)
+
+
+def _search_route(
+    bounds: TableBounds,
+    obstacles: "Obstacles",
+    start: tuple[int, int, int],
+    goal: Goal,
+) -> Optional[Route]:
+    """Find the best route around obstacles with A*, or None."""
+    goal_x, goal_y, goal_code = goal
+    is_blocked = obstacles.is_blocked
+    best_cost = {start: 0}
+    # Each state's predecessor and the step reaching it (-1, 1 or 0 to move).
+    parents: dict[tuple[int, int, int], tuple[tuple[int, int, int], int]] = {}
+    # (estimated total, -cost so deeper states win ties, state)
+    frontier = [(_empty_cost(*start, goal), 0, start)]
+    while frontier:
+        _, neg_cost, state = heapq.heappop(frontier)
+        cost = -neg_cost
+        if cost > best_cost[state]:
+            continue
+        x, y, code = state
+        if x == goal_x and y == goal_y and goal_code in (None, code):
+            steps = []
+            while state in parents:
+                state, step = parents[state]
+                steps.append(step)
+            return _fold_steps(steps[::-1])
+
+        nx, ny = x + _DX[code], y + _DY[code]
+        successors = [((x, y, (code + 3) % 4), -1), ((x, y, (code + 1) % 4), 1)]
+        if (
+            bounds.min_x <= nx <= bounds.max_x
+            and bounds.min_y <= ny <= bounds.max_y
+            and not is_blocked(nx, ny)
+        ):
+            successors.append(((nx, ny, code), 0))
+        for successor, step in successors:
+            if cost + 1 < best_cost.get(successor, cost + 2):
+                best_cost[successor] = cost + 1
+                parents[successor] = (state, step)
+                estimate = cost + 1 + _empty_cost(*successor, goal)
+                heapq.heappush(frontier, (estimate, -(cost + 1), successor))
+    return None
+
+
+def _search_bounds(
+    bounds: TableBounds,
+    obstacles: "Obstacles",
+    start: tuple[int, int, int],
+    goal: Goal,
+) -> TableBounds:
+    """Clip a table to the box around start, goal and obstacles, plus one cell.
+
+    A route leaving that box can be clamped onto its free outer ring without
+    getting longer, so searching inside it is exact, and its size follows
+    the query rather than the table, which may be huge or open.
+    """
+    xs, ys = [start[0], goal[0]], [start[1], goal[1]]
+    extent = obstacles.extent()
+    if extent is not None:
+        xs += [extent.min_x, extent.max_x]
+        ys += [extent.min_y, extent.max_y]
+    return TableBounds(
+        max(bounds.min_x, min(xs) - 1),
+        max(bounds.min_y, min(ys) - 1),
+        min(bounds.max_x, max(xs) + 1),
+        min(bounds.max_y, max(ys) + 1),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_search(
+    bounds: TableBounds,
+    obstacles: "Obstacles",
+    obstacles_version: int,
+    start: tuple[int, int, int],
+    goal: Goal,
+) -> Optional[Route]:
+    """Search a route; ``obstacles_version`` keys the cache to the grid's state."""
+    bounds = _search_bounds(bounds, obstacles, start, goal)
+    return _search_route(bounds, obstacles, start, goal)
+
+
+def plan_route(
+    bounds: TableBounds,
+    start: tuple[int, int, Direction],
+    goal_x: int,
+    goal_y: int,
+    goal_direction: Optional[Direction] = None,
+    obstacles: Optional["Obstacles"] = None,
+) -> Optional[Route]:
+    """Return the shortest MOVE/LEFT/RIGHT route to a target cell.
+
+    Routes around obstacles are cached per (bounds, obstacle grid and
+    version, start, goal); routes on an empty table are built in constant
+    time and not cached.
+
+    Args:
+        bounds (TableBounds): Table bounds
+        start (tuple[int, int, Direction]): Starting x, y and direction
+        goal_x (int): Target X coordinate
+        goal_y (int): Target Y coordinate
+        goal_direction (Optional[Direction]): Required final direction, if any
+        obstacles (Optional[Obstacles]): Blocked cells
+
+    Returns:
+        Tuple of (quarter turns, moves) legs, or None if the target cannot
+        be reached
+    """
+    if not bounds.contains(Position(goal_x, goal_y)):
+        return None
+    if obstacles is not None and obstacles.is_blocked(goal_x, goal_y):
+        return None
+    x, y, direction = start
+    code = _DIRECTION_CODES[direction]
+    goal_code = None if goal_direction is None else _DIRECTION_CODES[goal_direction]
+    goal = (goal_x, goal_y, goal_code)
+    if obstacles is None:
+        return _empty_route(x, y, code, goal)
+    return _cached_search(bounds, obstacles, obstacles.version, (x, y, code), goal)
+
+
+def route_length(route: Route) -> int:
+    """Return the number of MOVE, LEFT and RIGHT commands a route stands for.
+
+    Args:
+        route (Route): Route legs from ``plan_route``
+
+    Returns:
+        Command count
+    """
+    return sum(abs(turns) + moves for turns, moves in route)
+
+
+class GotoCommand:
+    """Command to drive the rover to a cell along the shortest route."""
+
+    def __init__(self, x: int, y: int, direction: Optional[Direction] = None):
+        self.x = x
+        self.y = y
+        self.direction = direction
+
+    def execute(self, rover: Rover) -> CommandResult:
+        """Plan a route and execute it, stopping at the first rejected move.
+
+        Each leg is one rotation and one ``move_many`` run.
+
+        Returns:
+            CommandResult indicating success or failure
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        if rover.position is None or rover.direction is None:
+            raise RoverNotPlacedException(ErrorMessages.ROVER_NOT_PLACED)
+        start = (rover.position.x, rover.position.y, rover.direction)
+        route = plan_route(
+            rover.bounds,
+            start,
+            self.x,
+            self.y,
+            self.direction,
+            getattr(rover, "obstacles", None),
+        )
+        if route is None:
+            return CommandResult.error(
+                ErrorMessages.GOTO_UNREACHABLE.format(x=self.x, y=self.y)
+            )
+        for turns, moves in route:
+            if turns:
+                rover.rotate(turns)
+            if moves:
+                result = rover.move_many(moves)
+                if not result.success:
+                    return CommandResult.error(result.message)
+        return CommandResult.ok()
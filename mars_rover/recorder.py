@@ -0,0 +1,35 @@
+"""Hook for recording what a rover does, step by step."""
+
+from typing import Protocol
+
+from mars_rover.models import Direction
+
+
+class Opcode:
+    """Command codes passed to recorders; the binary mission format's values."""
+
+    MOVE = 0
+    LEFT = 1
+    RIGHT = 2
+    REPORT = 3
+    PLACE = 4
+
+
+class Recorder(Protocol):
+    """Receives the commands a ``Rover`` executes.
+
+    ``record`` gets the rover's state after a command, or the requested cell
+    for a rejected PLACE, with the command's opcode and status.
+    ``record_moves`` gets a run of ``count`` MOVEs from (x, y) executed in
+    one step, of which ``steps`` succeeded; ``status`` is that of the
+    rejected moves, or OK. Commands on a rover that has not been placed are
+    not recorded.
+    """
+
+    def record(
+        self, x: int, y: int, direction: Direction, opcode: int, status: int
+    ) -> None: ...
+
+    def record_moves(
+        self, x: int, y: int, direction: Direction, count: int, steps: int, status: int
+    ) -> None: ...
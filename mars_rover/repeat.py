@@ -0,0 +1,242 @@
+"""REPEAT blocks executed with cycle detection and fast-forward."""
+
+import math
+from typing import Hashable, Iterator
+
+from mars_rover.commands import (
+    Command,
+    LeftCommand,
+    MoveCommand,
+    RightCommand,
+    RoverCommand,
+)
+from mars_rover.exceptions import RoverException
+from mars_rover.models import Position
+from mars_rover.result import CommandResult, RepeatedOutput
+from mars_rover.rover import Rover
+
+# Rover states remembered at a time while looking for a cycle.
+MAX_TRACKED_STATES = 1 << 14
+
+
+class RepeatCommand:
+    """A block of commands executed ``times`` times.
+
+    The rover state is recorded before each iteration. An iteration's
+    effect depends only on that state, so once a state repeats, the
+    iterations in between form a cycle: the remaining full cycles are
+    skipped, their output is reused, and only the leftover iterations are
+    executed. A rover with a recorder runs every iteration, so that each
+    one is recorded.
+
+    On a small table a state soon repeats, but on a huge or open one the
+    rover may never come back. At most ``MAX_TRACKED_STATES`` states are
+    remembered: when that many have gone by without a repeat, their output
+    is handed over as a block and the search starts over. Batch execution
+    writes each block out before running further iterations, so memory
+    stays bounded; ``execute`` gathers every block into one result. Two kinds
+    of body are stepped in closed form instead. A body of nothing but MOVE
+    is one straight run, executed by a single ``move_many``. A MOVE, LEFT
+    and RIGHT body that ends facing the way it started shifts the rover by
+    the same amount each time; on an empty table the iterations that stay
+    on it are skipped in one jump.
+    """
+
+    def __init__(self, times: int, body: list[Command]):
+        self.times = times
+        self.body = body
+        self.count = times * len(body)
+        self._world_state = any(type(command) is RoverCommand for command in body)
+        self._moves_only = all(type(command) is MoveCommand for command in body)
+        self._moves_and_turns = all(
+            type(command) in (MoveCommand, LeftCommand, RightCommand)
+            for command in body
+        )
+
+    def execute(self, rover: Rover) -> RepeatedOutput:
+        """Execute the block, fast-forwarding through cycles.
+
+        Returns:
+            RepeatedOutput with every REPORT and error line in order
+        """
+        blocks = list(self.execute_blocks(rover))
+        last = blocks.pop()
+        if not blocks:
+            return last
+        prefix = [line for block in blocks for line in block.prefix]
+        return RepeatedOutput(
+            prefix + last.prefix,
+            last.cycle,
+            last.cycles,
+            last.suffix,
+            sum(block.failures for block in blocks) + last.failures,
+        )
+
+    def execute_blocks(self, rover: Rover) -> Iterator[RepeatedOutput]:
+        """Execute the block, yielding its output as it is produced.
+
+        Iterations run as the blocks are consumed. Every block but the last
+        holds only a ``prefix``, the output of at most
+        ``MAX_TRACKED_STATES`` iterations, so a long REPEAT that never
+        cycles is not held in memory at once.
+
+        Yields:
+            RepeatedOutput blocks whose lines, in order, are the output of
+            ``execute``; the last block is always yielded
+        """
+        if self._moves_only and rover.position is not None:
+            yield self._move_run(rover)
+            return
+        iteration = 0
+        if (
+            self._moves_and_turns
+            and type(rover) is Rover
+            and rover.position is not None
+            and rover.obstacles is None
+            and rover.occupancy is None
+            and rover.recorder is None
+        ):
+            iteration = self._translate(rover)
+        # Skipped iterations would never reach a recorder, so a recorded
+        # rover runs every iteration.
+        tracking = getattr(rover, "recorder", None) is None
+        # One entry per iteration since the last block, starting at the
+        # first state in ``seen``.
+        outputs: list[list[str]] = []
+        failures: list[int] = []
+        seen: dict[Hashable, int] = {}
+        while iteration < self.times:
+            state = self._state(rover) if tracking else None
+            start = seen.get(state)
+            if start is not None:
+                yield self._fast_forward(
+                    rover,
+                    _flatten(outputs),
+                    sum(failures),
+                    outputs[start:],
+                    sum(failures[start:]),
+                    self.times - iteration,
+                )
+                return
+            if len(outputs) >= MAX_TRACKED_STATES:
+                if any(outputs):
+                    yield RepeatedOutput(_flatten(outputs), [], 0, [], sum(failures))
+                outputs.clear()
+                failures.clear()
+                seen.clear()
+            if tracking:
+                seen[state] = len(outputs)
+            lines, failed = self._run_body(rover)
+            outputs.append(lines)
+            failures.append(failed)
+            iteration += 1
+        yield RepeatedOutput(_flatten(outputs), [], 0, [], sum(failures))
+
+    def _move_run(self, rover: Rover) -> RepeatedOutput:
+        """Execute a body of only MOVE as one run of moves."""
+        result = rover.move_many(self.times * len(self.body))
+        if result.success:
+            return RepeatedOutput([], [], 0, [])
+        line = f"Error: {result.message}\n"
+        return RepeatedOutput([], [line], result.count, [], result.count)
+
+    def _translate(self, rover: Rover) -> int:
+        """Jump over the leading iterations that only shift the rover.
+
+        Each such iteration visits the same cells relative to where it
+        starts, so they all stay on the table exactly when the first and
+        the last of them do.
+
+        Returns:
+            The number of iterations skipped
+        """
+        direction = rover.direction
+        x = y = 0
+        xs, ys = [0], [0]
+        for command in self.body:
+            command_type = type(command)
+            if command_type is MoveCommand:
+                dx, dy = Rover._MOVEMENT_CHANGES[direction]
+                x, y = x + dx, y + dy
+                xs.append(x)
+                ys.append(y)
+            elif command_type is LeftCommand:
+                direction = direction.left()
+            else:
+                direction = direction.right()
+        if direction is not rover.direction or x == y == 0:
+            return 0
+
+        b, start = rover.bounds, rover.position
+        iterations = self.times
+        axes = (
+            (start.x, x, b.min_x, b.max_x, xs),
+            (start.y, y, b.min_y, b.max_y, ys),
+        )
+        for origin, shift, low, high, offsets in axes:
+            first, last = origin + min(offsets), origin + max(offsets)
+            if first < low or last > high:
+                return 0
+            room = high - last if shift > 0 else first - low
+            if shift and room != math.inf:
+                iterations = min(iterations, room // abs(shift) + 1)
+        rover.position = Position(start.x + x * iterations, start.y + y * iterations)
+        return iterations
+
+    def _fast_forward(
+        self,
+        rover: Rover,
+        prefix: list[str],
+        prefix_failures: int,
+        cycle: list[list[str]],
+        cycle_failures: int,
+        remaining: int,
+    ) -> RepeatedOutput:
+        """Skip the full cycles among the ``remaining`` iterations."""
+        cycles, leftover = divmod(remaining, len(cycle))
+        suffix: list[list[str]] = []
+        suffix_failures = 0
+        for _ in range(leftover):
+            lines, failed = self._run_body(rover)
+            suffix.append(lines)
+            suffix_failures += failed
+        return RepeatedOutput(
+            prefix=prefix,
+            cycle=_flatten(cycle),
+            cycles=cycles,
+            suffix=_flatten(suffix),
+            failures=prefix_failures + cycle_failures * cycles + suffix_failures,
+        )
+
+    def _state(self, rover: Rover) -> Hashable:
+        """Return everything the next iteration's effect depends on."""
+        slot = getattr(rover, "occupancy", None)
+        if self._world_state and slot is not None:
+            return tuple(
+                (rover_id, other.position, other.direction)
+                for rover_id, other in sorted(slot.world.rovers.items())
+            )
+        return rover.position, rover.direction
+
+    def _run_body(self, rover: Rover) -> tuple[list[str], int]:
+        """Execute the block once, returning its output lines and failures."""
+        lines: list[str] = []
+        failed = 0
+        for command in self.body:
+            try:
+                result = command.execute(rover)
+            except RoverException as e:
+                lines.append(f"Error: {e}\n")
+                failed += 1
+                continue
+            if isinstance(result, CommandResult):
+                if not result.success:
+                    lines.extend([f"Error: {result.message}\n"] * result.count)
+                    failed += result.count
+            elif isinstance(result, str):
+                lines.append(f"{result}\n")
+        return lines, failed
+
+
+def _flatten(outputs: list[list[str]]) -> list[str]:
+    return [line for lines in outputs for line in lines]
@@ -0,0 +1,273 @@
+"""Periodic snapshots and fast seek/replay for long mission logs.
+
+A replay index records the rover state and failure count every
+``interval`` commands, together with the byte offset of the next command,
+in a sidecar file next to the log. Seeking to command ``n`` restores the
+nearest snapshot at or before ``n`` and replays at most ``interval - 1``
+commands. Commands are the non-blank lines before EXIT, and lines are split
+on ``\\n``.
+
+Usage::
+
+    python -m mars_rover.replay index mission.txt --interval 10000
+    python -m mars_rover.replay seek mission.txt 123456
+"""
+
+import argparse
+import os
+import struct
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from mars_rover.batch import EXIT_COMMAND, execute_commands
+from mars_rover.commands import Command, FailedCommand
+from mars_rover.exceptions import RoverException
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+INDEX_SUFFIX = ".idx"
+DEFAULT_INTERVAL = 10_000
+MAGIC = b"MRI1"
+
+_DIRECTIONS = tuple(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+_UNPLACED = 0xFF
+# magic, interval, log size, table bounds
+_HEADER = struct.Struct("<4sQQqqqq")
+# command index, byte offset, x, y, direction code, failures
+_SNAPSHOT = struct.Struct("<QQqqBQ")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Rover state after ``command_index`` commands of a log."""
+
+    command_index: int
+    offset: int
+    position: Optional[Position]
+    direction: Optional[Direction]
+    failures: int
+
+    def restore(self, bounds: TableBounds) -> Rover:
+        """Return a rover in the recorded state."""
+        return Rover(bounds=bounds, position=self.position, direction=self.direction)
+
+
+def _iter_commands(
+    parser: CommandParser, path: str, offset: int = 0
+) -> Iterator[tuple[int, Command]]:
+    """Yield (offset after the line, command) for each command from ``offset``."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        position = offset
+        for raw in f:
+            position += len(raw)
+            user_input = raw.decode("utf-8").strip()
+            if not user_input:
+                continue
+            if user_input.upper() == EXIT_COMMAND:
+                return
+            try:
+                command = parser.parse(user_input)
+            except RoverException as e:
+                command = FailedCommand(e)
+            yield position, command
+
+
+def _snapshot(rover: Rover, index: int, offset: int, failures: int) -> Snapshot:
+    return Snapshot(index, offset, rover.position, rover.direction, failures)
+
+
+class ReplayIndex:
+    """Snapshots of a log's rover state at regular command intervals."""
+
+    def __init__(
+        self,
+        path: str,
+        bounds: TableBounds,
+        interval: int,
+        log_size: int,
+        snapshots: list[Snapshot],
+    ):
+        self.path = path
+        self.bounds = bounds
+        self.interval = interval
+        self.log_size = log_size
+        self.snapshots = snapshots
+        self._indices = [s.command_index for s in snapshots]
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        bounds: TableBounds,
+        interval: int = DEFAULT_INTERVAL,
+        parser: Optional[CommandParser] = None,
+    ) -> "ReplayIndex":
+        """Replay a log once, recording a snapshot every ``interval`` commands.
+
+        Args:
+            path (str): Log file
+            bounds (TableBounds): Table bounds
+            interval (int): Commands between snapshots
+            parser (Optional[CommandParser]): Command parser instance
+
+        Returns:
+            The ReplayIndex
+        """
+        if interval < 1:
+            raise ValueError("Snapshot interval must be at least 1")
+        parser = parser or CommandParser()
+        rover = Rover(bounds=bounds)
+        snapshots = [_snapshot(rover, 0, 0, 0)]
+        failures = 0
+        index = 0
+        for offset, command in _iter_commands(parser, path):
+            failures += execute_commands((command,), rover, _discard).failures
+            index += 1
+            if index % interval == 0:
+                snapshots.append(_snapshot(rover, index, offset, failures))
+        return cls(path, bounds, interval, os.path.getsize(path), snapshots)
+
+    def save(self, index_path: Optional[str] = None) -> str:
+        """Write the index to a sidecar file, by default ``<log>.idx``.
+
+        Returns:
+            Path of the written index
+
+        Raises:
+            ValueError: If the table bounds are not finite
+        """
+        index_path = index_path or self.path + INDEX_SUFFIX
+        b = self.bounds
+        if not b.is_finite:
+            raise ValueError(f"Replay index files need finite table bounds: {b}")
+        with open(index_path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    self.interval,
+                    self.log_size,
+                    b.min_x,
+                    b.min_y,
+                    b.max_x,
+                    b.max_y,
+                )
+            )
+            for s in self.snapshots:
+                placed = s.position is not None and s.direction is not None
+                f.write(
+                    _SNAPSHOT.pack(
+                        s.command_index,
+                        s.offset,
+                        s.position.x if placed else 0,
+                        s.position.y if placed else 0,
+                        _DIRECTION_CODES[s.direction] if placed else _UNPLACED,
+                        s.failures,
+                    )
+                )
+        return index_path
+
+    @classmethod
+    def load(cls, path: str, index_path: Optional[str] = None) -> "ReplayIndex":
+        """Read the sidecar index of a log.
+
+        Raises:
+            ValueError: If the index is malformed or the log has changed size
+        """
+        with open(index_path or path + INDEX_SUFFIX, "rb") as f:
+            data = f.read()
+        magic, interval, log_size, *edges = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a replay index: bad magic number")
+        if log_size != os.path.getsize(path):
+            raise ValueError("Replay index is stale: log size has changed")
+
+        snapshots = []
+        for fields in _SNAPSHOT.iter_unpack(data[_HEADER.size :]):  # noqa: E203
+            index, offset, x, y, code, failures = fields
+            if code == _UNPLACED:
+                snapshots.append(Snapshot(index, offset, None, None, failures))
+            else:
+                snapshots.append(
+                    Snapshot(index, offset, Position(x, y), _DIRECTIONS[code], failures)
+                )
+        return cls(path, TableBounds(*edges), interval, log_size, snapshots)
+
+    def seek(
+        self,
+        command_index: int,
+        parser: Optional[CommandParser] = None,
+        write: Optional[Callable[[str], None]] = None,
+    ) -> tuple[Rover, int]:
+        """Return the rover state and failure count after ``command_index``.
+
+        Args:
+            command_index (int): Number of commands to have executed; the
+                log's final state is returned if it has fewer commands
+            parser (Optional[CommandParser]): Command parser instance
+            write (Optional[Callable[[str], None]]): Receives the output of
+                the commands replayed after the snapshot
+
+        Returns:
+            (rover, failures) at that point of the log
+
+        Raises:
+            ValueError: If command_index is negative
+        """
+        if command_index < 0:
+            raise ValueError(f"Command index must not be negative: {command_index}")
+        parser = parser or CommandParser()
+        write = write or _discard
+        snapshot = self.snapshots[bisect_right(self._indices, command_index) - 1]
+        rover = snapshot.restore(self.bounds)
+        failures = snapshot.failures
+        remaining = command_index - snapshot.command_index
+        if remaining <= 0:
+            return rover, failures
+        for _, command in _iter_commands(parser, self.path, snapshot.offset):
+            failures += execute_commands((command,), rover, write).failures
+            remaining -= 1
+            if not remaining:
+                break
+        return rover, failures
+
+
+def _discard(text: str) -> None:
+    pass
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover.replay``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover.replay", description="Snapshot index and seek for logs"
+    )
+    sub = arg_parser.add_subparsers(dest="action", required=True)
+    index = sub.add_parser("index", help="build the sidecar snapshot index")
+    index.add_argument("log")
+    index.add_argument("--interval", type=int, default=DEFAULT_INTERVAL)
+    seek = sub.add_parser("seek", help="show the rover state after N commands")
+    seek.add_argument("log")
+    seek.add_argument("command_index", type=int)
+    args = arg_parser.parse_args(argv)
+
+    if args.action == "index":
+        replay = ReplayIndex.build(args.log, TableBounds(), args.interval)
+        path = replay.save()
+        sys.stdout.write(f"{len(replay.snapshots)} snapshots written to {path}\n")
+        return
+
+    replay = ReplayIndex.load(args.log)
+    try:
+        rover, failures = replay.seek(args.command_index)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    state = rover.try_report() or "not placed"
+    sys.stdout.write(f"{state} ({failures} failures)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,88 @@
 """Result objects for command execution."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
+# Lines of expanded output built into one string at a time.
+BLOCK_LINES = 4096
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CommandResult:
-    """Result of a command execution."""
+    """Result of a command execution.
+
+    Results are immutable, so the plain successful result is shared.
+    """
 
     success: bool
     message: Optional[str] = None
+    count: int = 1
 
     @classmethod
     def ok(cls, message: Optional[str] = None) -> "CommandResult":
-        """Create a successful result."""
+        """Return a successful result; the shared one when there is no message."""
+        if message is None:
+            return _OK
         return cls(success=True, message=message)
 
     @classmethod
-    def error(cls, message: str) -> "CommandResult":
-        """Create an error result."""
-        return cls(success=False, message=message)
+    def error(cls, message: str, count: int = 1) -> "CommandResult":
+        """Create an error result.
+
+        Args:
+            message (str): Error message
+            count (int): Number of identical errors this result stands for
+        """
+        return cls(success=False, message=message, count=count)
+
+
+_OK = CommandResult(success=True)
+
+
+@dataclass
+class RepeatedOutput:
+    """Output of a repeated program, with its repeating part kept folded.
+
+    Lines are complete output lines, newline included: ``prefix``, then
+    ``cycle`` repeated ``cycles`` times, then ``suffix``.
+    """
+
+    prefix: list[str]
+    cycle: list[str]
+    cycles: int
+    suffix: list[str]
+    failures: int = 0
+
+    @property
+    def line_count(self) -> int:
+        """Number of output lines once expanded."""
+        return len(self.prefix) + len(self.cycle) * self.cycles + len(self.suffix)
+
+    def blocks(self, block_lines: int = BLOCK_LINES) -> Iterator[str]:
+        """Yield the expanded output in blocks of about ``block_lines`` lines."""
+        if self.prefix:
+            yield "".join(self.prefix)
+        if self.cycle and self.cycles:
+            per_block = max(1, block_lines // len(self.cycle))
+            yield from repeat_blocks("".join(self.cycle), self.cycles, per_block)
+        if self.suffix:
+            yield "".join(self.suffix)
+
+    def write_to(
+        self, write: Callable[[str], None], block_lines: int = BLOCK_LINES
+    ) -> None:
+        """Write the expanded output in blocks of about ``block_lines`` lines."""
+        for block in self.blocks(block_lines):
+            write(block)
+
+
+def repeat_blocks(text: str, count: int, per_block: int = BLOCK_LINES) -> Iterator[str]:
+    """Yield ``text`` repeated ``count`` times, ``per_block`` copies at a time.
+
+    Keeps huge repeat counts from being built as one string.
+    """
+    while count > per_block:
+        yield text * per_block
+        count -= per_block
+    if count:
+        yield text * count
@@ -1,15 +1,38 @@
 """Mars rover with movement and positioning logic."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from mars_rover.models import Direction, Position, TableBounds
 from mars_rover.exceptions import RoverNotPlacedException
 from mars_rover.messages import ErrorMessages
+from mars_rover.recorder import Opcode
 from mars_rover.result import CommandResult
+from mars_rover.status import Status, format_status
+
+if TYPE_CHECKING:
+    from mars_rover.obstacles import Obstacles
+    from mars_rover.recorder import Recorder
+    from mars_rover.world import RoverSlot
 
 
 class Rover:
-    """A Mars rover that can be positioned and moved around an empty table."""
+    """A Mars rover that can be positioned and moved around a table.
+
+    The table is empty unless an ``ObstacleGrid`` or ``SparseObstacleGrid``
+    of blocked cells is given.
+    Rovers sharing a ``World`` get a ``RoverSlot`` that keeps the world's
+    occupancy index up to date and rejects cells held by other rovers.
+    A ``Recorder``, if given, receives every PLACE, MOVE, LEFT and RIGHT.
+    """
+
+    __slots__ = (
+        "bounds",
+        "position",
+        "direction",
+        "obstacles",
+        "occupancy",
+        "recorder",
+    )
 
     _MOVEMENT_CHANGES = {
         Direction.NORTH: (0, 1),
@@ -23,10 +46,45 @@ class Rover:
         bounds: TableBounds,
         position: Optional[Position] = None,
         direction: Optional[Direction] = None,
+        obstacles: Optional["Obstacles"] = None,
+        occupancy: Optional["RoverSlot"] = None,
+        recorder: Optional["Recorder"] = None,
     ):
         self.bounds = bounds
         self.position = position
         self.direction = direction
+        self.obstacles = obstacles
+        self.occupancy = occupancy
+        self.recorder = recorder
+
+    def try_place(self, x: int, y: int, direction: Direction) -> int:
+        """Place rover without building a result object.
+
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+            direction (Direction): Facing direction
+
+        Returns:
+            Status.OK, Status.POSITION_OUT_OF_BOUNDS, Status.POSITION_BLOCKED or
+            Status.POSITION_OCCUPIED
+        """
+        pos = Position(x, y)
+        if not self.bounds.contains(pos):
+            status = Status.POSITION_OUT_OF_BOUNDS
+        elif self.obstacles is not None and self.obstacles.is_blocked(x, y):
+            status = Status.POSITION_BLOCKED
+        elif self.occupancy is not None and self.occupancy.is_occupied(x, y):
+            status = Status.POSITION_OCCUPIED
+        else:
+            if self.occupancy is not None:
+                self.occupancy.moved(self.position, pos)
+            self.position = pos
+            self.direction = direction
+            status = Status.OK
+        if self.recorder is not None:
+            self.recorder.record(x, y, direction, Opcode.PLACE, status)
+        return status
 
     def place(self, x: int, y: int, direction: Direction) -> CommandResult:
         """Place rover at specified position and direction.
@@ -39,13 +97,9 @@ class Rover:
         Returns:
             CommandResult indicating success or failure
         """
-        pos = Position(x, y)
-        if not self.bounds.contains(pos):
-            return CommandResult.error(
-                ErrorMessages.POSITION_OUT_OF_BOUNDS.format(x=x, y=y)
-            )
-        self.position = pos
-        self.direction = direction
+        status = self.try_place(x, y, direction)
+        if status:
+            return CommandResult.error(format_status(status, x, y))
         return CommandResult.ok()
 
     def _ensure_rover_is_placed(self) -> None:
@@ -57,22 +111,138 @@ class Rover:
         if self.position is None or self.direction is None:
             raise RoverNotPlacedException(ErrorMessages.ROVER_NOT_PLACED)
 
+    @staticmethod
+    def _result(status: int) -> CommandResult:
+        """Convert a status code to the exception-based API's result.
+
+        Raises:
+            RoverNotPlacedException: If status is Status.ROVER_NOT_PLACED
+        """
+        if status == Status.OK:
+            return CommandResult.ok()
+        if status == Status.ROVER_NOT_PLACED:
+            raise RoverNotPlacedException(ErrorMessages.ROVER_NOT_PLACED)
+        return CommandResult.error(format_status(status))
+
+    def try_move(self) -> int:
+        """Move rover one unit forward without raising.
+
+        Returns:
+            Status.OK, Status.MOVE_OUT_OF_BOUNDS, Status.MOVE_BLOCKED,
+            Status.MOVE_COLLISION or Status.ROVER_NOT_PLACED
+        """
+        if self.position is None or self.direction is None:
+            return Status.ROVER_NOT_PLACED
+        dx, dy = self._MOVEMENT_CHANGES[self.direction]
+        x, y = self.position.x + dx, self.position.y + dy
+        if not (
+            self.bounds.min_x <= x <= self.bounds.max_x
+            and self.bounds.min_y <= y <= self.bounds.max_y
+        ):
+            status = Status.MOVE_OUT_OF_BOUNDS
+        elif self.obstacles is not None and self.obstacles.is_blocked(x, y):
+            status = Status.MOVE_BLOCKED
+        elif self.occupancy is not None and self.occupancy.is_occupied(x, y):
+            status = Status.MOVE_COLLISION
+        else:
+            new_pos = Position(x, y)
+            if self.occupancy is not None:
+                self.occupancy.moved(self.position, new_pos)
+            self.position = new_pos
+            status = Status.OK
+        if self.recorder is not None:
+            pos = self.position
+            self.recorder.record(pos.x, pos.y, self.direction, Opcode.MOVE, status)
+        return status
+
     def move(self) -> CommandResult:
         """Move rover one unit forward in current direction.
 
         Returns:
             CommandResult indicating success or failure
 
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        return self._result(self.try_move())
+
+    def move_many(self, count: int) -> CommandResult:
+        """Move rover up to ``count`` units forward in a single step.
+
+        Equivalent to ``count`` calls to ``move``: the rover stops at the
+        table edge or before the first obstacle or other rover, and every
+        remaining move is rejected.
+
+        Args:
+            count (int): Number of moves
+
+        Returns:
+            CommandResult indicating success, or an error whose count is the
+            number of rejected moves
+
         Raises:
             RoverNotPlacedException: If rover has not been placed
         """
         self._ensure_rover_is_placed()
         dx, dy = self._MOVEMENT_CHANGES[self.direction]
-        new_pos = Position(self.position.x + dx, self.position.y + dy)
-        if self.bounds.contains(new_pos):
+        x, y = self.position.x, self.position.y
+        if dx > 0:
+            room = self.bounds.max_x - x
+        elif dx < 0:
+            room = x - self.bounds.min_x
+        elif dy > 0:
+            room = self.bounds.max_y - y
+        else:
+            room = y - self.bounds.min_y
+        steps = max(0, min(count, room))
+        status = Status.MOVE_OUT_OF_BOUNDS
+        if self.obstacles is not None or self.occupancy is not None:
+            steps, status = self._clear_steps(x, y, dx, dy, steps, status)
+        if steps:
+            new_pos = Position(x + dx * steps, y + dy * steps)
+            if self.occupancy is not None:
+                self.occupancy.moved(self.position, new_pos)
             self.position = new_pos
-            return CommandResult.ok()
-        return CommandResult.error(ErrorMessages.MOVE_OUT_OF_BOUNDS)
+        rejected = count - steps
+        if self.recorder is not None:
+            self.recorder.record_moves(
+                x, y, self.direction, count, steps, status if rejected else Status.OK
+            )
+        if rejected:
+            return CommandResult.error(format_status(status), rejected)
+        return CommandResult.ok()
+
+    def _clear_steps(
+        self, x: int, y: int, dx: int, dy: int, steps: int, status: int
+    ) -> tuple[int, int]:
+        """Shorten a run of steps to stop before the first blocked cell.
+
+        Returns:
+            (steps, status of the rejected moves)
+        """
+        if self.obstacles is not None:
+            blocked = self.obstacles.first_blocked(x, y, dx, dy, steps)
+            if blocked is not None:
+                steps, status = blocked - 1, Status.MOVE_BLOCKED
+        if self.occupancy is not None:
+            occupied = self.occupancy.first_occupied(x, y, dx, dy, steps)
+            if occupied is not None:
+                steps, status = occupied - 1, Status.MOVE_COLLISION
+        return steps, status
+
+    def try_left(self) -> int:
+        """Rotate rover 90° counter-clockwise without raising.
+
+        Returns:
+            Status.OK or Status.ROVER_NOT_PLACED
+        """
+        if self.position is None or self.direction is None:
+            return Status.ROVER_NOT_PLACED
+        self.direction = self.direction.left()
+        if self.recorder is not None:
+            pos = self.position
+            self.recorder.record(pos.x, pos.y, self.direction, Opcode.LEFT, Status.OK)
+        return Status.OK
 
     def left(self) -> CommandResult:
         """Rotate rover 90° counter-clockwise.
@@ -83,13 +253,41 @@ class Rover:
         Raises:
             RoverNotPlacedException: If rover has not been placed
         """
-        self._ensure_rover_is_placed()
-        self.direction = self.direction.left()
-        return CommandResult.ok()
+        return self._result(self.try_left())
+
+    def try_right(self) -> int:
+        """Rotate rover 90° clockwise without raising.
+
+        Returns:
+            Status.OK or Status.ROVER_NOT_PLACED
+        """
+        if self.position is None or self.direction is None:
+            return Status.ROVER_NOT_PLACED
+        self.direction = self.direction.right()
+        if self.recorder is not None:
+            pos = self.position
+            self.recorder.record(pos.x, pos.y, self.direction, Opcode.RIGHT, Status.OK)
+        return Status.OK
 
     def right(self) -> CommandResult:
         """Rotate rover 90° clockwise.
 
+        Returns:
+            CommandResult indicating success
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        return self._result(self.try_right())
+
+    def rotate(self, quarter_turns: int) -> CommandResult:
+        """Rotate rover by a number of 90° clockwise turns.
+
+        A recorder sees the net turns: one LEFT, or one or two RIGHTs.
+
+        Args:
+            quarter_turns (int): Net turns; negative values turn left
+
         Returns:
             CommandResult indicating success
 
@@ -97,9 +295,27 @@ class Rover:
             RoverNotPlacedException: If rover has not been placed
         """
         self._ensure_rover_is_placed()
-        self.direction = self.direction.right()
+        if self.recorder is None:
+            self.direction = self.direction.rotate(quarter_turns)
+            return CommandResult.ok()
+        turns = quarter_turns % 4
+        if turns == 3:
+            self.try_left()
+        else:
+            for _ in range(turns):
+                self.try_right()
         return CommandResult.ok()
 
+    def try_report(self) -> Optional[str]:
+        """Report current position and direction without raising.
+
+        Returns:
+            Report string, or None if the rover has not been placed
+        """
+        if self.position is None or self.direction is None:
+            return None
+        return f"{self.position.x},{self.position.y},{self.direction.value}"
+
     def report(self) -> str:
         """Report current position and direction.
 
@@ -0,0 +1,222 @@
+"""Multiprocess runner for directories of independent mission files."""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+OUTPUT_SUFFIX = ".out"
+SUMMARY_FILE = "summary.json"
+
+_parser: Optional[CommandParser] = None
+
+
+@dataclass
+class MissionResult:
+    """Outcome of running one mission file."""
+
+    path: str
+    output: str
+    commands: int
+    failures: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def find_missions(target: str) -> list[str]:
+    """Return mission files in a directory, or matching a glob pattern.
+
+    Args:
+        target (str): Directory or glob pattern
+
+    Returns:
+        Sorted list of file paths
+    """
+    if os.path.isdir(target):
+        paths = [os.path.join(target, name) for name in os.listdir(target)]
+    else:
+        paths = glob.glob(target)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def _output_name(path: str) -> str:
+    """Return the name of a mission file's output in the output directory."""
+    return os.path.basename(path) + OUTPUT_SUFFIX
+
+
+def _init_worker() -> None:
+    global _parser
+    _parser = CommandParser()
+
+
+def run_mission(
+    path: str, output_dir: str, bounds: TableBounds, compiled: bool = False
+) -> MissionResult:
+    """Run one mission file with a fresh rover and write its output.
+
+    Args:
+        path (str): Mission file
+        output_dir (str): Directory for the ``.out`` file
+        bounds (TableBounds): Table bounds
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+
+    Returns:
+        MissionResult for the file; if the file cannot be read, decoded or
+        written, its error is recorded instead of raised, so one bad file
+        does not stop the others
+    """
+    parser = _parser or CommandParser()
+    output = os.path.join(output_dir, _output_name(path))
+    start = time.perf_counter()
+    try:
+        with (
+            open(path, encoding="utf-8") as in_stream,
+            open(output, "w", encoding="utf-8") as out_stream,
+        ):
+            out = OutputBuffer(out_stream)
+            summary = run_batch(parser, Rover(bounds=bounds), in_stream, out, compiled)
+            out.flush()
+    except (OSError, ValueError) as e:
+        return MissionResult(
+            path=path,
+            output=output,
+            commands=0,
+            failures=0,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return MissionResult(
+        path=path,
+        output=output,
+        commands=summary.commands,
+        failures=summary.failures,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def check_output_names(paths: list[str]) -> None:
+    """Check that no two mission files write the same output file.
+
+    Args:
+        paths (list[str]): Mission files
+
+    Raises:
+        ValueError: If two mission files would write the same output file
+    """
+    owners: dict[str, str] = {}
+    for path in paths:
+        other = owners.setdefault(_output_name(path), path)
+        if other != path:
+            raise ValueError(
+                f"Mission files {other} and {path} share the output file "
+                f"{_output_name(path)}"
+            )
+
+
+def run_missions(
+    paths: list[str],
+    output_dir: str,
+    bounds: TableBounds,
+    workers: Optional[int] = None,
+    compiled: bool = False,
+) -> dict:
+    """Shard mission files across a process pool.
+
+    Args:
+        paths (list[str]): Mission files
+        output_dir (str): Directory for per-file outputs and the summary
+        bounds (TableBounds): Table bounds
+        workers (Optional[int]): Number of processes; defaults to CPU count
+        compiled (bool): Fold MOVE/LEFT/RIGHT runs before execution
+
+    Returns:
+        Aggregate summary, also written to ``SUMMARY_FILE`` in output_dir;
+        ``errors`` maps each file that could not be run to its error
+
+    Raises:
+        ValueError: If two mission files would write the same output file
+    """
+    check_output_names(paths)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = list(
+            pool.map(
+                run_mission,
+                paths,
+                [output_dir] * len(paths),
+                [bounds] * len(paths),
+                [compiled] * len(paths),
+                chunksize=chunksize,
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    commands = sum(r.commands for r in results)
+    summary = {
+        "files": len(results),
+        "workers": workers,
+        "commands": commands,
+        "failures": sum(r.failures for r in results),
+        "errors": {r.path: r.error for r in results if r.error is not None},
+        "seconds": elapsed,
+        "commands_per_second": commands / elapsed if elapsed else 0.0,
+        "missions": [asdict(r) for r in results],
+    }
+    with open(os.path.join(output_dir, SUMMARY_FILE), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover run``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover run", description="Run mission files in parallel"
+    )
+    arg_parser.add_argument("target", help="directory or glob of mission files")
+    arg_parser.add_argument(
+        "-o", "--output-dir", default="mission_output", help="output directory"
+    )
+    arg_parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="number of processes"
+    )
+    arg_parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="fold runs of MOVE/LEFT/RIGHT before execution",
+    )
+    args = arg_parser.parse_args(argv)
+
+    paths = find_missions(args.target)
+    if not paths:
+        arg_parser.error(f"no mission files found: {args.target}")
+
+    try:
+        check_output_names(paths)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    summary = run_missions(
+        paths, args.output_dir, TableBounds(), args.workers, args.compile
+    )
+    for path, error in summary["errors"].items():
+        sys.stderr.write(f"Error: {path}: {error}\n")
+    sys.stdout.write(
+        f"{summary['files']} files, {summary['commands']} commands, "
+        f"{summary['failures']} failures in {summary['seconds']:.2f}s "
+        f"({summary['commands_per_second']:.0f} commands/sec)\n"
+    )
+    if summary["failures"] or summary["errors"]:
+        sys.exit(1)
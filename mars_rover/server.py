@@ -0,0 +1,155 @@
+"""asyncio network server hosting one rover session per connection."""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from mars_rover.batch import EXIT_COMMAND, execute_commands
+from mars_rover.commands import FailedCommand
+from mars_rover.exceptions import RoverException
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+DEFAULT_PORT = 7878
+DEFAULT_IDLE_TIMEOUT = 300.0
+MAX_LINE_LENGTH = 1024
+WRITE_BUFFER_LIMIT = 1 << 16
+IDLE_TIMEOUT_MESSAGE = b"Error: idle timeout\n"
+LINE_TOO_LONG_MESSAGE = b"Error: line too long\n"
+
+
+class RoverServer:
+    """Serves rover sessions over TCP or Unix sockets.
+
+    Each connection gets its own ``Rover``; the parser and table bounds are
+    shared. Commands are read one line at a time and may be pipelined: only
+    REPORT output and errors are written back, with no prompts. Output is
+    drained once the write buffer passes ``WRITE_BUFFER_LIMIT``, so a client
+    that stops reading stops its session from reading further commands.
+    Per-session memory is bounded by ``MAX_LINE_LENGTH`` and the write limit.
+    """
+
+    def __init__(
+        self,
+        bounds: TableBounds,
+        parser: CommandParser,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self.bounds = bounds
+        self.parser = parser
+        self.idle_timeout = idle_timeout
+        self.sessions = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run one rover session until EOF, EXIT or idle timeout."""
+        self.sessions += 1
+        rover = Rover(bounds=self.bounds)
+        transport = writer.transport
+
+        def write(text: str) -> None:
+            writer.write(text.encode())
+
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    writer.write(IDLE_TIMEOUT_MESSAGE)
+                    break
+                except ValueError:
+                    writer.write(LINE_TOO_LONG_MESSAGE)
+                    break
+                if not line:
+                    break
+
+                user_input = line.decode(errors="replace").strip()
+                if not user_input:
+                    continue
+                if user_input.upper() == EXIT_COMMAND:
+                    break
+                try:
+                    command = self.parser.parse(user_input)
+                except RoverException as e:
+                    command = FailedCommand(e)
+                execute_commands((command,), rover, write)
+
+                if transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        unix_path: Optional[str] = None,
+    ) -> list[asyncio.AbstractServer]:
+        """Start listening on TCP and/or a Unix socket.
+
+        Returns:
+            The started servers
+        """
+        servers = []
+        if port is not None:
+            servers.append(
+                await asyncio.start_server(
+                    self.handle, host, port, limit=MAX_LINE_LENGTH, backlog=1024
+                )
+            )
+        if unix_path is not None:
+            servers.append(
+                await asyncio.start_unix_server(
+                    self.handle, unix_path, limit=MAX_LINE_LENGTH, backlog=1024
+                )
+            )
+        return servers
+
+
+async def serve(
+    host: Optional[str],
+    port: Optional[int],
+    unix_path: Optional[str],
+    idle_timeout: Optional[float],
+) -> None:
+    """Serve rover sessions forever."""
+    server = RoverServer(TableBounds(), CommandParser(), idle_timeout)
+    servers = await server.start(host, port, unix_path)
+    await asyncio.gather(*(s.serve_forever() for s in servers))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for ``python -m mars_rover serve``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="mars_rover serve", description="Serve rover sessions over sockets"
+    )
+    arg_parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    arg_parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="TCP port (0 to disable TCP)"
+    )
+    arg_parser.add_argument("--unix", default=None, help="Unix socket path")
+    arg_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="close sessions idle for this many seconds",
+    )
+    args = arg_parser.parse_args(argv)
+
+    port = args.port or None
+    if port is None and args.unix is None:
+        arg_parser.error("nothing to listen on: give --port or --unix")
+    try:
+        asyncio.run(serve(args.host, port, args.unix, args.idle_timeout))
+    except KeyboardInterrupt:
+        pass
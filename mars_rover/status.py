@@ -0,0 +1,46 @@
+"""Status codes for the exception-free execution API."""
+
+from typing import Optional
+
+from mars_rover.messages import ErrorMessages
+
+
+class Status:
+    """Status codes returned by the ``try_*`` rover methods.
+
+    Codes are plain ints; ``OK`` is falsy so callers can test ``if status:``.
+    """
+
+    OK = 0
+    ROVER_NOT_PLACED = 1
+    POSITION_OUT_OF_BOUNDS = 2
+    MOVE_OUT_OF_BOUNDS = 3
+    POSITION_BLOCKED = 4
+    MOVE_BLOCKED = 5
+    POSITION_OCCUPIED = 6
+    MOVE_COLLISION = 7
+
+
+_TEMPLATES = {
+    Status.ROVER_NOT_PLACED: ErrorMessages.ROVER_NOT_PLACED,
+    Status.POSITION_OUT_OF_BOUNDS: ErrorMessages.POSITION_OUT_OF_BOUNDS,
+    Status.MOVE_OUT_OF_BOUNDS: ErrorMessages.MOVE_OUT_OF_BOUNDS,
+    Status.POSITION_BLOCKED: ErrorMessages.POSITION_BLOCKED,
+    Status.MOVE_BLOCKED: ErrorMessages.MOVE_BLOCKED,
+    Status.POSITION_OCCUPIED: ErrorMessages.POSITION_OCCUPIED,
+    Status.MOVE_COLLISION: ErrorMessages.MOVE_COLLISION,
+}
+
+
+def format_status(status: int, x: Optional[int] = None, y: Optional[int] = None) -> str:
+    """Format the error message for a status code.
+
+    Args:
+        status (int): Non-OK status code
+        x (Optional[int]): X coordinate, for PLACE errors
+        y (Optional[int]): Y coordinate, for PLACE errors
+
+    Returns:
+        The message the exception-based API would have produced
+    """
+    return _TEMPLATES[status].format(x=x, y=y)
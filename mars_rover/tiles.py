@@ -0,0 +1,152 @@
+"""Sparse per-cell storage in square tiles allocated on demand."""
+
+from array import array
+from typing import Iterator, Optional
+
+from mars_rover.models import TableBounds
+
+DEFAULT_TILE_SHIFT = 6
+
+
+class TiledGrid:
+    """Integer values per cell, zero unless set, for tables of any size.
+
+    The plane is cut into square tiles of ``2 ** tile_shift`` cells a side;
+    a tile is an ``array`` of ``typecode`` allocated on its first non-zero
+    write and kept in a dict keyed by tile coordinates, so memory follows
+    the cells actually used rather than the table area. Coordinates may be
+    negative.
+    """
+
+    def __init__(self, typecode: str = "q", tile_shift: int = DEFAULT_TILE_SHIFT):
+        if tile_shift < 0:
+            raise ValueError("Tile shift must not be negative")
+        self.typecode = typecode
+        self.tile_shift = tile_shift
+        self._mask = (1 << tile_shift) - 1
+        self._tile_cells = 1 << 2 * tile_shift
+        self.tiles: dict[tuple[int, int], array] = {}
+
+    def _offset(self, x: int, y: int) -> int:
+        return (y & self._mask) << self.tile_shift | x & self._mask
+
+    def get(self, x: int, y: int) -> int:
+        """Return the value of a cell."""
+        shift = self.tile_shift
+        tile = self.tiles.get((x >> shift, y >> shift))
+        if tile is None:
+            return 0
+        return tile[self._offset(x, y)]
+
+    def tile(self, x: int, y: int) -> array:
+        """Return the tile holding a cell, allocating it if needed."""
+        shift = self.tile_shift
+        key = (x >> shift, y >> shift)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.tiles[key] = array(self.typecode, [0]) * self._tile_cells
+        return tile
+
+    def set(self, x: int, y: int, value: int) -> None:
+        """Set the value of a cell, allocating its tile if needed."""
+        shift = self.tile_shift
+        if not value and (x >> shift, y >> shift) not in self.tiles:
+            return
+        self.tile(x, y)[self._offset(x, y)] = value
+
+    def add(self, x: int, y: int, delta: int = 1) -> int:
+        """Add to the value of a cell and return the new value."""
+        value = self.get(x, y) + delta
+        self.set(x, y, value)
+        return value
+
+    def first_nonzero(
+        self, x: int, y: int, dx: int, dy: int, steps: int
+    ) -> Optional[int]:
+        """Return the first step of a straight run that lands on a non-zero cell.
+
+        Steps ``k`` from 1 to ``steps`` visit ``(x + dx * k, y + dy * k)``,
+        with ``(dx, dy)`` a unit move. Runs longer than a tile side check only
+        the allocated tiles they cross, so the cost does not grow with the run.
+
+        Returns:
+            The step, or None if every cell on the run is zero
+        """
+        size = 1 << self.tile_shift
+        if steps <= size:
+            for k in range(1, steps + 1):
+                if self.get(x + dx * k, y + dy * k):
+                    return k
+            return None
+        first = None
+        for (tile_x, tile_y), tile in self.tiles.items():
+            low, high = 1, steps if first is None else first - 1
+            axes = ((x, dx, tile_x * size), (y, dy, tile_y * size))
+            for start, delta, tile_start in axes:
+                tile_end = tile_start + size - 1
+                if delta:
+                    # Steps at which the run is inside the tile on this axis.
+                    a, b = (tile_start - start) * delta, (tile_end - start) * delta
+                    low, high = max(low, min(a, b)), min(high, max(a, b))
+                elif not tile_start <= start <= tile_end:
+                    high = 0
+            for k in range(low, high + 1):
+                if tile[self._offset(x + dx * k, y + dy * k)]:
+                    first = k
+                    break
+        return first
+
+    def runs(
+        self, x: int, y: int, dx: int, dy: int, steps: int
+    ) -> Iterator[tuple[array, slice, int]]:
+        """Yield the pieces of a straight run that fall in each tile.
+
+        Steps ``k`` from 1 to ``steps`` visit ``(x + dx * k, y + dy * k)``,
+        with ``(dx, dy)`` a unit move. Tiles are allocated as the run
+        reaches them, so callers can update whole pieces in place.
+
+        Yields:
+            (tile, slice of the tile's offsets in step order, first step)
+        """
+        size = 1 << self.tile_shift
+        mask = self._mask
+        stride = dx + dy * size
+        k = 1
+        while k <= steps:
+            cx, cy = x + dx * k, y + dy * k
+            local = (cx if dx else cy) & mask
+            room = size - local if dx + dy > 0 else local + 1
+            n = min(room, steps - k + 1)
+            start = self._offset(cx, cy)
+            stop = start + stride * n
+            cells = slice(start, stop if stop >= 0 else None, stride)
+            yield self.tile(cx, cy), cells, k
+            k += n
+
+    def items(self) -> Iterator[tuple[int, int, int]]:
+        """Yield (x, y, value) for every non-zero cell, tile by tile."""
+        shift, mask = self.tile_shift, self._mask
+        for (tile_x, tile_y), tile in self.tiles.items():
+            for offset, value in enumerate(tile):
+                if value:
+                    x = tile_x << shift | offset & mask
+                    y = tile_y << shift | offset >> shift
+                    yield x, y, value
+
+    def count_nonzero(self) -> int:
+        """Return the number of non-zero cells."""
+        return sum(len(tile) - tile.count(0) for tile in self.tiles.values())
+
+    def extent(self) -> Optional[TableBounds]:
+        """Return bounds covering every allocated tile, or None if there are none."""
+        if not self.tiles:
+            return None
+        shift = self.tile_shift
+        tile_xs = [tile_x for tile_x, _ in self.tiles]
+        tile_ys = [tile_y for _, tile_y in self.tiles]
+        return TableBounds(
+            min(tile_xs) << shift,
+            min(tile_ys) << shift,
+            (max(tile_xs) + 1 << shift) - 1,
+            (max(tile_ys) + 1 << shift) - 1,
+        )
@@ -0,0 +1,112 @@
+"""Fixed-size ring buffer of a rover's most recent states."""
+
+from array import array
+from typing import Callable, Iterator, Optional, TextIO
+
+from mars_rover.models import Direction
+from mars_rover.recorder import Opcode
+from mars_rover.status import Status
+
+DEFAULT_CAPACITY = 1024
+_SLOTS = 3
+
+_DIRECTIONS = tuple(Direction)
+# Packed metadata: direction code in bits 7-8, opcode in bits 4-6, status in 0-3.
+_DIRECTION_BITS = {direction: code << 7 for code, direction in enumerate(_DIRECTIONS)}
+_OPCODE_NAMES = {
+    value: name for name, value in vars(Opcode).items() if name.isupper()
+}
+_STATUS_NAMES = {
+    value: name for name, value in vars(Status).items() if name.isupper()
+}
+
+
+class TrajectoryLog:
+    """Recorder keeping the last ``capacity`` commands of a rover.
+
+    Entries are stored in one preallocated ``array`` of 64-bit ints, three
+    slots per entry: x, y, and direction, opcode and status packed into one
+    field. Memory is fixed and recording allocates nothing. Rejected
+    commands are recorded too; ``on_error``, if given, is called with the
+    log after each.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        on_error: Optional[Callable[["TrajectoryLog"], None]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Trajectory capacity must be at least 1")
+        self.capacity = capacity
+        self.on_error = on_error
+        self._buffer = array("q", bytes(8 * _SLOTS * capacity))
+        self._end = _SLOTS * capacity
+        self._next = 0
+        self._laps = 0
+        # Moves of long runs that were never stored, counted in ``count``.
+        self._skipped = 0
+
+    def record(
+        self, x: int, y: int, direction: Direction, opcode: int, status: int
+    ) -> None:
+        """Store one command's resulting state."""
+        buffer = self._buffer
+        i = self._next
+        buffer[i] = x
+        buffer[i + 1] = y
+        buffer[i + 2] = _DIRECTION_BITS[direction] | opcode << 4 | status
+        i += _SLOTS
+        if i == self._end:
+            i = 0
+            self._laps += 1
+        self._next = i
+        if status and self.on_error is not None:
+            self.on_error(self)
+
+    def record_moves(
+        self, x: int, y: int, direction: Direction, count: int, steps: int, status: int
+    ) -> None:
+        """Store a run of MOVEs as one entry per move, keeping only the tail."""
+        dx = (direction is Direction.EAST) - (direction is Direction.WEST)
+        dy = (direction is Direction.NORTH) - (direction is Direction.SOUTH)
+        on_error, self.on_error = self.on_error, None
+        try:
+            for k in range(max(0, count - self.capacity), count):
+                step = min(k + 1, steps)
+                move_status = Status.OK if k < steps else status
+                self.record(
+                    x + dx * step, y + dy * step, direction, Opcode.MOVE, move_status
+                )
+        finally:
+            self.on_error = on_error
+        self._skipped += max(0, count - self.capacity)
+        if status and on_error is not None:
+            on_error(self)
+
+    @property
+    def count(self) -> int:
+        """Number of commands recorded so far, including overwritten ones."""
+        return self._laps * self.capacity + self._next // _SLOTS + self._skipped
+
+    def __len__(self) -> int:
+        return self.capacity if self._laps else self._next // _SLOTS
+
+    def entries(self) -> Iterator[tuple[int, int, Direction, int, int]]:
+        """Yield (x, y, direction, opcode, status), oldest first."""
+        buffer = self._buffer
+        start = self._next if self._laps else 0
+        for k in range(len(self)):
+            i = (start + _SLOTS * k) % self._end
+            x, y, meta = buffer[i], buffer[i + 1], buffer[i + 2]
+            yield x, y, _DIRECTIONS[meta >> 7], meta >> 4 & 7, meta & 15
+
+    def dump(self, stream: TextIO) -> None:
+        """Write the entries, oldest first, as ``OPCODE X,Y,F STATUS`` lines."""
+        stream.write(f"Last {len(self)} of {self.count} rover commands:\n")
+        for x, y, direction, opcode, status in self.entries():
+            stream.write(
+                f"{_OPCODE_NAMES[opcode]} {x},{y},{direction.value} "
+                f"{_STATUS_NAMES[status]}\n"
+            )
+        stream.flush()
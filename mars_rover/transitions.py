@@ -0,0 +1,295 @@
+"""Precomputed state-transition tables and a table-driven rover."""
+
+from array import array
+from functools import lru_cache
+from typing import Optional
+
+from mars_rover.exceptions import RoverNotPlacedException
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.result import CommandResult
+from mars_rover.status import Status
+
+MAX_STATES = 1 << 24
+
+_DIRECTIONS = tuple(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+_MOVEMENT_CHANGES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+_OK = CommandResult.ok()
+_MOVE_REJECTED = CommandResult.error(ErrorMessages.MOVE_OUT_OF_BOUNDS)
+
+
+class TransitionTables:
+    """Next-state tables for every (x, y, direction) state on a table.
+
+    A state is encoded as ``((y - min_y) * width + (x - min_x)) * 4 + d``
+    where ``d`` is the direction code in clockwise order (N=0, E=1, S=2,
+    W=3). ``move``, ``left`` and ``right`` are ``array("q")`` tables of
+    next states. ``move_rejected[state]`` is 1 when a MOVE from that state
+    would leave the table, in which case ``move[state] == state``.
+    """
+
+    def __init__(self, bounds: TableBounds):
+        if not bounds.is_finite:
+            raise ValueError(f"Transition tables need finite bounds: {bounds}")
+        width = bounds.max_x - bounds.min_x + 1
+        height = bounds.max_y - bounds.min_y + 1
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Table bounds are empty: {bounds}")
+        states = width * height * 4
+        if states > MAX_STATES:
+            raise ValueError(f"Table has {states} states, more than {MAX_STATES}")
+
+        self.bounds = bounds
+        self.width = width
+        self.height = height
+        self.states = states
+
+        # Each direction is a strided copy of the identity table shifted by
+        # one step, after which the edge it faces keeps its own states.
+        row = 4 * width
+        last_row = states - row
+        identity = array("q", range(states))
+        move = identity[:]
+        rejected = bytearray(states)
+        move[0:last_row:4] = identity[row::4]
+        rejected[last_row::4] = b"\x01" * width
+        east_edge = slice(row - 3, None, row)
+        move[slice(1, states - 4, 4)] = identity[5::4]
+        move[east_edge] = identity[east_edge]
+        rejected[east_edge] = b"\x01" * height
+        move[slice(row + 2, None, 4)] = identity[2:last_row:4]
+        rejected[2:row:4] = b"\x01" * width
+        move[7::4] = identity[slice(3, states - 4, 4)]
+        move[3::row] = identity[3::row]
+        rejected[3::row] = b"\x01" * height
+
+        left = identity[:]
+        right = identity[:]
+        for d in range(4):
+            left[d::4] = identity[slice((d + 3) % 4, None, 4)]
+            right[d::4] = identity[slice((d + 1) % 4, None, 4)]
+
+        self.move = move
+        self.move_rejected = bytes(rejected)
+        self.left = left
+        self.right = right
+
+    def encode(self, x: int, y: int, direction: Direction) -> int:
+        """Return the state index for a position and direction."""
+        cell = (y - self.bounds.min_y) * self.width + (x - self.bounds.min_x)
+        return cell * 4 + _DIRECTION_CODES[direction]
+
+    def decode(self, state: int) -> tuple[int, int, Direction]:
+        """Return the (x, y, direction) of a state index."""
+        cell, d = divmod(state, 4)
+        row, col = divmod(cell, self.width)
+        return col + self.bounds.min_x, row + self.bounds.min_y, _DIRECTIONS[d]
+
+
+@lru_cache(maxsize=16)
+def transition_tables(bounds: TableBounds) -> TransitionTables:
+    """Return the shared transition tables for a table, building them once.
+
+    Raises:
+        ValueError: If the table is empty or has more than MAX_STATES states
+    """
+    return TransitionTables(bounds)
+
+
+class TableRover:
+    """A rover driven by precomputed transition tables.
+
+    Offers the same API as ``Rover`` but keeps its state as a single table
+    index, so each command is one list lookup. Tables are shared by every
+    ``TableRover`` on the same bounds. Successful results are shared
+    instances and must not be modified.
+    """
+
+    def __init__(
+        self,
+        bounds: TableBounds,
+        position: Optional[Position] = None,
+        direction: Optional[Direction] = None,
+    ):
+        self.bounds = bounds
+        self.tables = transition_tables(bounds)
+        self.state: Optional[int] = None
+        if position is not None and direction is not None:
+            self.state = self.tables.encode(position.x, position.y, direction)
+
+    @property
+    def position(self) -> Optional[Position]:
+        """Current position, or None if not placed."""
+        if self.state is None:
+            return None
+        x, y, _ = self.tables.decode(self.state)
+        return Position(x, y)
+
+    @property
+    def direction(self) -> Optional[Direction]:
+        """Current direction, or None if not placed."""
+        if self.state is None:
+            return None
+        return _DIRECTIONS[self.state % 4]
+
+    def try_place(self, x: int, y: int, direction: Direction) -> int:
+        """Place rover without building a result object.
+
+        Returns:
+            Status.OK or Status.POSITION_OUT_OF_BOUNDS
+        """
+        b = self.bounds
+        if not (b.min_x <= x <= b.max_x and b.min_y <= y <= b.max_y):
+            return Status.POSITION_OUT_OF_BOUNDS
+        self.state = self.tables.encode(x, y, direction)
+        return Status.OK
+
+    def place(self, x: int, y: int, direction: Direction) -> CommandResult:
+        """Place rover at specified position and direction.
+
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+            direction (Direction): Facing direction
+
+        Returns:
+            CommandResult indicating success or failure
+        """
+        b = self.bounds
+        if not (b.min_x <= x <= b.max_x and b.min_y <= y <= b.max_y):
+            return CommandResult.error(
+                ErrorMessages.POSITION_OUT_OF_BOUNDS.format(x=x, y=y)
+            )
+        self.state = self.tables.encode(x, y, direction)
+        return _OK
+
+    def _placed_state(self) -> int:
+        """Return the current state.
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        if self.state is None:
+            raise RoverNotPlacedException(ErrorMessages.ROVER_NOT_PLACED)
+        return self.state
+
+    def try_move(self) -> int:
+        """Move rover one unit forward without raising.
+
+        Returns:
+            Status.OK, Status.MOVE_OUT_OF_BOUNDS or Status.ROVER_NOT_PLACED
+        """
+        state = self.state
+        if state is None:
+            return Status.ROVER_NOT_PLACED
+        if self.tables.move_rejected[state]:
+            return Status.MOVE_OUT_OF_BOUNDS
+        self.state = self.tables.move[state]
+        return Status.OK
+
+    def move(self) -> CommandResult:
+        """Move rover one unit forward in current direction.
+
+        Returns:
+            CommandResult indicating success or failure
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        state = self._placed_state()
+        if self.tables.move_rejected[state]:
+            return _MOVE_REJECTED
+        self.state = self.tables.move[state]
+        return _OK
+
+    def move_many(self, count: int) -> CommandResult:
+        """Move rover up to ``count`` units forward, one table step at a time.
+
+        Returns:
+            CommandResult indicating success, or an error whose count is the
+            number of rejected moves
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        state = self._placed_state()
+        move, rejected = self.tables.move, self.tables.move_rejected
+        for done in range(count):
+            if rejected[state]:
+                self.state = state
+                return CommandResult.error(
+                    ErrorMessages.MOVE_OUT_OF_BOUNDS, count - done
+                )
+            state = move[state]
+        self.state = state
+        return _OK
+
+    def try_left(self) -> int:
+        """Rotate rover 90° counter-clockwise without raising.
+
+        Returns:
+            Status.OK or Status.ROVER_NOT_PLACED
+        """
+        if self.state is None:
+            return Status.ROVER_NOT_PLACED
+        self.state = self.tables.left[self.state]
+        return Status.OK
+
+    def left(self) -> CommandResult:
+        """Rotate rover 90° counter-clockwise.
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        self.state = self.tables.left[self._placed_state()]
+        return _OK
+
+    def try_right(self) -> int:
+        """Rotate rover 90° clockwise without raising.
+
+        Returns:
+            Status.OK or Status.ROVER_NOT_PLACED
+        """
+        if self.state is None:
+            return Status.ROVER_NOT_PLACED
+        self.state = self.tables.right[self.state]
+        return Status.OK
+
+    def right(self) -> CommandResult:
+        """Rotate rover 90° clockwise.
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        self.state = self.tables.right[self._placed_state()]
+        return _OK
+
+    def rotate(self, quarter_turns: int) -> CommandResult:
+        """Rotate rover by a number of 90° clockwise turns.
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        state = self._placed_state()
+        for _ in range(quarter_turns % 4):
+            state = self.tables.right[state]
+        self.state = state
+        return _OK
+
+    def try_report(self) -> Optional[str]:
+        """Report current position and direction, or None if not placed."""
+        if self.state is None:
+            return None
+        x, y, direction = self.tables.decode(self.state)
+        return f"{x},{y},{direction.value}"
+
+    def report(self) -> str:
+        """Report current position and direction.
+
+        Raises:
+            RoverNotPlacedException: If rover has not been placed
+        """
+        x, y, direction = self.tables.decode(self._placed_state())
+        return f"{x},{y},{direction.value}"
@@ -0,0 +1,17 @@
+"""Pydantic models validating external input.
+
+Kept apart from ``models`` so that only callers that validate pay for
+importing pydantic; ``mars_rover.models.PlaceArgs`` loads it on first use.
+"""
+
+from pydantic import BaseModel
+
+from mars_rover.models import Direction
+
+
+class PlaceArgs(BaseModel):
+    """Validate PLACE command arguments."""
+
+    x: int
+    y: int
+    direction: Direction
@@ -0,0 +1,93 @@
+"""Several rovers sharing one table."""
+
+from typing import TYPE_CHECKING, Optional
+
+from mars_rover.models import Position, TableBounds
+from mars_rover.rover import Rover
+
+if TYPE_CHECKING:
+    from mars_rover.obstacles import Obstacles
+    from mars_rover.recorder import Recorder
+
+DEFAULT_ROVER_ID = 0
+
+
+class RoverSlot:
+    """A rover's handle on its world's occupancy index."""
+
+    def __init__(self, world: "World", rover_id: int):
+        self.world = world
+        self.rover_id = rover_id
+        self._cells = world.occupancy
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """Return True if another rover is on the cell."""
+        other = self._cells.get((x, y))
+        return other is not None and other != self.rover_id
+
+    def first_occupied(
+        self, x: int, y: int, dx: int, dy: int, steps: int
+    ) -> Optional[int]:
+        """Return the first step of a run that lands on another rover, or None.
+
+        Runs longer than the number of occupied cells scan those cells instead.
+        """
+        if steps <= len(self._cells):
+            for k in range(1, steps + 1):
+                if self.is_occupied(x + dx * k, y + dy * k):
+                    return k
+            return None
+        first = None
+        for (cx, cy), rover_id in self._cells.items():
+            if rover_id == self.rover_id:
+                continue
+            k = (cx - x) * dx + (cy - y) * dy
+            if 1 <= k <= steps and (cx, cy) == (x + dx * k, y + dy * k):
+                if first is None or k < first:
+                    first = k
+        return first
+
+    def moved(self, old: Optional[Position], new: Position) -> None:
+        """Record that the rover left ``old`` (None if unplaced) for ``new``."""
+        cells = self._cells
+        if old is not None:
+            del cells[(old.x, old.y)]
+        cells[(new.x, new.y)] = self.rover_id
+
+
+class World:
+    """A table shared by rovers addressed by integer ID.
+
+    ``occupancy`` maps each occupied ``(x, y)`` cell to its rover's ID, so
+    collision checks are a dict lookup however many rovers there are.
+    Rovers are created unplaced the first time their ID is used, sharing
+    the world's obstacles and recorder.
+    """
+
+    def __init__(
+        self,
+        bounds: TableBounds,
+        obstacles: Optional["Obstacles"] = None,
+        recorder: Optional["Recorder"] = None,
+    ):
+        self.bounds = bounds
+        self.obstacles = obstacles
+        self.recorder = recorder
+        self.rovers: dict[int, Rover] = {}
+        self.occupancy: dict[tuple[int, int], int] = {}
+
+    def rover(self, rover_id: int = DEFAULT_ROVER_ID) -> Rover:
+        """Return the rover with an ID, creating it if needed."""
+        rover = self.rovers.get(rover_id)
+        if rover is None:
+            rover = self.rovers[rover_id] = Rover(
+                bounds=self.bounds,
+                obstacles=self.obstacles,
+                occupancy=RoverSlot(self, rover_id),
+                recorder=self.recorder,
+            )
+        return rover
+
+    def rover_at(self, x: int, y: int) -> Optional[int]:
+        """Return the ID of the rover on a cell, or None."""
+        return self.occupancy.get((x, y))
@@ -0,0 +1,105 @@
+from io import StringIO
+
+import pytest
+
+from mars_rover.batch import OutputBuffer, parse_lines, run_batch
+from mars_rover.commands import FailedCommand, MoveCommand
+from mars_rover.main import main, run_cli_loop
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+
+class TestOutputBuffer:
+    def test_holds_output_until_flush_size(self):
+        stream = StringIO()
+        out = OutputBuffer(stream, flush_size=10)
+        out.write("abc\n")
+        assert stream.getvalue() == ""
+        out.write("defghij\n")
+        assert stream.getvalue() == "abc\ndefghij\n"
+
+    def test_flush_writes_remaining_output(self):
+        stream = StringIO()
+        out = OutputBuffer(stream)
+        out.write("abc\n")
+        out.flush()
+        assert stream.getvalue() == "abc\n"
+
+    def test_flush_interval(self):
+        stream = StringIO()
+        out = OutputBuffer(stream, flush_interval=0)
+        out.write("abc\n")
+        assert stream.getvalue() == "abc\n"
+
+
+class TestParseLines:
+    def test_skips_blank_lines_and_stops_at_exit(self):
+        lines = ["\n", "MOVE\n", "exit\n", "MOVE"]
+        commands = list(parse_lines(CommandParser(), lines))
+        assert len(commands) == 1
+        assert isinstance(commands[0], MoveCommand)
+
+    def test_invalid_line_becomes_failed_command(self):
+        commands = list(parse_lines(CommandParser(), ["JUMP\n"]))
+        assert isinstance(commands[0], FailedCommand)
+
+
+class TestRunBatch:
+    @pytest.fixture
+    def batch_runner(self):
+        def _run(script):
+            stream = StringIO()
+            out = OutputBuffer(stream)
+            rover = Rover(TableBounds())
+            summary = run_batch(CommandParser(), rover, StringIO(script), out)
+            out.flush()
+            return stream.getvalue(), summary
+
+        return _run
+
+    def test_no_prompts_or_banner(self, batch_runner):
+        output, summary = batch_runner("PLACE 0,0,NORTH\nMOVE\nREPORT\n")
+        assert output == "0,1,NORTH\n"
+        assert summary.commands == 3
+        assert summary.failures == 0
+
+    def test_errors_are_counted(self, batch_runner):
+        output, summary = batch_runner("MOVE\nJUMP\nPLACE 9,9,NORTH\nREPORT\n")
+        assert output.count("Error:") == 4
+        assert summary.failures == 4
+
+    def test_matches_interactive_output(self, batch_runner):
+        script = "MOVE\nLEFT\nREPORT\nPLACE 9,1,EAST\nPLACE 5,1,EAST\nMOVE\nREPORT\n"
+        output, _ = batch_runner(script)
+        interactive = StringIO()
+        rover = Rover(TableBounds())
+        run_cli_loop(CommandParser(), rover, StringIO(script), interactive)
+        lines = interactive.getvalue().replace("> ", "").splitlines()
+        assert output.splitlines() == [line for line in lines[3:-1] if line]
+
+    def test_stops_at_exit(self, batch_runner):
+        output, summary = batch_runner("PLACE 0,0,NORTH\nEXIT\nREPORT\n")
+        assert output == ""
+        assert summary.commands == 1
+
+
+class TestBatchMain:
+    def test_batch_files(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text("PLACE 1,2,EAST\nMOVE\nREPORT\n")
+        main(["--batch", str(mission), str(mission)])
+        assert capsys.readouterr().out == "2,2,EAST\n2,2,EAST\n"
+
+    def test_batch_exit_code_on_failure(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text("MOVE\nREPORT\n")
+        with pytest.raises(SystemExit) as exc:
+            main(["--batch", str(mission)])
+        assert exc.value.code == 1
+        assert "2 of 2 commands failed" in capsys.readouterr().err
+
+    def test_files_require_batch(self, tmp_path):
+        with pytest.raises(SystemExit) as exc:
+            main([str(tmp_path / "mission.txt")])
+        assert exc.value.code == 2
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from mars_rover.bench import (
+    WORKLOADS,
+    BenchResult,
+    compare_to_baseline,
+    generate_workload,
+    main,
+    measure_allocations,
+    run_suite,
+)
+
+
+def _result(relative_speed):
+    return BenchResult("move_heavy", "parse", 10, 1000.0, relative_speed, 1, 2, 3)
+
+
+class TestWorkloads:
+    @pytest.mark.parametrize("name", list(WORKLOADS))
+    def test_deterministic(self, name):
+        lines = generate_workload(name, 200, seed=4)
+        assert len(lines) == 200
+        assert lines == generate_workload(name, 200, seed=4)
+
+
+class TestRunSuite:
+    def test_reports_every_target(self):
+        results = run_suite(count=50, workloads=["error_heavy"])
+        assert [r.target for r in results] == ["parse", "execute", "cli"]
+        for r in results:
+            assert r.commands == 50
+            assert r.ops_per_sec > 0
+            assert r.relative_speed > 0
+            assert r.p50_ns <= r.p99_ns
+
+
+class TestAllocations:
+    def test_shared_commands_allocate_nothing(self):
+        lines = generate_workload("rotate_heavy", 200)
+        parse = measure_allocations("rotate_heavy", "parse", lines)
+        execute = measure_allocations("rotate_heavy", "execute", lines)
+        assert parse.blocks_per_command < 0.1
+        assert parse.bytes_per_command <= execute.bytes_per_command
+
+    def test_main(self, capsys):
+        main(["--allocations", "--count", "50", "--workload", "move_heavy"])
+        out = capsys.readouterr().out
+        assert "B/cmd" in out
+        assert "execute" in out
+
+
+class TestCompareToBaseline:
+    def test_regression_detected(self):
+        baseline = {
+            "results": [
+                {"workload": "move_heavy", "target": "parse", "relative_speed": 0.5}
+            ]
+        }
+        assert compare_to_baseline([_result(0.45)], baseline, 0.2) == []
+        assert len(compare_to_baseline([_result(0.35)], baseline, 0.2)) == 1
+
+    def test_absolute_baseline_rejected(self):
+        baseline = {
+            "results": [
+                {"workload": "move_heavy", "target": "parse", "ops_per_sec": 1000.0}
+            ]
+        }
+        with pytest.raises(ValueError, match="re-record"):
+            compare_to_baseline([_result(0.5)], baseline)
+
+    def test_main_fails_below_baseline(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        entry = {"workload": "move_heavy", "target": "parse", "relative_speed": 1e9}
+        baseline.write_text(json.dumps({"python": "2.7.0", "results": [entry]}))
+        output = tmp_path / "out.json"
+        args = ["--count", "20", "--workload", "move_heavy", "--target", "parse"]
+        with pytest.raises(SystemExit) as exc:
+            main(args + ["--json", str(output), "--baseline", str(baseline)])
+        assert exc.value.code == 1
+        assert json.loads(output.read_text())["results"][0]["commands"] == 20
+        err = capsys.readouterr().err
+        assert "below baseline" in err
+        assert "recorded on Python 2.7.0" in err
@@ -0,0 +1,104 @@
+import random
+from io import BytesIO, StringIO
+
+import pytest
+
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.binary import (
+    MAGIC,
+    OP_MOVE,
+    OP_PLACE,
+    encode_lines,
+    execute_binary,
+    iter_records,
+    iter_text,
+    main,
+)
+from mars_rover.models import Direction, Placement, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+
+def _encode(script):
+    out = BytesIO()
+    encode_lines(CommandParser(), StringIO(script), out)
+    return out.getvalue()
+
+
+def _run_text(script):
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    summary = run_batch(CommandParser(), Rover(TableBounds()), StringIO(script), out)
+    out.flush()
+    return stream.getvalue(), summary
+
+
+def _run_binary(data):
+    parts = []
+    summary = execute_binary(CommandParser(), data, Rover(TableBounds()), parts.append)
+    return "".join(parts), summary
+
+
+class TestEncoding:
+    def test_records(self):
+        data = _encode("PLACE -3,70,WEST\n" + "MOVE\n" * 40)
+        assert data.startswith(MAGIC)
+        assert list(iter_records(data)) == [
+            (OP_PLACE, Placement(-3, 70, Direction.WEST)),
+            (OP_MOVE, 40),
+        ]
+
+    def test_round_trip_is_canonical_text(self):
+        script = "place 1, 2 ,north\nmove\nLEFT\nJUMP\n\nRIGHT\nREPORT\nEXIT\nMOVE\n"
+        assert "".join(iter_text(_encode(script))) == (
+            "PLACE 1,2,NORTH\nMOVE\nLEFT\nJUMP\nRIGHT\nREPORT\nEXIT\nMOVE\n"
+        )
+
+    def test_truncated_varint(self):
+        data = _encode("PLACE -3,70,WEST\n" + "MOVE\n" * 40)
+        with pytest.raises(ValueError, match="truncated"):
+            list(iter_records(data[:-1]))
+
+    def test_truncated_data_never_raises_index_error(self):
+        data = _encode("PLACE 100,-200,EAST\nJUMP 3\n" + "LEFT\n" * 300)
+        for end in range(len(MAGIC), len(data)):
+            try:
+                list(iter_records(data[:end]))
+            except ValueError as e:
+                assert "truncated" in str(e)
+
+    def test_bad_magic(self):
+        with pytest.raises(ValueError, match="magic"):
+            list(iter_records(b"nope"))
+
+    def test_compression_ratio(self):
+        rng = random.Random(2)
+        lines = ["PLACE 0,0,NORTH"]
+        lines += [rng.choice(["MOVE", "LEFT", "RIGHT", "REPORT"]) for _ in range(5000)]
+        script = "\n".join(lines) + "\n"
+        assert len(script) / len(_encode(script)) >= 10
+
+
+class TestExecuteBinary:
+    def test_matches_text_execution(self):
+        rng = random.Random(9)
+        vocabulary = ["MOVE"] * 6 + ["LEFT"] * 2 + ["RIGHT", "REPORT", "JUMP"]
+        vocabulary += ["PLACE 1,1,EAST", "PLACE 8,1,EAST", "PLACE x"]
+        for _ in range(10):
+            script = "\n".join(rng.choice(vocabulary) for _ in range(400)) + "\n"
+            assert _run_binary(_encode(script)) == _run_text(script)
+
+    def test_stops_at_exit(self):
+        script = "PLACE 0,0,NORTH\nREPORT\nEXIT\nREPORT\n"
+        assert _run_binary(_encode(script))[0] == "0,0,NORTH\n"
+
+    def test_cli_round_trip(self, tmp_path, capsys):
+        text = tmp_path / "mission.txt"
+        text.write_text("PLACE 0,0,NORTH\nMOVE\nMOVE\nMOVE\nREPORT\n")
+        encoded = tmp_path / "mission.mrb"
+        decoded = tmp_path / "decoded.txt"
+        main(["encode", str(text), str(encoded)])
+        main(["decode", str(encoded), str(decoded)])
+        assert decoded.read_text() == text.read_text()
+        main(["run", str(encoded)])
+        assert capsys.readouterr().out == "0,3,NORTH\n"
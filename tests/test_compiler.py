@@ -0,0 +1,68 @@
+import random
+from io import StringIO
+
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.commands import LeftCommand, MoveCommand, ReportCommand
+from mars_rover.compiler import MoveRunCommand, RotateCommand, compile_commands
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+
+
+class TestCompileCommands:
+    def test_folds_runs(self):
+        commands = [MoveCommand(), MoveCommand(), LeftCommand(), LeftCommand()]
+        compiled = list(compile_commands(commands))
+        assert isinstance(compiled[0], MoveRunCommand)
+        assert compiled[0].count == 2
+        assert isinstance(compiled[1], RotateCommand)
+        assert compiled[1].quarter_turns == 2
+
+    def test_single_commands_pass_through(self):
+        commands = [MoveCommand(), LeftCommand(), ReportCommand()]
+        compiled = list(compile_commands(commands))
+        assert [type(c) for c in compiled] == [type(c) for c in commands]
+
+
+class TestMoveRunCommand:
+    def test_clamps_at_edge_and_counts_rejections(self):
+        rover = Rover(TableBounds())
+        rover.place(1, 2, Direction.EAST)
+        result = MoveRunCommand(10).execute(rover)
+        assert not result.success
+        assert result.count == 6
+        assert rover.position == Position(5, 2)
+
+    def test_within_bounds(self):
+        rover = Rover(TableBounds())
+        rover.place(1, 2, Direction.SOUTH)
+        assert MoveRunCommand(2).execute(rover).success
+        assert rover.position == Position(1, 0)
+
+    def test_not_placed(self):
+        result = MoveRunCommand(3).execute(Rover(TableBounds()))
+        assert not result.success
+        assert result.count == 3
+        assert "must be placed" in result.message
+
+
+class TestCompiledBatch:
+    def _run(self, script, compiled):
+        stream = StringIO()
+        out = OutputBuffer(stream)
+        summary = run_batch(
+            CommandParser(), Rover(TableBounds()), StringIO(script), out, compiled
+        )
+        out.flush()
+        return stream.getvalue(), summary
+
+    def test_matches_uncompiled_output(self):
+        rng = random.Random(3)
+        vocabulary = ["MOVE"] * 6 + ["LEFT", "RIGHT", "REPORT", "JUMP"]
+        vocabulary += ["PLACE 2,2,WEST", "PLACE 9,9,EAST"]
+        for _ in range(20):
+            lines = [rng.choice(vocabulary) for _ in range(200)]
+            if rng.random() < 0.8:
+                lines.insert(rng.randrange(20), "PLACE 1,1,NORTH")
+            script = "\n".join(lines) + "\n"
+            assert self._run(script, True) == self._run(script, False)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mars_rover.exceptions import RoverNotPlacedException  # noqa: E402
+from mars_rover.fleet import FleetEngine  # noqa: E402
+from mars_rover.models import Direction, TableBounds  # noqa: E402
+from mars_rover.parser import CommandParser  # noqa: E402
+from mars_rover.rover import Rover  # noqa: E402
+
+
+class TestFleetEngine:
+    def test_place_and_move(self):
+        fleet = FleetEngine(TableBounds(), 3)
+        failed = fleet.place(np.array([0, 5, 9]), 5, Direction.NORTH)
+        assert failed.tolist() == [False, False, True]
+        failed = fleet.move()
+        assert failed.tolist() == [True, True, True]
+        fleet.right()
+        failed = fleet.move()
+        assert failed.tolist() == [False, True, True]
+        assert fleet.report() == ["1,5,EAST", "5,5,EAST", None]
+
+    def test_unplaced_rovers_ignore_commands(self):
+        fleet = FleetEngine(TableBounds(), 2)
+        fleet.place(1, 1, Direction.SOUTH, mask=np.array([True, False]))
+        assert fleet.left().tolist() == [False, True]
+        assert fleet.report() == ["1,1,EAST", None]
+
+    def test_mask_limits_command(self):
+        fleet = FleetEngine(TableBounds(), 2)
+        fleet.place(0, 0, Direction.NORTH)
+        failed = fleet.move(mask=np.array([False, True]))
+        assert failed.tolist() == [False, False]
+        assert fleet.report() == ["0,0,NORTH", "0,1,NORTH"]
+
+    def test_matches_rover(self):
+        rng = random.Random(7)
+        bounds = TableBounds(max_x=4, max_y=3)
+        parser = CommandParser()
+        size = 50
+        fleet = FleetEngine(bounds, size)
+        rovers = [Rover(bounds) for _ in range(size)]
+        lines = ["MOVE", "LEFT", "RIGHT", "REPORT"]
+
+        for _ in range(300):
+            mask = np.array([rng.random() < 0.7 for _ in range(size)])
+            if rng.random() < 0.1:
+                x, y = rng.randint(-1, 5), rng.randint(-1, 4)
+                line = f"PLACE {x},{y},{rng.choice(list(Direction)).value}"
+            else:
+                line = rng.choice(lines)
+            command = parser.parse(line)
+            outcome = fleet.execute(command, mask)
+
+            for i, rover in enumerate(rovers):
+                if not mask[i] and line != "REPORT":
+                    continue
+                try:
+                    result = command.execute(rover)
+                except RoverNotPlacedException:
+                    result = None
+                if line == "REPORT":
+                    assert outcome[i] == result
+                else:
+                    assert outcome[i] == (result is None or not result.success)
+
+        for i, rover in enumerate(rovers):
+            copy = fleet.to_rover(i)
+            assert copy.position == rover.position
+            assert copy.direction == rover.direction
@@ -0,0 +1,122 @@
+from io import StringIO
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mars_rover.batch import OutputBuffer, run_batch  # noqa: E402
+from mars_rover.fleet import FleetEngine  # noqa: E402
+from mars_rover.heatmap import UNVISITED, VisitHeatmap  # noqa: E402
+from mars_rover.main import main  # noqa: E402
+from mars_rover.models import Direction, TableBounds  # noqa: E402
+from mars_rover.parser import CommandParser  # noqa: E402
+from mars_rover.rover import Rover  # noqa: E402
+
+MISSION = "PLACE 0,0,NORTH\nMOVE\nMOVE\nRIGHT\nMOVE\nLEFT\nLEFT\nLEFT\nMOVE\nMOVE\n"
+
+
+def _heatmap(script, compiled=False):
+    heatmap = VisitHeatmap(TableBounds())
+    rover = Rover(TableBounds(), recorder=heatmap)
+    out = OutputBuffer(StringIO())
+    run_batch(CommandParser(), rover, StringIO(script), out, compiled)
+    return heatmap
+
+
+class TestVisitHeatmap:
+    def test_counts_entered_cells(self):
+        heatmap = _heatmap(MISSION + "PLACE 0,0,EAST\n")
+        assert heatmap.visits[0, 0] == 2
+        assert heatmap.visits[1, 0] == 1
+        assert heatmap.visits[2, 0] == 1
+        assert heatmap.visits[2, 1] == 1
+        assert heatmap.visits.sum() == 7
+        assert heatmap.coverage() == pytest.approx(100 * 6 / 36)
+
+    def test_first_visit_times(self):
+        heatmap = _heatmap("PLACE 0,0,EAST\nMOVE\nMOVE\nLEFT\nMOVE\n")
+        assert heatmap.first_visit[0, :3].tolist() == [1, 2, 3]
+        assert heatmap.first_visit[1, 2] == 4
+        assert heatmap.first_visit[5, 5] == UNVISITED
+
+    def test_rejected_commands_do_not_visit(self):
+        heatmap = _heatmap("MOVE\nPLACE 9,9,NORTH\nPLACE 0,5,NORTH\nMOVE\n")
+        assert heatmap.visits.sum() == 1
+
+    def test_repeat_matches_unrolled(self):
+        body = "MOVE; RIGHT; MOVE; RIGHT; MOVE; RIGHT; MOVE; RIGHT"
+        lines = body.replace("; ", "\n") + "\n"
+        repeated = _heatmap(f"PLACE 0,0,NORTH\nREPEAT 100 {{ {body} }}\n")
+        unrolled = _heatmap("PLACE 0,0,NORTH\n" + lines * 100)
+        assert repeated.time == unrolled.time == 401
+        assert repeated.visits.sum() == 401
+        assert np.array_equal(repeated.visits, unrolled.visits)
+        assert np.array_equal(repeated.first_visit, unrolled.first_visit)
+
+    def test_compiled_matches_uncompiled(self):
+        script = MISSION + "MOVE\n" * 9 + "RIGHT\nRIGHT\n" + "MOVE\n" * 3
+        plain = _heatmap(script)
+        compiled = _heatmap(script, compiled=True)
+        assert np.array_equal(plain.visits, compiled.visits)
+        assert np.array_equal(plain.first_visit, compiled.first_visit)
+
+    def test_runs_across_tiles_match_single_moves(self):
+        bounds = TableBounds(-40, -40, 40, 40)
+        script = "PLACE -37,30,SOUTH\n" + "MOVE\n" * 70 + "LEFT\n" + "MOVE\n" * 75
+        script += "LEFT\n" + "MOVE\n" * 50 + "LEFT\n" + "MOVE\n" * 90
+        maps = []
+        for compiled in (False, True):
+            heatmap = VisitHeatmap(bounds)
+            rover = Rover(bounds, recorder=heatmap)
+            out = OutputBuffer(StringIO())
+            run_batch(CommandParser(), rover, StringIO(script), out, compiled)
+            maps.append(heatmap)
+        plain, compiled = maps
+        assert plain.visits.sum() == 1 + 70 + 75 + 50 + 78
+        assert np.array_equal(plain.visits, compiled.visits)
+        assert np.array_equal(plain.first_visit, compiled.first_visit)
+
+    def test_huge_table_stores_visited_tiles_only(self):
+        bounds = TableBounds(max_x=10**9, max_y=10**9)
+        heatmap = VisitHeatmap(bounds)
+        rover = Rover(bounds, recorder=heatmap)
+        rover.place(10**9 - 5000, 7, Direction.EAST)
+        rover.move_many(10_000)
+        assert heatmap.visit_counts.count_nonzero() == 5001
+        assert len(heatmap.visit_counts.tiles) <= 5001 // 16 + 2
+        assert heatmap.first_visits.get(10**9, 7) == 5001
+        assert heatmap.coverage() < 1e-9
+
+    def test_fleet(self):
+        heatmap = VisitHeatmap(TableBounds())
+        fleet = FleetEngine(TableBounds(), 3, recorder=heatmap)
+        fleet.place(np.array([0, 0, 7]), 0, Direction.NORTH)
+        fleet.move()
+        assert heatmap.visits[0, 0] == 2
+        assert heatmap.visits[1, 0] == 2
+        assert heatmap.first_visit[1, 0] == 2
+
+    def test_memory_mapped(self, tmp_path):
+        heatmap = VisitHeatmap.open(TableBounds(), str(tmp_path))
+        rover = Rover(TableBounds(), recorder=heatmap)
+        rover.place(1, 1, Direction.NORTH)
+        heatmap.flush()
+        visits = np.load(tmp_path / "visits.npy", mmap_mode="r")
+        assert visits[1, 1] == 1
+
+    @pytest.mark.parametrize("flag", ["--heatmap", "--parallel"])
+    def test_cli_rejects_huge_tables(self, tmp_path, flag, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text(MISSION)
+        value = str(tmp_path / "out") if flag == "--heatmap" else "2"
+        args = ["--batch", "--bounds", "0,0,1000000000,1000000000", flag, value]
+        with pytest.raises(SystemExit):
+            main(args + [str(mission)])
+        assert "supports tables of at most" in capsys.readouterr().err
+
+    def test_cli(self, tmp_path):
+        mission = tmp_path / "mission.txt"
+        mission.write_text(MISSION)
+        main(["--batch", "--heatmap", str(tmp_path / "out"), str(mission)])
+        visits = np.load(tmp_path / "out" / "visits.npy")
+        assert visits.sum() == 6
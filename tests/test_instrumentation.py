@@ -0,0 +1,198 @@
+import json
+import re
+from io import StringIO
+
+import pytest
+
+from mars_rover import instrumentation, repeat
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.commands import MoveCommand
+from mars_rover.instrumentation import (
+    InstrumentedParser,
+    LatencyHistogram,
+    Stats,
+    classify_error,
+)
+from mars_rover.main import main, run_batch_files, run_cli_loop
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+from mars_rover.world import World
+
+
+class TestClassifyError:
+    def test_known_messages(self):
+        message = ErrorMessages.POSITION_OUT_OF_BOUNDS.format(x=9, y=9)
+        assert classify_error(message) == "POSITION_OUT_OF_BOUNDS"
+        message = ErrorMessages.INVALID_PLACE_COMMAND.format(text="PLACE X,1,NORTH")
+        assert classify_error(message) == "INVALID_PLACE_COMMAND"
+        assert classify_error(ErrorMessages.ROVER_NOT_PLACED) == "ROVER_NOT_PLACED"
+
+    @pytest.mark.parametrize(
+        "name", [name for name in vars(ErrorMessages) if name.isupper()]
+    )
+    def test_every_message(self, name):
+        message = re.sub(r"\{\w+\}", "7", getattr(ErrorMessages, name))
+        assert classify_error(message) == name
+
+    def test_templates_sharing_a_prefix(self):
+        blocked = ErrorMessages.POSITION_BLOCKED.format(x=1, y=2)
+        assert classify_error(blocked) == "POSITION_BLOCKED"
+        outside = ErrorMessages.POSITION_OUT_OF_BOUNDS.format(x=1, y=2)
+        assert classify_error(outside) == "POSITION_OUT_OF_BOUNDS"
+        occupied = ErrorMessages.POSITION_OCCUPIED.format(x=1, y=2)
+        assert classify_error(occupied) == "POSITION_OCCUPIED"
+
+    def test_unknown_message(self):
+        assert classify_error("something else") == "OTHER"
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram()
+        for ns in [100] * 98 + [5000, 5000]:
+            histogram.record(ns)
+        assert histogram.count == 100
+        assert histogram.percentile(0.5) == 128
+        assert histogram.percentile(0.99) == 8192
+
+
+class TestInstrumentedParser:
+    def test_records_commands_and_errors(self):
+        stats = Stats()
+        parser = InstrumentedParser(CommandParser(), stats)
+        script = "MOVE\nPLACE 0,0,NORTH\nMOVE\nLEFT\nMOVE\nJUMP\nREPORT\nEXIT\n"
+        out = StringIO()
+        with stats.time_loop():
+            run_cli_loop(parser, Rover(TableBounds()), StringIO(script), out, stats)
+
+        assert "0,1,WEST" in out.getvalue()
+        snapshot = stats.snapshot()
+        assert snapshot["commands"]["MoveCommand"] == 3
+        assert snapshot["commands"]["Invalid"] == 1
+        assert snapshot["errors"] == {
+            "ROVER_NOT_PLACED": 1,
+            "MOVE_OUT_OF_BOUNDS": 1,
+            "UNKNOWN_COMMAND": 1,
+        }
+        assert snapshot["parse"]["count"] == 7
+        assert snapshot["execute"]["MoveCommand"]["count"] == 3
+        assert snapshot["loop_seconds"] > 0
+
+    def test_records_rover_conflicts(self):
+        stats = Stats()
+        parser = InstrumentedParser(CommandParser(), stats)
+        rover = World(TableBounds()).rover()
+        script = "ROVER 1 PLACE 0,1,SOUTH\nPLACE 0,1,NORTH\nPLACE 0,0,NORTH\nMOVE\n"
+        run_cli_loop(parser, rover, StringIO(script), StringIO(), stats)
+        assert stats.snapshot()["errors"] == {
+            "POSITION_OCCUPIED": 1,
+            "MOVE_COLLISION": 1,
+        }
+
+    def test_parser_returns_plain_commands(self):
+        parser = InstrumentedParser(CommandParser(), Stats())
+        assert type(parser.parse("MOVE")) is MoveCommand
+
+    def test_dump_is_json(self):
+        stats = Stats()
+        InstrumentedParser(CommandParser(), stats).parse("MOVE")
+        stream = StringIO()
+        stats.dump(stream)
+        assert json.loads(stream.getvalue())["parse"]["count"] == 1
+
+
+def _run_batch(script, stats, compiled=False):
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    parser = InstrumentedParser(CommandParser(), stats)
+    summary = run_batch(
+        parser, Rover(TableBounds()), StringIO(script), out, compiled, stats
+    )
+    out.flush()
+    return stream.getvalue(), summary
+
+
+class TestExecutionStats:
+    SCRIPT = "MOVE\nPLACE 0,3,NORTH\nMOVE\nMOVE\nMOVE\nLEFT\nLEFT\nJUMP\nREPORT\n"
+
+    def test_output_matches_uninstrumented_run(self):
+        for compiled in (False, True):
+            output, summary = _run_batch(self.SCRIPT, Stats(), compiled)
+            expected, expected_summary = _run_batch(self.SCRIPT, None, compiled)
+            assert output == expected
+            assert summary == expected_summary
+
+    def test_compiled_commands_are_counted_as_source_commands(self):
+        stats = Stats()
+        _, summary = _run_batch(self.SCRIPT, stats, compiled=True)
+        snapshot = stats.snapshot()
+        assert "MoveRunCommand" in snapshot["execute"]
+        assert sum(snapshot["commands"].values()) == summary.commands == 9
+        assert snapshot["errors"] == {
+            "ROVER_NOT_PLACED": 1,
+            "MOVE_OUT_OF_BOUNDS": 1,
+            "UNKNOWN_COMMAND": 1,
+        }
+
+    def test_repeated_output_errors(self):
+        stats = Stats()
+        _run_batch("PLACE 0,3,NORTH\nREPEAT 5 { MOVE; REPORT }\n", stats)
+        assert stats.snapshot()["errors"] == {"MOVE_OUT_OF_BOUNDS": 3}
+
+    def test_repeat_blocks_count_as_one_command(self, monkeypatch):
+        monkeypatch.setattr(repeat, "MAX_TRACKED_STATES", 2)
+        stats = Stats()
+        output, _ = _run_batch("PLACE 0,0,NORTH\nREPEAT 6 { REPORT; MOVE }\n", stats)
+        snapshot = stats.snapshot()
+        assert output.count("\n") == 7
+        assert snapshot["commands"]["RepeatCommand"] == 12
+        assert snapshot["execute"]["RepeatCommand"]["count"] == 1
+        assert snapshot["errors"] == {"MOVE_OUT_OF_BOUNDS": 1}
+
+    def test_mapped_files_count_every_command(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(self.SCRIPT)
+        stats = Stats()
+        out = OutputBuffer(StringIO())
+        parser = InstrumentedParser(CommandParser(), stats)
+        paths = [str(path)]
+        summary = run_batch_files(
+            parser, TableBounds(), paths, StringIO(), out, mapped=True, stats=stats
+        )
+        snapshot = stats.snapshot()
+        assert snapshot["commands"]["MoveCommand"] == 4
+        assert sum(snapshot["commands"].values()) == summary.commands == 9
+
+    def test_messages_are_classified_once(self, monkeypatch):
+        calls = []
+
+        def classify(message):
+            calls.append(message)
+            return classify_error(message)
+
+        monkeypatch.setattr(instrumentation, "classify_error", classify)
+        stats = Stats()
+        _run_batch("MOVE\n" * 500 + "JUMP\n" * 500, stats)
+        assert calls == []
+        assert stats.snapshot()["errors"] == {
+            "ROVER_NOT_PLACED": 500,
+            "UNKNOWN_COMMAND": 500,
+        }
+        assert len(calls) == 2
+
+    def test_pending_messages_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(instrumentation, "MAX_ERROR_MESSAGES", 4)
+        stats = Stats()
+        script = "".join(f"PLACE {x},0,NORTH\n" for x in range(10, 30))
+        _run_batch(script, stats)
+        assert len(stats._error_messages) <= 4
+        assert stats.snapshot()["errors"] == {"POSITION_OUT_OF_BOUNDS": 20}
+
+    def test_cli_rejects_parallel(self, tmp_path, capsys):
+        path = tmp_path / "log.txt"
+        path.write_text(self.SCRIPT)
+        with pytest.raises(SystemExit):
+            main(["--batch", "--stats", "--parallel", "2", str(path)])
+        assert "--stats" in capsys.readouterr().err
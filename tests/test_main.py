@@ -1,8 +1,12 @@
+import argparse
+import math
+import subprocess
+import sys
 from io import StringIO
 from unittest.mock import Mock
 import pytest
 
-from mars_rover.main import run_cli_loop
+from mars_rover.main import main, parse_bounds, run_cli_loop
 from mars_rover.models import TableBounds
 from mars_rover.rover import Rover
 from mars_rover.parser import CommandParser
@@ -60,3 +64,61 @@ class TestCLI:
         output = cli_runner("PLACE 0,0,NORTH\nMOVE\nEXIT\n")
         assert "Error:" not in output
         assert "Goodbye!" in output
+
+    @pytest.mark.parametrize("options", [[], ["--mmap"]])
+    def test_batch_reports_unreadable_files(self, tmp_path, capsys, options):
+        bad = tmp_path / "bad.txt"
+        bad.write_bytes(b"\xff\xfe\nREPORT\n")
+        good = tmp_path / "good.txt"
+        good.write_text("PLACE 1,2,EAST\nREPORT\n")
+        missing = tmp_path / "missing.txt"
+        with pytest.raises(SystemExit) as exc:
+            main(["--batch", *options, str(bad), str(missing), str(good)])
+        assert exc.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.out == "1,2,EAST\n"
+        errors = captured.err.splitlines()
+        assert errors[0].startswith(f"Error: {bad}: 'utf-8' codec")
+        assert errors[1].startswith(f"Error: {missing}: ")
+
+
+class TestParseBounds:
+    def test_finite(self):
+        assert parse_bounds("0,0,999999999,999999999") == TableBounds(
+            0, 0, 999_999_999, 999_999_999
+        )
+
+    def test_open_edges(self):
+        bounds = parse_bounds("0,*,*,10")
+        assert bounds == TableBounds(0, -math.inf, math.inf, 10)
+
+    @pytest.mark.parametrize("text", ["0,0,5", "0,0,x,5", "5,0,0,5"])
+    def test_invalid(self, text):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_bounds(text)
+
+    def test_cli_open_table(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text("PLACE 0,0,EAST\n" + "MOVE\n" * 1000 + "REPORT\n")
+        main(["--batch", "--compile", "--bounds", "0,0,*,*", str(mission)])
+        assert capsys.readouterr().out == "1000,0,EAST\n"
+
+
+class TestStartup:
+    def test_cli_does_not_import_pydantic(self):
+        code = "import sys, mars_rover.main; print('pydantic' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_place_args_loads_lazily(self):
+        from mars_rover.models import PlaceArgs
+        from mars_rover.validation import PlaceArgs as Validated
+
+        assert PlaceArgs is Validated
+
+    def test_startup_profile(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", StringIO(""))
+        main(["--batch", "--startup-profile", "-"])
+        assert "Imported mars_rover in" in capsys.readouterr().err
@@ -0,0 +1,58 @@
+from io import StringIO
+
+import pytest
+
+from mars_rover.batch import parse_lines
+from mars_rover.commands import FailedCommand, MoveCommand, PlaceCommand
+from mars_rover.main import main
+from mars_rover.mapped import iter_mapped_lines, parse_mapped
+from mars_rover.parser import CommandParser
+
+
+def _describe(command):
+    if isinstance(command, FailedCommand):
+        return ("error", str(command.error))
+    if isinstance(command, PlaceCommand):
+        return ("place", tuple(command.args))
+    return (type(command).__name__,)
+
+
+class TestIterMappedLines:
+    def test_lines(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"MOVE\nLEFT\r\nREPORT")
+        assert list(iter_mapped_lines(str(path))) == [b"MOVE", b"LEFT\r", b"REPORT"]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"")
+        assert list(iter_mapped_lines(str(path))) == []
+
+
+class TestParseMapped:
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "MOVE\nmove\n  Left \nRIGHT\r\nREPORT\n",
+            "PLACE 1,2,north\nPLACE 1\nPLACE X,2,EAST\nJUMP\n\n",
+            "\x1cMOVE\x1f\nRıGHT\nPLACE 1,1,WEﬆ\nmové\n",
+            "MOVE\nexit\nREPORT\n",
+        ],
+    )
+    def test_matches_text_parser(self, tmp_path, script):
+        path = tmp_path / "log.txt"
+        path.write_bytes(script.encode("utf-8"))
+        parser = CommandParser()
+        expected = [_describe(c) for c in parse_lines(parser, StringIO(script))]
+        assert [_describe(c) for c in parse_mapped(parser, str(path))] == expected
+
+    def test_bare_commands_are_not_decoded(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"MOVE\n")
+        assert isinstance(next(parse_mapped(CommandParser(), str(path))), MoveCommand)
+
+    def test_batch_mmap_flag(self, tmp_path, capsys):
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"PLACE 0,0,EAST\nMOVE\nREPORT\n")
+        main(["--batch", "--mmap", str(path)])
+        assert capsys.readouterr().out == "1,0,EAST\n"
@@ -1,6 +1,14 @@
 import pytest
 
-from mars_rover.models import Direction, Position, TableBounds, PlaceArgs
+import math
+
+from mars_rover.models import (
+    UNBOUNDED_TABLE,
+    Direction,
+    PlaceArgs,
+    Position,
+    TableBounds,
+)
 
 
 class TestDirection:
@@ -28,6 +36,11 @@ class TestDirection:
     def test_right_from_west(self):
         assert Direction.WEST.right() == Direction.NORTH
 
+    def test_rotate(self):
+        assert Direction.NORTH.rotate(1) == Direction.EAST
+        assert Direction.NORTH.rotate(-1) == Direction.WEST
+        assert Direction.EAST.rotate(6) == Direction.WEST
+
 
 class TestPosition:
     def test_create_position(self):
@@ -68,6 +81,14 @@ class TestTableBounds:
         assert bounds.contains(Position(10, 10))
         assert not bounds.contains(Position(0, 0))
 
+    def test_open_edges(self):
+        bounds = TableBounds(max_x=math.inf, max_y=math.inf)
+        assert not bounds.is_finite
+        assert bounds.contains(Position(10**18, 10**18))
+        assert not bounds.contains(Position(-1, 0))
+        assert UNBOUNDED_TABLE.contains(Position(-(10**18), 10**18))
+        assert TableBounds().is_finite
+
 
 class TestPlaceArgs:
     def test_valid_place_args(self):
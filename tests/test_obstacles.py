@@ -0,0 +1,120 @@
+import pytest
+
+from mars_rover.main import main
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import UNBOUNDED_TABLE, Direction, Position, TableBounds
+from mars_rover.obstacles import ObstacleGrid, SparseObstacleGrid
+from mars_rover.obstacles import main as obstacles_main
+from mars_rover.rover import Rover
+from mars_rover.status import Status
+
+
+@pytest.fixture
+def grid():
+    return ObstacleGrid.from_cells(TableBounds(), [(2, 3), (4, 0)])
+
+
+class TestObstacleGrid:
+    def test_block_and_unblock(self, grid):
+        assert grid.is_blocked(2, 3)
+        assert not grid.is_blocked(3, 2)
+        grid.unblock(2, 3)
+        assert not grid.is_blocked(2, 3)
+        assert grid.version == 3
+
+    def test_one_bit_per_cell(self):
+        grid = ObstacleGrid(TableBounds(0, 0, 99, 99))
+        assert len(grid.bits) == 10_000 // 8
+
+    def test_cells_off_table_are_free(self, grid):
+        assert not grid.is_blocked(-1, 0)
+        with pytest.raises(ValueError):
+            grid.block(6, 0)
+
+    def test_save_and_load(self, grid, tmp_path):
+        path = tmp_path / "table.obs"
+        grid.save(str(path))
+        loaded = ObstacleGrid.load(str(path))
+        assert loaded.bounds == grid.bounds
+        assert loaded.bits == grid.bits
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "table.obs"
+        path.write_bytes(b"not an obstacle grid at all, no sir.....")
+        with pytest.raises(ValueError, match="bad magic"):
+            ObstacleGrid.load(str(path))
+
+    def test_cli_create(self, tmp_path):
+        cells = tmp_path / "cells.txt"
+        cells.write_text("1,1\n\n2,3\n")
+        target = tmp_path / "table.obs"
+        obstacles_main(["create", str(cells), str(target)])
+        loaded = ObstacleGrid.load(str(target))
+        assert loaded.is_blocked(1, 1) and loaded.is_blocked(2, 3)
+
+    def test_rejects_open_bounds(self):
+        with pytest.raises(ValueError):
+            ObstacleGrid(UNBOUNDED_TABLE)
+
+
+class TestSparseObstacleGrid:
+    def test_block_and_unblock(self):
+        grid = SparseObstacleGrid.from_cells(UNBOUNDED_TABLE, [(10**9, -5), (0, 0)])
+        assert grid.is_blocked(10**9, -5)
+        assert not grid.is_blocked(10**9, -4)
+        grid.unblock(0, 0)
+        assert not grid.is_blocked(0, 0)
+        assert grid.version == 3
+
+    def test_cells_off_table(self):
+        grid = SparseObstacleGrid(TableBounds())
+        with pytest.raises(ValueError):
+            grid.block(6, 0)
+
+    def test_rover_on_huge_table(self):
+        bounds = TableBounds(max_x=10**9 - 1, max_y=10**9 - 1)
+        grid = SparseObstacleGrid.from_cells(bounds, [(10**9 - 3, 7)])
+        rover = Rover(bounds, Position(0, 7), Direction.EAST, grid)
+        assert rover.move_many(10**9).count == 4
+        assert rover.position == Position(10**9 - 4, 7)
+
+
+class TestRoverWithObstacles:
+    def test_place_on_obstacle(self, grid):
+        rover = Rover(TableBounds(), obstacles=grid)
+        result = rover.place(2, 3, Direction.NORTH)
+        assert not result.success
+        assert result.message == ErrorMessages.POSITION_BLOCKED.format(x=2, y=3)
+        assert rover.try_place(2, 3, Direction.NORTH) == Status.POSITION_BLOCKED
+        assert rover.position is None
+
+    def test_move_into_obstacle(self, grid):
+        rover = Rover(TableBounds(), Position(2, 2), Direction.NORTH, grid)
+        result = rover.move()
+        assert not result.success
+        assert result.message == ErrorMessages.MOVE_BLOCKED
+        assert rover.position == Position(2, 2)
+
+    def test_move_many_stops_before_obstacle(self, grid):
+        rover = Rover(TableBounds(), Position(0, 0), Direction.EAST, grid)
+        result = rover.move_many(5)
+        assert rover.position == Position(3, 0)
+        assert result.message == ErrorMessages.MOVE_BLOCKED
+        assert result.count == 2
+
+    def test_move_many_matches_single_moves(self, grid):
+        single = Rover(TableBounds(), Position(0, 0), Direction.EAST, grid)
+        failures = sum(not single.move().success for _ in range(7))
+        many = Rover(TableBounds(), Position(0, 0), Direction.EAST, grid)
+        assert many.move_many(7).count == failures
+        assert many.position == single.position
+
+    def test_cli_obstacles(self, grid, tmp_path, capsys):
+        grid_path = tmp_path / "table.obs"
+        grid.save(str(grid_path))
+        mission = tmp_path / "mission.txt"
+        mission.write_text("PLACE 2,2,NORTH\nMOVE\nREPORT\n")
+        with pytest.raises(SystemExit):
+            main(["--batch", "--obstacles", str(grid_path), str(mission)])
+        out = capsys.readouterr().out
+        assert out == f"Error: {ErrorMessages.MOVE_BLOCKED}\n2,2,NORTH\n"
@@ -0,0 +1,232 @@
+import random
+from io import StringIO
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from mars_rover.batch import OutputBuffer, run_batch  # noqa: E402
+from mars_rover.main import main  # noqa: E402
+from mars_rover.models import Direction, Position, TableBounds  # noqa: E402
+from mars_rover import parallel  # noqa: E402
+from mars_rover.parallel import (  # noqa: E402
+    Walk,
+    run_parallel,
+    split_file,
+    summarize_chunk,
+)
+from mars_rover.parse_cache import CachingParser  # noqa: E402
+from mars_rover.parser import CommandParser  # noqa: E402
+from mars_rover.rover import Rover  # noqa: E402
+from mars_rover.transitions import transition_tables  # noqa: E402
+
+
+def _sequential(path, bounds):
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    with open(path, encoding="utf-8") as f:
+        summary = run_batch(CommandParser(), Rover(bounds), f, out)
+    out.flush()
+    return stream.getvalue(), summary
+
+
+def _parallel(path, bounds, chunks, parse_cache=None):
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    summary = run_parallel(
+        str(path), bounds, out, workers=2, chunks=chunks, parse_cache=parse_cache
+    )
+    out.flush()
+    return stream.getvalue(), summary
+
+
+class TestSplitFile:
+    def test_ranges_cover_file_on_line_boundaries(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"MOVE\nLEFT\nREPORT\nPLACE 1,1,NORTH\n")
+        ranges = split_file(str(path), 3)
+        data = path.read_bytes()
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for start, end in ranges:
+            assert data[start:end].endswith(b"\n")
+
+
+def _walked(bounds, steps):
+    walk = Walk(bounds)
+    for step in steps:
+        if step == "MOVE":
+            walk.move()
+        else:
+            walk.turn(-1 if step == "LEFT" else 1)
+    return walk
+
+
+class TestWalk:
+    @pytest.mark.parametrize(
+        "bounds", [TableBounds(), TableBounds(min_x=-2, min_y=1, max_x=0, max_y=6)]
+    )
+    def test_matches_rover_from_every_state(self, bounds):
+        rng = random.Random(7)
+        tables = transition_tables(bounds)
+        for _ in range(20):
+            steps = [rng.choice(["MOVE"] * 3 + ["LEFT", "RIGHT"]) for _ in range(30)]
+            times = rng.randint(1, 5)
+            walk = _walked(bounds, steps[:10]).then(
+                _walked(bounds, steps[10:]).power(times)
+            )
+            table = walk.table()
+            for state in range(tables.states):
+                x, y, direction = tables.decode(state)
+                rover = Rover(bounds, Position(x, y), direction)
+                for step in steps[:10] + steps[10:] * times:
+                    getattr(rover, step.lower())()
+                position = rover.position
+                expected = tables.encode(position.x, position.y, rover.direction)
+                assert walk.apply(state) == table[state] == expected
+            assert walk.apply(tables.states) == table[-1] == tables.states
+
+    def test_huge_repeat(self):
+        bounds = TableBounds()
+        walk = _walked(bounds, ["MOVE", "MOVE", "RIGHT"]).power(10**12 + 1)
+        rover = Rover(bounds, Position(1, 0), Direction.NORTH)
+        CommandParser().parse("REPEAT 1000000000001 { MOVE; MOVE; RIGHT }").execute(
+            rover
+        )
+        tables = transition_tables(bounds)
+        start = tables.encode(1, 0, Direction.NORTH)
+        end = tables.encode(rover.position.x, rover.position.y, rover.direction)
+        assert walk.apply(start) == walk.table()[start] == end
+
+
+class TestRunParallel:
+    def test_matches_sequential_run(self, tmp_path):
+        rng = random.Random(5)
+        bounds = TableBounds(max_x=4, max_y=4)
+        vocabulary = ["MOVE"] * 5 + ["LEFT", "RIGHT", "REPORT", "JUMP", "", "PLACE 1"]
+        vocabulary += ["PLACE 2,3,SOUTH", "PLACE 7,0,EAST"]
+        lines = [rng.choice(vocabulary) for _ in range(3000)]
+        path = tmp_path / "log.txt"
+        path.write_text("\n".join(lines) + "\n")
+
+        expected = _sequential(path, bounds)
+        for chunks in (1, 7, 50):
+            assert _parallel(path, bounds, chunks) == expected
+
+    def test_stops_at_exit(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("PLACE 0,0,NORTH\nREPORT\n" * 50 + "EXIT\n" + "REPORT\n" * 50)
+        assert _parallel(path, TableBounds(), 8) == _sequential(path, TableBounds())
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("")
+        output, summary = _parallel(path, TableBounds(), 4)
+        assert output == ""
+        assert summary.commands == 0
+
+    def test_repeat_blocks(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(
+            "REPEAT 7 { MOVE; RIGHT }\nPLACE 1,1,NORTH\n"
+            + "MOVE\nREPEAT 1000001 { MOVE; MOVE; LEFT; REPORT }\n" * 20
+        )
+        assert _parallel(path, TableBounds(), 5) == _sequential(path, TableBounds())
+
+    def test_goto(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(
+            "GOTO 1,1\nPLACE 0,0,NORTH\n" + "GOTO 4,2,WEST\nREPORT\nGOTO 0,5\n" * 30
+        )
+        assert _parallel(path, TableBounds(), 6) == _sequential(path, TableBounds())
+
+    def test_goto_in_a_later_chunk(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(
+            "PLACE 0,0,NORTH\n" + "REPORT\n" * 200 + "GOTO 3,3\n" + "REPORT\n" * 200
+        )
+        output, _ = _parallel(path, TableBounds(), 4)
+        assert output.endswith("3,3,EAST\n")
+        assert (output, _) == _sequential(path, TableBounds())
+
+    def test_random_gotos_match_sequential_run(self, tmp_path):
+        rng = random.Random(11)
+        bounds = TableBounds(max_x=4, max_y=3)
+        vocabulary = ["MOVE", "LEFT", "RIGHT", "REPORT", "PLACE 2,1,WEST"]
+        vocabulary += ["GOTO 0,0", "GOTO 4,3,SOUTH", "GOTO 2,2", "GOTO 9,9"]
+        vocabulary += ["REPEAT 3 { GOTO 1,3; MOVE; GOTO 3,0 }"]
+        lines = [rng.choice(vocabulary) for _ in range(2000)]
+        path = tmp_path / "log.txt"
+        path.write_text("\n".join(lines) + "\n")
+        expected = _sequential(path, bounds)
+        for chunks in (3, 40):
+            assert _parallel(path, bounds, chunks) == expected
+
+    def test_place_inside_repeat(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(
+            "PLACE 0,0,NORTH\n"
+            + "REPORT\n" * 50
+            + "REPEAT 2 { PLACE 1,1,EAST; MOVE }\nREPORT\n"
+            + "REPEAT 3 { PLACE 9,9,EAST; MOVE }\nREPORT\n"
+        )
+        output, _ = _parallel(path, TableBounds(), 4)
+        reports = [line for line in output.splitlines() if "EAST" in line]
+        assert reports == ["2,1,EAST", "5,1,EAST"]
+        assert (output, _) == _sequential(path, TableBounds())
+
+    def test_cli_place_inside_repeat(self, tmp_path, capsys):
+        path = tmp_path / "log.txt"
+        path.write_text("PLACE 0,0,NORTH\nREPEAT 2 { PLACE 1,1,EAST; MOVE }\nREPORT\n")
+        main(["--batch", "--parallel", "2", str(path)])
+        assert capsys.readouterr().out == "2,1,EAST\n"
+
+    def test_parse_cache(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("PLACE 0,0,NORTH\n" + "MOVE\nJUMP\nRIGHT\nREPORT\n" * 50)
+        bounds = TableBounds()
+        assert _parallel(path, bounds, 5, parse_cache=2) == _sequential(path, bounds)
+
+    def test_workers_get_a_parse_cache(self, monkeypatch):
+        monkeypatch.setattr(parallel, "_parser", None)
+        parallel._init_worker(16)
+        assert isinstance(parallel._parser, CachingParser)
+        assert parallel._parser.max_size == 16
+
+    def test_cli_parse_cache(self, tmp_path, capsys):
+        path = tmp_path / "log.txt"
+        path.write_text("PLACE 0,0,NORTH\n" + "MOVE\nREPORT\n" * 3)
+        main(["--batch", "--parallel", "2", "--parse-cache", "4", str(path)])
+        assert capsys.readouterr().out == "0,1,NORTH\n0,2,NORTH\n0,3,NORTH\n"
+
+    def test_cli_reports_unreadable_files(self, tmp_path, capsys):
+        bad = tmp_path / "bad.txt"
+        bad.write_bytes(b"PLACE 0,0,NORTH\n\xff\nREPORT\n")
+        good = tmp_path / "good.txt"
+        good.write_text("PLACE 1,2,EAST\nREPORT\n")
+        with pytest.raises(SystemExit) as exc:
+            main(["--batch", "--parallel", "2", str(bad), str(good)])
+        assert exc.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.out == "1,2,EAST\n"
+        assert captured.err.startswith(f"Error: {bad}: 'utf-8' codec")
+
+    def test_large_table_chunk_is_summarized_in_closed_form(self, tmp_path):
+        rng = random.Random(3)
+        lines = [rng.choice(["MOVE"] * 6 + ["LEFT", "RIGHT"]) for _ in range(20000)]
+        lines.append("REPEAT 1000000000 { MOVE; LEFT; MOVE; MOVE }")
+        path = tmp_path / "log.txt"
+        path.write_text("\n".join(lines) + "\n")
+        bounds = TableBounds(max_x=1999, max_y=1999)
+        transform = summarize_chunk(str(path), 0, path.stat().st_size, bounds)
+        assert transform.walk is not None and transform.mapping is None
+
+        def state(x, y, direction):
+            return (y * 2000 + x) * 4 + list(Direction).index(direction)
+
+        rover = Rover(bounds, Position(700, 1200), Direction.SOUTH)
+        with open(path, encoding="utf-8") as f:
+            run_batch(CommandParser(), rover, f, OutputBuffer(StringIO()))
+        start = state(700, 1200, Direction.SOUTH)
+        position = rover.position
+        assert transform.apply(start) == state(position.x, position.y, rover.direction)
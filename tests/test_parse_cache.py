@@ -0,0 +1,63 @@
+import pytest
+
+from mars_rover.commands import MoveCommand, PlaceCommand
+from mars_rover.exceptions import InvalidCommandException
+from mars_rover.instrumentation import InstrumentedParser, Stats
+from mars_rover.main import main
+from mars_rover.parse_cache import CachingParser
+
+
+class TestCachingParser:
+    def test_repeated_lines_are_hits(self):
+        parser = CachingParser()
+        first = parser.parse("PLACE 1,2,NORTH")
+        assert isinstance(first, PlaceCommand)
+        assert parser.parse("PLACE 1,2,NORTH") is first
+        assert isinstance(parser.parse("MOVE"), MoveCommand)
+        assert (parser.hits, parser.misses) == (1, 2)
+        assert parser.hit_rate == pytest.approx(1 / 3)
+
+    def test_keyed_on_raw_line(self):
+        parser = CachingParser()
+        parser.parse("move")
+        parser.parse("MOVE")
+        parser.parse(" MOVE")
+        assert parser.misses == 3
+
+    def test_invalid_lines_are_cached(self):
+        parser = CachingParser()
+        with pytest.raises(InvalidCommandException) as first:
+            parser.parse("JUMP")
+        with pytest.raises(InvalidCommandException) as second:
+            parser.parse("JUMP")
+        assert second.value is first.value
+        assert (parser.hits, parser.misses) == (1, 1)
+
+    def test_least_recently_used_evicted(self):
+        parser = CachingParser(max_size=2)
+        parser.parse("MOVE")
+        parser.parse("LEFT")
+        parser.parse("MOVE")
+        parser.parse("RIGHT")
+        assert len(parser) == 2
+        assert parser.evictions == 1
+        parser.parse("MOVE")
+        parser.parse("LEFT")
+        assert parser.hits == 2
+        assert parser.snapshot()["evictions"] == 2
+
+    def test_rejects_empty_cache(self):
+        with pytest.raises(ValueError):
+            CachingParser(max_size=0)
+
+    def test_stats_snapshot(self):
+        cache = CachingParser()
+        stats = Stats(cache)
+        InstrumentedParser(cache, stats).parse("MOVE")
+        assert stats.snapshot()["parse_cache"]["misses"] == 1
+
+    def test_cli(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text("PLACE 0,0,NORTH\n" + "MOVE\nREPORT\n" * 3)
+        main(["--batch", "--parse-cache", "2", str(mission)])
+        assert capsys.readouterr().out == "0,1,NORTH\n0,2,NORTH\n0,3,NORTH\n"
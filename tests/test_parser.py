@@ -8,7 +8,7 @@ from mars_rover.commands import (
     RightCommand,
     ReportCommand,
 )
-from mars_rover.models import Direction
+from mars_rover.models import Direction, PlaceArgs
 from mars_rover.exceptions import InvalidCommandException
 
 
@@ -33,6 +33,11 @@ class TestCommandParser:
         cmd = parser.parse("REPORT")
         assert isinstance(cmd, ReportCommand)
 
+    def test_stateless_commands_are_shared(self):
+        parser = CommandParser()
+        for text in ("MOVE", "LEFT", "RIGHT", "REPORT"):
+            assert parser.parse(text) is parser.parse(text.lower())
+
     def test_parse_case_insensitive(self):
         parser = CommandParser()
         assert isinstance(parser.parse("move"), MoveCommand)
@@ -105,3 +110,45 @@ class TestCommandParser:
         parser = CommandParser()
         with pytest.raises(InvalidCommandException, match="Unknown command"):
             parser.parse("")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "PLACE 1,2,NORTH",
+            "PLACE +1,-2,WEST",
+            "PLACE 1_0,2,EAST",
+            "PLACE 1.5,2,EAST",
+            "PLACE ,2,EAST",
+            "PLACE 1,2,",
+            "PLACE 1,2,NORTHWEST",
+            "PLACEMENT",
+            "PLACE",
+        ],
+    )
+    def test_place_matches_pydantic_validation(self, text):
+        parser = CommandParser()
+        raw_args = text.removeprefix("PLACE").strip()
+        parts = [p.strip() for p in raw_args.split(",")]
+        try:
+            expected = PlaceArgs(
+                x=int(parts[0]), y=int(parts[1]), direction=Direction(parts[2])
+            )
+        except (ValueError, IndexError):
+            with pytest.raises(InvalidCommandException):
+                parser.parse(text)
+            return
+        cmd = parser.parse(text)
+        assert (cmd.args.x, cmd.args.y, cmd.args.direction) == (
+            expected.x,
+            expected.y,
+            expected.direction,
+        )
+
+    def test_place_error_messages(self):
+        parser = CommandParser()
+        with pytest.raises(InvalidCommandException) as exc:
+            parser.parse("place 1,2,up")
+        assert str(exc.value) == "Invalid PLACE command: PLACE 1,2,UP"
+        with pytest.raises(InvalidCommandException) as exc:
+            parser.parse("PLACE 1")
+        assert str(exc.value) == "PLACE requires exactly 3 arguments: PLACE X,Y,F"
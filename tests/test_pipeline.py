@@ -0,0 +1,124 @@
+from io import StringIO
+
+import pytest
+
+from mars_rover.batch import BatchSummary, OutputBuffer, run_batch
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.pipeline import (
+    chunked,
+    execute_stream,
+    format_results,
+    iter_commands,
+    stream_output,
+)
+from mars_rover.result import CommandResult
+from mars_rover.rover import Rover
+
+SCRIPT = (
+    "MOVE\n"
+    "PLACE 0,0,NORTH\n"
+    "MOVE\nMOVE\nRIGHT\nREPORT\n"
+    "\n"
+    "PLACE 9,9,NORTH\n"
+    "JUMP\n"
+    "MOVE\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE\n"
+    "LEFT\nLEFT\nLEFT\nREPORT\n"
+)
+
+
+def _batch_output(script, compiled=False):
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    run_batch(CommandParser(), Rover(TableBounds()), StringIO(script), out, compiled)
+    out.flush()
+    return stream.getvalue()
+
+
+class TestStages:
+    def test_matches_batch_output(self):
+        rover = Rover(TableBounds())
+        results = execute_stream(iter_commands(SCRIPT.splitlines()), rover)
+        assert "".join(format_results(results)) == _batch_output(SCRIPT)
+
+    def test_compiled_matches_batch_output(self):
+        rover = Rover(TableBounds())
+        commands = iter_commands(SCRIPT.splitlines(), compiled=True)
+        output = "".join(format_results(execute_stream(commands, rover)))
+        assert output == _batch_output(SCRIPT, compiled=True)
+
+    def test_results(self):
+        rover = Rover(TableBounds())
+        lines = ["MOVE", "PLACE 0,0,NORTH", "MOVE", "REPORT", "JUMP"]
+        results = list(execute_stream(iter_commands(lines), rover))
+        assert not results[0].success
+        assert results[1] is CommandResult.ok()
+        assert results[2] is CommandResult.ok()
+        assert results[3] == "0,1,NORTH"
+        assert results[4].message == "Unknown command: 'JUMP'"
+
+    def test_summary_matches_batch_counts(self):
+        stream = StringIO()
+        out = OutputBuffer(stream)
+        expected = run_batch(
+            CommandParser(), Rover(TableBounds()), StringIO(SCRIPT), out, True
+        )
+        summary = BatchSummary()
+        commands = iter_commands(SCRIPT.splitlines(), compiled=True)
+        list(execute_stream(commands, Rover(TableBounds()), summary))
+        out.flush()
+        assert summary == expected
+        assert summary.failures == stream.getvalue().count("Error: ")
+
+    def test_stops_at_exit_without_reading_further(self):
+        def lines():
+            yield "PLACE 1,1,EAST"
+            yield "REPORT"
+            yield "EXIT"
+            raise AssertionError("read past EXIT")
+
+        rover = Rover(TableBounds())
+        results = execute_stream(iter_commands(lines()), rover)
+        assert list(format_results(results)) == ["1,1,EAST\n"]
+
+    def test_generator_input_is_consumed_lazily(self):
+        consumed = []
+
+        def lines():
+            for i in range(10**9):
+                consumed.append(i)
+                yield "MOVE"
+
+        results = execute_stream(iter_commands(lines()), Rover(TableBounds()))
+        output = format_results(results)
+        assert next(output) == "Error: Rover must be placed on the table first\n"
+        assert len(consumed) == 1
+
+
+class TestChunked:
+    def test_groups_items(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_rejects_bad_size(self):
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestStreamOutput:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+    def test_chunk_sizes_give_same_output(self, chunk_size):
+        rover = Rover(TableBounds())
+        chunks = list(stream_output(SCRIPT.splitlines(), rover, chunk_size=chunk_size))
+        assert "".join(chunks) == _batch_output(SCRIPT)
+        assert all(chunks)
+
+    def test_one_string_per_chunk(self):
+        lines = ["PLACE 0,0,NORTH"] + ["REPORT"] * 10
+        chunks = list(stream_output(lines, Rover(TableBounds()), chunk_size=4))
+        assert [c.count("\n") for c in chunks] == [3, 4, 3]
+
+    def test_compiled_run_of_failures(self):
+        lines = ["PLACE 0,5,NORTH"] + ["MOVE"] * 10_000
+        rover = Rover(TableBounds())
+        output = "".join(stream_output(lines, rover, compiled=True))
+        assert output.count("\n") == 10_000
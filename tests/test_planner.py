@@ -0,0 +1,188 @@
+import random
+import re
+import time
+import tracemalloc
+from collections import deque
+
+import pytest
+
+from mars_rover.exceptions import InvalidCommandException, RoverNotPlacedException
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import UNBOUNDED_TABLE, Direction, Position, TableBounds
+from mars_rover.obstacles import ObstacleGrid, SparseObstacleGrid
+from mars_rover.parser import CommandParser
+from mars_rover.planner import GotoCommand, plan_route, route_length
+from mars_rover.rover import Rover
+
+BOUNDS = TableBounds(max_x=3, max_y=3)
+
+
+def _bfs_length(bounds, start, goal_x, goal_y, goal_direction, obstacles):
+    """Shortest route length by brute-force search over rover states."""
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        (x, y, direction), length = queue.popleft()
+        if (x, y) == (goal_x, goal_y) and goal_direction in (None, direction):
+            return length
+        rover = Rover(bounds, Position(x, y), direction, obstacles)
+        successors = []
+        for step in (rover.left, rover.right, rover.move):
+            rover.position, rover.direction = Position(x, y), direction
+            step()
+            successors.append((rover.position.x, rover.position.y, rover.direction))
+        for state in successors:
+            if state not in seen:
+                seen.add(state)
+                queue.append((state, length + 1))
+    return None
+
+
+def _follow(bounds, start, route, obstacles=None):
+    rover = Rover(bounds, Position(start[0], start[1]), start[2], obstacles)
+    for turns, moves in route:
+        rover.rotate(turns)
+        assert rover.move_many(moves).success
+    return rover
+
+
+class TestPlanRoute:
+    @pytest.mark.parametrize("goal_direction", [None, Direction.WEST])
+    def test_empty_table_routes_are_shortest(self, goal_direction):
+        grid = ObstacleGrid(BOUNDS)
+        for direction in Direction:
+            for x in range(4):
+                for y in range(4):
+                    start = (1, 2, direction)
+                    route = plan_route(BOUNDS, start, x, y, goal_direction)
+                    searched = plan_route(BOUNDS, start, x, y, goal_direction, grid)
+                    expected = _bfs_length(BOUNDS, start, x, y, goal_direction, None)
+                    assert route_length(route) == route_length(searched) == expected
+                    rover = _follow(BOUNDS, start, route)
+                    assert rover.position == Position(x, y)
+                    assert goal_direction in (None, rover.direction)
+
+    def test_routes_around_obstacles_are_shortest(self):
+        rng = random.Random(3)
+        bounds = TableBounds(max_x=6, max_y=6)
+        for _ in range(20):
+            cells = {(rng.randint(0, 6), rng.randint(0, 6)) for _ in range(12)}
+            cells.discard((0, 0))
+            grid = ObstacleGrid.from_cells(bounds, cells)
+            start = (0, 0, Direction.NORTH)
+            goal_x, goal_y = rng.randint(0, 6), rng.randint(0, 6)
+            route = plan_route(bounds, start, goal_x, goal_y, obstacles=grid)
+            expected = _bfs_length(bounds, start, goal_x, goal_y, None, grid)
+            if expected is None or (goal_x, goal_y) in cells:
+                assert route is None
+                continue
+            assert route_length(route) == expected
+            assert _follow(bounds, start, route, grid).position == Position(
+                goal_x, goal_y
+            )
+
+    def test_open_table_routes_are_shortest(self):
+        rng = random.Random(5)
+        box = TableBounds(-3, -3, 9, 9)
+        for _ in range(20):
+            cells = {(rng.randint(0, 6), rng.randint(0, 6)) for _ in range(16)}
+            cells.discard((0, 0))
+            grid = SparseObstacleGrid.from_cells(UNBOUNDED_TABLE, cells)
+            start = (0, 0, Direction.NORTH)
+            goal_x, goal_y = rng.randint(0, 6), rng.randint(0, 6)
+            route = plan_route(UNBOUNDED_TABLE, start, goal_x, goal_y, obstacles=grid)
+            expected = _bfs_length(box, start, goal_x, goal_y, None, grid)
+            if expected is None or (goal_x, goal_y) in cells:
+                assert route is None
+            else:
+                assert route_length(route) == expected
+
+    def test_huge_table_search_is_clipped(self):
+        bounds = TableBounds(max_x=10**9, max_y=10**9)
+        walls = {(x, y) for x in range(9, 14) for y in range(9, 14)} - {(11, 11)}
+        grid = SparseObstacleGrid.from_cells(bounds, walls)
+        start = (0, 0, Direction.NORTH)
+        assert plan_route(bounds, start, 11, 11, obstacles=grid) is None
+        assert route_length(plan_route(bounds, start, 20, 20, obstacles=grid)) == 41
+
+    def test_unreachable_targets(self):
+        grid = ObstacleGrid.from_cells(BOUNDS, [(1, 0), (0, 1), (2, 2)])
+        assert plan_route(BOUNDS, (0, 0, Direction.NORTH), 3, 3, obstacles=grid) is None
+        assert plan_route(BOUNDS, (0, 0, Direction.NORTH), 2, 2) is not None
+        assert plan_route(BOUNDS, (0, 0, Direction.NORTH), 4, 0) is None
+
+    def test_cached_until_obstacles_change(self):
+        grid = ObstacleGrid(BOUNDS)
+        start = (0, 0, Direction.EAST)
+        first = plan_route(BOUNDS, start, 3, 0, obstacles=grid)
+        assert plan_route(BOUNDS, start, 3, 0, obstacles=grid) is first
+        grid.block(2, 0)
+        route = plan_route(BOUNDS, start, 3, 0, obstacles=grid)
+        assert route is not first
+        assert route_length(route) > route_length(first)
+
+    def test_large_table(self):
+        bounds = TableBounds(max_x=99_999, max_y=99_999)
+        route = plan_route(bounds, (0, 0, Direction.NORTH), 99_999, 50_000)
+        assert route == ((0, 50_000), (1, 99_999))
+
+    def test_routes_are_folded_into_legs(self):
+        grid = ObstacleGrid.from_cells(BOUNDS, [(0, 2)])
+        route = plan_route(BOUNDS, (0, 0, Direction.NORTH), 0, 3, obstacles=grid)
+        assert route == ((0, 1), (1, 1), (-1, 2), (-1, 1))
+        assert route_length(route) == 8
+
+
+class TestGotoCommand:
+    def test_parse(self):
+        command = CommandParser().parse("goto 3, 4, south")
+        assert isinstance(command, GotoCommand)
+        assert (command.x, command.y, command.direction) == (3, 4, Direction.SOUTH)
+        assert CommandParser().parse("GOTO 1,2").direction is None
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("GOTO 1", ErrorMessages.GOTO_REQUIRES_ARGS),
+            ("GOTO 1,2,3,4", ErrorMessages.GOTO_REQUIRES_ARGS),
+            ("GOTO X,2", "Invalid GOTO command"),
+            ("GOTO 1,2,UP", "Invalid GOTO command"),
+            ("GOTOX 1,2", "Unknown command"),
+            ("GOTO1,2", "Unknown command"),
+        ],
+    )
+    def test_parse_errors(self, text, message):
+        with pytest.raises(InvalidCommandException, match=re.escape(message)):
+            CommandParser().parse(text)
+
+    def test_execute(self):
+        rover = Rover(TableBounds(), Position(0, 0), Direction.NORTH)
+        assert GotoCommand(4, 5, Direction.WEST).execute(rover).success
+        assert rover.report() == "4,5,WEST"
+
+    @pytest.mark.parametrize(
+        "bounds", [UNBOUNDED_TABLE, TableBounds(max_x=10**9, max_y=10**9)]
+    )
+    def test_huge_distance_in_constant_time_and_memory(self, bounds):
+        rover = Rover(bounds, Position(0, 0), Direction.SOUTH)
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            assert GotoCommand(10**9, 10**9, Direction.WEST).execute(rover).success
+            seconds = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert rover.report() == f"{10**9},{10**9},WEST"
+        assert seconds < 0.5
+        assert peak < 64 * 1024
+
+    def test_unreachable(self):
+        rover = Rover(TableBounds(), Position(0, 0), Direction.NORTH)
+        result = GotoCommand(9, 9).execute(rover)
+        assert result.message == ErrorMessages.GOTO_UNREACHABLE.format(x=9, y=9)
+        assert rover.position == Position(0, 0)
+
+    def test_not_placed(self):
+        with pytest.raises(RoverNotPlacedException):
+            GotoCommand(1, 1).execute(Rover(TableBounds()))
@@ -0,0 +1,199 @@
+import math
+from io import StringIO
+
+import pytest
+
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.exceptions import InvalidCommandException
+from mars_rover.messages import ErrorMessages
+from mars_rover import repeat
+from mars_rover.models import UNBOUNDED_TABLE, Direction, Position, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.repeat import RepeatCommand
+from mars_rover.result import RepeatedOutput
+from mars_rover.rover import Rover
+from mars_rover.world import World
+
+
+def _unrolled(lines):
+    """Run a script line by line, with REPEAT blocks expanded."""
+    stream = StringIO()
+    out = OutputBuffer(stream)
+    summary = run_batch(CommandParser(), Rover(TableBounds()), StringIO(lines), out)
+    out.flush()
+    return stream.getvalue(), summary
+
+
+def _assert_matches_unrolled(bounds, times, body):
+    """Check a REPEAT block against running its body ``times`` times."""
+    parser = CommandParser()
+    repeated = Rover(bounds, Position(5, 3), Direction.NORTH)
+    output = parser.parse(f"REPEAT {times} {{ {body} }}").execute(repeated)
+    unrolled = Rover(bounds, Position(5, 3), Direction.NORTH)
+    lines = []
+    for _ in range(times):
+        for text in body.split("; "):
+            result = parser.parse(text).execute(unrolled)
+            if isinstance(result, str):
+                lines.append(f"{result}\n")
+            elif not result.success:
+                lines.append(f"Error: {result.message}\n")
+    assert "".join(output.blocks()) == "".join(lines)
+    assert output.failures == sum(line.startswith("Error") for line in lines)
+    assert (repeated.position, repeated.direction) == (
+        unrolled.position,
+        unrolled.direction,
+    )
+
+
+@pytest.fixture
+def rover():
+    return Rover(TableBounds(), Position(0, 0), Direction.NORTH)
+
+
+class TestParseRepeat:
+    def test_parse(self):
+        command = CommandParser().parse("repeat 3 { move; left ; }")
+        assert isinstance(command, RepeatCommand)
+        assert command.times == 3
+        assert len(command.body) == 2
+        assert command.count == 6
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("REPEAT 3 MOVE", ErrorMessages.REPEAT_REQUIRES_BLOCK),
+            ("REPEAT 3 { MOVE", ErrorMessages.REPEAT_REQUIRES_BLOCK),
+            ("REPEAT X { MOVE }", "Invalid REPEAT command"),
+            ("REPEAT 3 { }", "Invalid REPEAT command"),
+            ("REPEAT 3 { REPEAT 2 { MOVE } }", "Invalid REPEAT command"),
+            ("REPEAT 3 { JUMP }", "Unknown command"),
+            ("REPEATX 3 { MOVE }", "Unknown command"),
+            ("REPEATED", "Unknown command"),
+        ],
+    )
+    def test_parse_errors(self, text, message):
+        with pytest.raises(InvalidCommandException, match=message):
+            CommandParser().parse(text)
+
+
+class TestRepeatCommand:
+    def test_matches_unrolled_execution(self):
+        body = "MOVE; MOVE; MOVE; RIGHT; REPORT; MOVE"
+        script = "PLACE 1,0,NORTH\nREPEAT 50 { " + body + " }\nREPORT\n"
+        unrolled = "PLACE 1,0,NORTH\n" + "\n".join([body.replace("; ", "\n")] * 50)
+        assert _unrolled(script) == _unrolled(unrolled + "\nREPORT\n")
+
+    def test_fast_forwards_huge_counts(self, rover):
+        command = CommandParser().parse("REPEAT 1000000000000 { MOVE; MOVE; REPORT }")
+        output = command.execute(rover)
+        assert isinstance(output, RepeatedOutput)
+        assert output.line_count == 3 * 10**12 - 5
+        assert output.failures == 2 * 10**12 - 5
+        assert rover.position == Position(0, 5)
+        assert output.prefix[:3] == [
+            "0,2,NORTH\n",
+            "0,4,NORTH\n",
+            f"Error: {ErrorMessages.MOVE_OUT_OF_BOUNDS}\n",
+        ]
+
+    def test_final_state_after_leftover_iterations(self, rover):
+        CommandParser().parse("REPEAT 10000000000003 { MOVE; RIGHT }").execute(rover)
+        assert rover.position == Position(1, 0)
+        assert rover.direction == Direction.WEST
+
+    def test_not_placed(self):
+        output = CommandParser().parse("REPEAT 1000000 { MOVE }").execute(
+            Rover(TableBounds())
+        )
+        assert output.failures == 1_000_000
+        assert output.cycle == [f"Error: {ErrorMessages.ROVER_NOT_PLACED}\n"]
+
+    def test_move_run_on_open_table(self):
+        rover = Rover(UNBOUNDED_TABLE, Position(0, 0), Direction.NORTH)
+        output = CommandParser().parse("REPEAT 1000000000000 { MOVE; MOVE }").execute(
+            rover
+        )
+        assert output.line_count == 0
+        assert rover.position == Position(0, 2 * 10**12)
+
+    def test_move_run_stops_at_edge(self, rover):
+        output = CommandParser().parse("REPEAT 4 { MOVE; MOVE }").execute(rover)
+        assert rover.position == Position(0, 5)
+        assert output.failures == 3
+        assert output.line_count == 3
+
+    @pytest.mark.parametrize("bounds", [TableBounds(), UNBOUNDED_TABLE])
+    def test_tracked_states_are_bounded(self, monkeypatch, bounds):
+        monkeypatch.setattr(repeat, "MAX_TRACKED_STATES", 3)
+        _assert_matches_unrolled(bounds, 40, "MOVE; LEFT; MOVE; RIGHT; MOVE; REPORT")
+
+    def test_blocks_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(repeat, "MAX_TRACKED_STATES", 3)
+        command = CommandParser().parse("REPEAT 20 { MOVE; REPORT; MOVE }")
+        rover = Rover(UNBOUNDED_TABLE, Position(0, 0), Direction.NORTH)
+        blocks = list(command.execute_blocks(rover))
+        assert len(blocks) == 7
+        assert all(len(block.prefix) <= 3 and not block.cycle for block in blocks)
+        lines = [line for block in blocks for line in block.prefix]
+        assert lines == [f"0,{2 * i + 1},NORTH\n" for i in range(20)]
+        assert rover.position == Position(0, 40)
+
+    def test_blocks_run_as_they_are_taken(self, monkeypatch):
+        monkeypatch.setattr(repeat, "MAX_TRACKED_STATES", 4)
+        command = CommandParser().parse("REPEAT 1000000000 { MOVE; REPORT }")
+        rover = Rover(UNBOUNDED_TABLE, Position(0, 0), Direction.EAST)
+        blocks = command.execute_blocks(rover)
+        assert next(blocks).prefix[-1] == "4,0,EAST\n"
+        assert rover.position == Position(4, 0)
+
+    def test_batch_writes_each_block(self, monkeypatch):
+        monkeypatch.setattr(repeat, "MAX_TRACKED_STATES", 4)
+
+        class Stream(StringIO):
+            writes = 0
+
+            def write(self, text):
+                self.writes += 1
+                return super().write(text)
+
+        stream = Stream()
+        script = StringIO("PLACE 0,0,EAST\nREPEAT 12 { REPORT; MOVE }\n")
+        out = OutputBuffer(stream, flush_size=1)
+        run_batch(CommandParser(), Rover(UNBOUNDED_TABLE), script, out)
+        assert stream.writes == 3
+        assert stream.getvalue() == "".join(f"{x},0,EAST\n" for x in range(12))
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "MOVE; LEFT; MOVE; RIGHT",
+            "RIGHT; MOVE; MOVE; LEFT; MOVE",
+            "LEFT; LEFT; MOVE; RIGHT; RIGHT; MOVE; MOVE",
+            "MOVE; RIGHT; MOVE",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "bounds",
+        [TableBounds(max_x=40, max_y=30), TableBounds(min_x=-3, max_y=math.inf)],
+    )
+    def test_translations_match_unrolled_execution(self, body, bounds):
+        _assert_matches_unrolled(bounds, 60, body)
+
+    def test_write_to(self):
+        output = RepeatedOutput(["a\n"], ["b\n", "c\n"], 5, ["d\n"])
+        parts = []
+        output.write_to(parts.append, block_lines=4)
+        assert "".join(parts) == "a\n" + "b\nc\n" * 5 + "d\n"
+        assert max(len(p) for p in parts) <= 8
+
+    def test_cycles_include_other_rovers(self):
+        world = World(TableBounds())
+        parser = CommandParser()
+        rover = world.rover()
+        parser.parse("PLACE 0,0,EAST").execute(rover)
+        parser.parse("ROVER 1 PLACE 3,0,WEST").execute(rover)
+        output = parser.parse("REPEAT 1000 { MOVE; ROVER 1 MOVE }").execute(rover)
+        assert rover.position == Position(1, 0)
+        assert world.rover(1).position == Position(2, 0)
+        assert output.failures == 2 * 1000 - 2
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from mars_rover.batch import execute_commands, parse_lines
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.replay import ReplayIndex, main
+from mars_rover.rover import Rover
+
+
+@pytest.fixture
+def log(tmp_path):
+    rng = random.Random(8)
+    vocabulary = ["MOVE"] * 4 + ["LEFT", "RIGHT", "REPORT", "JUMP", ""]
+    vocabulary.append("PLACE 3,3,SOUTH")
+    lines = ["PLACE 0,0,NORTH"] + [rng.choice(vocabulary) for _ in range(500)]
+    path = tmp_path / "log.txt"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _expected(path, count):
+    rover = Rover(TableBounds())
+    with open(path) as f:
+        commands = list(parse_lines(CommandParser(), f))[:count]
+    failures = execute_commands(commands, rover, lambda text: None).failures
+    return rover.position, rover.direction, failures
+
+
+class TestReplayIndex:
+    def test_seek_matches_full_replay(self, log):
+        index = ReplayIndex.build(str(log), TableBounds(), interval=37)
+        assert len(index.snapshots) > 10
+        for n in (0, 1, 36, 37, 38, 200, 421):
+            rover, failures = index.seek(n)
+            assert (rover.position, rover.direction, failures) == _expected(log, n)
+
+    def test_save_and_load(self, log):
+        index = ReplayIndex.build(str(log), TableBounds(max_x=7), interval=50)
+        path = index.save()
+        assert path == str(log) + ".idx"
+        loaded = ReplayIndex.load(str(log))
+        assert loaded.snapshots == index.snapshots
+        assert loaded.bounds == TableBounds(max_x=7)
+        assert loaded.interval == 50
+
+    def test_stale_index(self, log):
+        ReplayIndex.build(str(log), TableBounds(), interval=50).save()
+        with open(log, "a") as f:
+            f.write("MOVE\n")
+        with pytest.raises(ValueError, match="stale"):
+            ReplayIndex.load(str(log))
+
+    def test_seek_writes_replayed_output(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("PLACE 1,1,EAST\nREPORT\nMOVE\nREPORT\nEXIT\nREPORT\n")
+        index = ReplayIndex.build(str(path), TableBounds(), interval=3)
+        output = []
+        rover, _ = index.seek(10, write=output.append)
+        assert output == ["2,1,EAST\n"]
+        assert rover.report() == "2,1,EAST"
+
+    def test_seek_rejects_negative_index(self, log):
+        index = ReplayIndex.build(str(log), TableBounds(), interval=100)
+        with pytest.raises(ValueError, match="negative"):
+            index.seek(-1)
+
+    def test_cli(self, log, capsys):
+        main(["index", str(log), "--interval", "100"])
+        main(["seek", str(log), "1"])
+        assert capsys.readouterr().out.endswith("0,0,NORTH (0 failures)\n")
+
+    def test_cli_rejects_negative_index(self, log, capsys):
+        main(["index", str(log), "--interval", "100"])
+        with pytest.raises(SystemExit):
+            main(["seek", str(log), "--", "-1"])
+        assert "negative" in capsys.readouterr().err
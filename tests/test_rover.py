@@ -3,6 +3,9 @@ import pytest
 from mars_rover.rover import Rover
 from mars_rover.models import Direction, Position, TableBounds
 from mars_rover.exceptions import RoverNotPlacedException
+from mars_rover.messages import ErrorMessages
+from mars_rover.result import CommandResult
+from mars_rover.status import Status, format_status
 
 
 class TestRoverPlace:
@@ -113,6 +116,29 @@ class TestRoverMove:
         assert rover.position == Position(0, 0)
 
 
+class TestRoverMoveMany:
+    def test_move_many_stops_at_edge(self):
+        rover = Rover(TableBounds())
+        rover.place(0, 3, Direction.NORTH)
+        result = rover.move_many(4)
+        assert not result.success
+        assert result.count == 2
+        assert rover.position == Position(0, 5)
+
+    def test_move_many_without_place(self):
+        rover = Rover(TableBounds())
+        with pytest.raises(RoverNotPlacedException, match="must be placed"):
+            rover.move_many(2)
+
+
+class TestRoverRotate:
+    def test_rotate(self):
+        rover = Rover(TableBounds())
+        rover.place(0, 0, Direction.NORTH)
+        assert rover.rotate(-3).success
+        assert rover.direction == Direction.EAST
+
+
 class TestRoverLeft:
     def test_left_without_place(self):
         rover = Rover(TableBounds())
@@ -154,3 +180,43 @@ class TestRoverCustomBounds:
         assert "outside table bounds" in result.message
         result = rover.place(1, 1, Direction.NORTH)
         assert result.success
+
+
+class TestRoverStatusApi:
+    def test_try_methods_before_place(self):
+        rover = Rover(TableBounds())
+        assert rover.try_move() == Status.ROVER_NOT_PLACED
+        assert rover.try_left() == Status.ROVER_NOT_PLACED
+        assert rover.try_right() == Status.ROVER_NOT_PLACED
+        assert rover.try_report() is None
+
+    def test_try_place_and_move(self):
+        rover = Rover(TableBounds())
+        assert rover.try_place(9, 9, Direction.NORTH) == Status.POSITION_OUT_OF_BOUNDS
+        assert rover.try_place(0, 5, Direction.NORTH) == Status.OK
+        assert rover.try_move() == Status.MOVE_OUT_OF_BOUNDS
+        assert rover.try_right() == Status.OK
+        assert rover.try_move() == Status.OK
+        assert rover.try_report() == "1,5,EAST"
+
+    def test_format_status_matches_messages(self):
+        assert format_status(Status.MOVE_OUT_OF_BOUNDS) == (
+            ErrorMessages.MOVE_OUT_OF_BOUNDS
+        )
+        assert format_status(Status.POSITION_OUT_OF_BOUNDS, 7, -1) == (
+            ErrorMessages.POSITION_OUT_OF_BOUNDS.format(x=7, y=-1)
+        )
+
+
+class TestAllocation:
+    def test_ok_result_is_shared_and_immutable(self):
+        rover = Rover(TableBounds(), Position(0, 0), Direction.NORTH)
+        result = rover.move()
+        assert result is rover.left() is CommandResult.ok()
+        with pytest.raises(AttributeError):
+            result.success = False
+        assert CommandResult.ok("done").message == "done"
+
+    def test_slots(self):
+        for obj in (Rover(TableBounds()), Position(0, 0), CommandResult.ok()):
+            assert not hasattr(obj, "__dict__")
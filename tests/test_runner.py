@@ -0,0 +1,103 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from mars_rover.main import main
+from mars_rover.models import TableBounds
+from mars_rover.runner import find_missions, run_missions
+
+TEST_DATA = Path(__file__).parent / "test_data"
+
+
+class TestFindMissions:
+    def test_directory(self):
+        paths = find_missions(str(TEST_DATA))
+        assert str(TEST_DATA / "basic_movement.txt") in paths
+        assert paths == sorted(paths)
+
+    def test_glob(self):
+        paths = find_missions(str(TEST_DATA / "full_tour*.txt"))
+        assert [Path(p).name for p in paths] == [
+            "full_tour.txt",
+            "full_tour_detailed.txt",
+        ]
+
+
+class TestRunMissions:
+    def test_writes_outputs_and_summary(self, tmp_path):
+        missions = tmp_path / "missions"
+        missions.mkdir()
+        shutil.copy(TEST_DATA / "basic_movement.txt", missions)
+        (missions / "errors.txt").write_text("MOVE\nJUMP\n")
+        output_dir = tmp_path / "out"
+
+        summary = run_missions(
+            find_missions(str(missions)), str(output_dir), TableBounds(), workers=2
+        )
+
+        assert summary["files"] == 2
+        assert summary["failures"] == 2
+        by_name = {Path(m["path"]).name: m for m in summary["missions"]}
+        assert by_name["errors.txt"]["failures"] == 2
+        assert by_name["basic_movement.txt"]["failures"] == 0
+        assert (output_dir / "errors.txt.out").read_text().count("Error:") == 2
+        written = json.loads((output_dir / "summary.json").read_text())
+        assert written["commands"] == summary["commands"]
+
+    def test_unreadable_file_does_not_stop_the_run(self, tmp_path):
+        missions = tmp_path / "missions"
+        missions.mkdir()
+        shutil.copy(TEST_DATA / "basic_movement.txt", missions)
+        (missions / "bad.txt").write_bytes(b"PLACE 0,0,NORTH\n\xff\n")
+        output_dir = tmp_path / "out"
+
+        summary = run_missions(
+            find_missions(str(missions)), str(output_dir), TableBounds(), workers=2
+        )
+
+        assert summary["files"] == 2
+        bad = str(missions / "bad.txt")
+        assert list(summary["errors"]) == [bad]
+        assert summary["errors"][bad].startswith("UnicodeDecodeError: ")
+        assert (output_dir / "basic_movement.txt.out").read_text()
+
+    def test_run_subcommand_reports_unreadable_files(self, tmp_path, capsys):
+        bad = tmp_path / "bad.txt"
+        bad.write_bytes(b"\xff\n")
+        with pytest.raises(SystemExit) as exc:
+            main(["run", str(bad), "-o", str(tmp_path / "out")])
+        assert exc.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.err.startswith(f"Error: {bad}: UnicodeDecodeError")
+        assert "1 files" in captured.out
+
+    def test_run_subcommand(self, tmp_path, capsys):
+        main(["run", str(TEST_DATA / "basic_movement.txt"), "-o", str(tmp_path)])
+        assert "1 files" in capsys.readouterr().out
+        assert (tmp_path / "basic_movement.txt.out").exists()
+
+    def test_run_subcommand_without_files(self, tmp_path):
+        with pytest.raises(SystemExit) as exc:
+            main(["run", str(tmp_path / "*.txt")])
+        assert exc.value.code == 2
+
+    def test_rejects_duplicate_output_names(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "mission.txt").write_text("MOVE\n")
+        paths = find_missions(str(tmp_path / "*" / "mission.txt"))
+        output_dir = tmp_path / "out"
+        with pytest.raises(ValueError, match="mission.txt.out"):
+            run_missions(paths, str(output_dir), TableBounds(), workers=1)
+        assert not output_dir.exists()
+
+    def test_run_subcommand_with_duplicate_names(self, tmp_path, capsys):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "mission.txt").write_text("MOVE\n")
+        with pytest.raises(SystemExit) as exc:
+            main(["run", str(tmp_path / "*" / "mission.txt"), "-o", str(tmp_path)])
+        assert exc.value.code == 2
+        assert "share the output file" in capsys.readouterr().err
@@ -0,0 +1,100 @@
+import asyncio
+
+from mars_rover.models import TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.server import MAX_LINE_LENGTH, RoverServer
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _session(server, payload, **start):
+    servers = await server.start(**start)
+    try:
+        if "unix_path" in start:
+            reader, writer = await asyncio.open_unix_connection(start["unix_path"])
+        else:
+            port = servers[0].sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(payload)
+        await writer.drain()
+        output = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        await writer.wait_closed()
+        return output
+    finally:
+        for s in servers:
+            s.close()
+            await s.wait_closed()
+
+
+class _Transport:
+    def get_write_buffer_size(self):
+        return 0
+
+
+class _Writer:
+    def __init__(self):
+        self.transport = _Transport()
+        self.closed = False
+        self.waited = False
+
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        self.waited = self.closed
+
+
+class TestRoverServer:
+    def _server(self, idle_timeout=5.0):
+        return RoverServer(TableBounds(), CommandParser(), idle_timeout)
+
+    def test_pipelined_commands(self):
+        payload = b"PLACE 0,0,NORTH\nMOVE\nREPORT\nJUMP\nEXIT\nREPORT\n"
+        output = _run(_session(self._server(), payload, host="127.0.0.1", port=0))
+        assert output == b"0,1,NORTH\nError: Unknown command: 'JUMP'\n"
+
+    def test_sessions_have_separate_rovers(self):
+        server = self._server()
+        first = _run(
+            _session(server, b"PLACE 2,2,EAST\nEXIT\n", host="127.0.0.1", port=0)
+        )
+        second = _run(_session(server, b"REPORT\nEXIT\n", host="127.0.0.1", port=0))
+        assert first == b""
+        assert b"must be placed" in second
+        assert server.sessions == 0
+
+    def test_idle_timeout(self):
+        output = _run(
+            _session(self._server(idle_timeout=0.05), b"", host="127.0.0.1", port=0)
+        )
+        assert output == b"Error: idle timeout\n"
+
+    def test_line_too_long(self):
+        payload = b"M" * (MAX_LINE_LENGTH * 2) + b"\n"
+        output = _run(_session(self._server(), payload, host="127.0.0.1", port=0))
+        assert output == b"Error: line too long\n"
+
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "rover.sock")
+        payload = b"PLACE 1,1,WEST\nREPORT\nEXIT\n"
+        output = _run(_session(self._server(), payload, unix_path=path))
+        assert output == b"1,1,WEST\n"
+
+    def test_waits_for_the_connection_to_close(self):
+        async def session():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"MOVE\nEXIT\n")
+            writer = _Writer()
+            await self._server().handle(reader, writer)
+            return writer
+
+        assert _run(session()).waited
@@ -0,0 +1,74 @@
+import pytest
+
+from mars_rover.models import TableBounds
+from mars_rover.tiles import TiledGrid
+
+
+class TestTiledGrid:
+    def test_unset_cells_are_zero(self):
+        grid = TiledGrid()
+        assert grid.get(10**9, -(10**9)) == 0
+        assert not grid.tiles
+
+    def test_set_and_get(self):
+        grid = TiledGrid(tile_shift=2)
+        grid.set(5, -3, 7)
+        grid.set(-1, -1, 2)
+        assert grid.get(5, -3) == 7
+        assert grid.get(-1, -1) == 2
+        assert grid.get(4, -3) == 0
+        assert len(grid.tiles) == 2
+
+    def test_zero_writes_allocate_nothing(self):
+        grid = TiledGrid()
+        grid.set(3, 3, 0)
+        assert not grid.tiles
+
+    def test_add(self):
+        grid = TiledGrid()
+        assert grid.add(2, 2) == 1
+        assert grid.add(2, 2, 4) == 5
+        assert grid.get(2, 2) == 5
+
+    def test_items_and_count(self):
+        grid = TiledGrid(tile_shift=3)
+        cells = {(0, 0): 1, (9, -20): 3, (10**12, 7): 2}
+        for (x, y), value in cells.items():
+            grid.set(x, y, value)
+        assert {(x, y): value for x, y, value in grid.items()} == cells
+        assert grid.count_nonzero() == 3
+
+    def test_extent(self):
+        grid = TiledGrid(tile_shift=2)
+        assert grid.extent() is None
+        grid.set(5, -3, 1)
+        grid.set(0, 0, 1)
+        assert grid.extent() == TableBounds(0, -4, 7, 3)
+
+    @pytest.mark.parametrize("dx,dy", [(1, 0), (-1, 0), (0, 1), (0, -1)])
+    def test_first_nonzero(self, dx, dy):
+        grid = TiledGrid(tile_shift=2)
+        cells = [(3, 1), (-9, 1), (1, 14), (1, -6), (20, 20)]
+        for x, y in cells:
+            grid.set(x, y, 1)
+        for steps in (3, 30):
+            walked = next(
+                (k for k in range(1, steps + 1) if (1 + dx * k, 1 + dy * k) in cells),
+                None,
+            )
+            assert grid.first_nonzero(1, 1, dx, dy, steps) == walked
+
+    def test_rejects_negative_shift(self):
+        with pytest.raises(ValueError):
+            TiledGrid(tile_shift=-1)
+
+    @pytest.mark.parametrize("dx, dy", [(1, 0), (-1, 0), (0, 1), (0, -1)])
+    def test_runs_cover_each_step_once(self, dx, dy):
+        grid = TiledGrid(tile_shift=2)
+        steps = []
+        for tile, cells, k in grid.runs(1, -2, dx, dy, 11):
+            for offset, step in zip(range(len(tile))[cells], range(k, 12)):
+                tile[offset] = step
+                steps.append(step)
+        assert steps == list(range(1, 12))
+        assert all(grid.get(1 + dx * k, -2 + dy * k) == k for k in range(1, 12))
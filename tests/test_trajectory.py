@@ -0,0 +1,85 @@
+from io import StringIO
+
+import pytest
+
+from mars_rover.batch import OutputBuffer, run_batch
+from mars_rover.main import main
+from mars_rover.models import Direction, TableBounds
+from mars_rover.parser import CommandParser
+from mars_rover.recorder import Opcode
+from mars_rover.rover import Rover
+from mars_rover.status import Status
+from mars_rover.trajectory import TrajectoryLog
+
+
+def _log(script, capacity=16, compiled=False):
+    log = TrajectoryLog(capacity)
+    rover = Rover(TableBounds(), recorder=log)
+    out = OutputBuffer(StringIO())
+    run_batch(CommandParser(), rover, StringIO(script), out, compiled)
+    return log
+
+
+class TestTrajectoryLog:
+    def test_records_states(self):
+        log = _log("PLACE 0,0,NORTH\nMOVE\nRIGHT\nLEFT\nLEFT\nMOVE\n")
+        assert list(log.entries()) == [
+            (0, 0, Direction.NORTH, Opcode.PLACE, Status.OK),
+            (0, 1, Direction.NORTH, Opcode.MOVE, Status.OK),
+            (0, 1, Direction.EAST, Opcode.RIGHT, Status.OK),
+            (0, 1, Direction.NORTH, Opcode.LEFT, Status.OK),
+            (0, 1, Direction.WEST, Opcode.LEFT, Status.OK),
+            (0, 1, Direction.WEST, Opcode.MOVE, Status.MOVE_OUT_OF_BOUNDS),
+        ]
+
+    def test_repeat_matches_unrolled(self):
+        body = "MOVE; RIGHT; MOVE; LEFT; LEFT; MOVE; RIGHT"
+        repeated = _log(f"PLACE 2,2,NORTH\nREPEAT 50 {{ {body} }}\n")
+        unrolled = _log("PLACE 2,2,NORTH\n" + (body.replace("; ", "\n") + "\n") * 50)
+        assert repeated.count == unrolled.count == 351
+        assert list(repeated.entries()) == list(unrolled.entries())
+
+    def test_keeps_last_entries(self):
+        log = _log("PLACE 0,0,EAST\n" + "MOVE\n" * 5, capacity=3)
+        assert len(log) == 3
+        assert log.count == 6
+        assert [entry[0] for entry in log.entries()] == [3, 4, 5]
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            TrajectoryLog(0)
+
+    @pytest.mark.parametrize("capacity", [2, 4, 16])
+    def test_compiled_matches_uncompiled(self, capacity):
+        script = "PLACE 0,0,NORTH\n" + "MOVE\n" * 7 + "RIGHT\nMOVE\nMOVE\n"
+        plain = _log(script, capacity)
+        compiled = _log(script, capacity, compiled=True)
+        assert list(compiled.entries()) == list(plain.entries())
+        assert compiled.count == plain.count
+
+    def test_on_error(self):
+        dumps = []
+        log = TrajectoryLog(on_error=lambda log: dumps.append(log.count))
+        rover = Rover(TableBounds(), recorder=log)
+        rover.place(0, 4, Direction.NORTH)
+        rover.try_move()
+        rover.try_move()
+        rover.move_many(3)
+        assert dumps == [3, 6]
+
+    def test_dump(self):
+        log = _log("PLACE 0,0,SOUTH\nMOVE\n", capacity=1)
+        stream = StringIO()
+        log.dump(stream)
+        assert stream.getvalue() == (
+            "Last 1 of 2 rover commands:\nMOVE 0,0,SOUTH MOVE_OUT_OF_BOUNDS\n"
+        )
+
+    def test_cli_dumps_first_error(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text("PLACE 0,5,NORTH\nMOVE\nMOVE\n")
+        with pytest.raises(SystemExit):
+            main(["--batch", "--trajectory", "1", str(mission)])
+        err = capsys.readouterr().err
+        assert err.count("rover commands") == 1
+        assert "MOVE 0,5,NORTH MOVE_OUT_OF_BOUNDS" in err
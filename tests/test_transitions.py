@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from mars_rover.exceptions import RoverNotPlacedException
+from mars_rover.models import UNBOUNDED_TABLE, Direction, Position, TableBounds
+from mars_rover.rover import Rover
+from mars_rover.transitions import TableRover, transition_tables
+
+
+class TestTransitionTables:
+    def test_tables_are_shared_per_bounds(self):
+        assert TableRover(TableBounds()).tables is TableRover(TableBounds()).tables
+
+    def test_encode_decode_round_trip(self):
+        tables = transition_tables(TableBounds(min_x=-2, min_y=1, max_x=3, max_y=4))
+        state = tables.encode(-1, 3, Direction.WEST)
+        assert tables.decode(state) == (-1, 3, Direction.WEST)
+
+    def test_move_rejected_at_edge(self):
+        tables = transition_tables(TableBounds())
+        state = tables.encode(5, 0, Direction.EAST)
+        assert tables.move_rejected[state]
+        assert tables.move[state] == state
+
+    @pytest.mark.parametrize("width, height", [(1, 1), (1, 4), (3, 1), (4, 3)])
+    def test_tables_match_rover(self, width, height):
+        bounds = TableBounds(min_x=-1, min_y=2, max_x=width - 2, max_y=height + 1)
+        tables = transition_tables(bounds)
+        for state in range(tables.states):
+            x, y, direction = tables.decode(state)
+            for table, step in [
+                (tables.move, Rover.try_move),
+                (tables.left, Rover.try_left),
+                (tables.right, Rover.try_right),
+            ]:
+                rover = Rover(bounds, Position(x, y), direction)
+                rejected = step(rover) != 0
+                assert tables.decode(table[state]) == (
+                    rover.position.x,
+                    rover.position.y,
+                    rover.direction,
+                )
+                if table is tables.move:
+                    assert tables.move_rejected[state] == rejected
+
+    def test_too_many_states(self):
+        with pytest.raises(ValueError):
+            transition_tables(TableBounds(max_x=10**6, max_y=10**6))
+
+    def test_open_bounds(self):
+        with pytest.raises(ValueError, match="finite"):
+            transition_tables(UNBOUNDED_TABLE)
+
+
+class TestTableRover:
+    def test_place_move_report(self):
+        rover = TableRover(TableBounds())
+        assert rover.place(1, 2, Direction.EAST).success
+        assert rover.move().success
+        assert rover.report() == "2,2,EAST"
+        assert rover.position == Position(2, 2)
+
+    def test_not_placed(self):
+        rover = TableRover(TableBounds())
+        assert rover.position is None
+        with pytest.raises(RoverNotPlacedException, match="must be placed"):
+            rover.move()
+
+    def test_place_outside_bounds(self):
+        result = TableRover(TableBounds()).place(6, 0, Direction.NORTH)
+        assert not result.success
+        assert "outside table bounds" in result.message
+
+    def test_matches_rover(self):
+        rng = random.Random(11)
+        bounds = TableBounds(min_x=-1, max_x=3, max_y=2)
+        rover, table_rover = Rover(bounds), TableRover(bounds)
+        for _ in range(2000):
+            op = rng.choice(
+                ["move", "move", "left", "right", "report", "place"]
+                + ["move_many", "rotate"]
+            )
+            args = ()
+            if op == "move_many":
+                args = (rng.randint(1, 6),)
+            elif op == "rotate":
+                args = (rng.randint(-5, 5),)
+            elif op == "place":
+                direction = rng.choice(list(Direction))
+                args = (rng.randint(-2, 4), rng.randint(-1, 3), direction)
+            outcomes = []
+            for r in (rover, table_rover):
+                try:
+                    outcomes.append(getattr(r, op)(*args))
+                except RoverNotPlacedException as e:
+                    outcomes.append(str(e))
+            assert outcomes[0] == outcomes[1]
+            assert rover.position == table_rover.position
+            assert rover.direction == table_rover.direction
@@ -0,0 +1,131 @@
+import pytest
+
+from mars_rover.commands import MoveCommand, RoverCommand
+from mars_rover.exceptions import InvalidCommandException
+from mars_rover.main import main
+from mars_rover.messages import ErrorMessages
+from mars_rover.models import Direction, Position, TableBounds
+from mars_rover.obstacles import ObstacleGrid
+from mars_rover.parser import CommandParser
+from mars_rover.rover import Rover
+from mars_rover.status import Status
+from mars_rover.world import World
+
+
+@pytest.fixture
+def world():
+    return World(TableBounds())
+
+
+class TestWorld:
+    def test_rovers_created_on_first_use(self, world):
+        assert world.rover(3) is world.rover(3)
+        assert world.rover(3) is not world.rover()
+        assert world.rover(3).position is None
+
+    def test_occupancy_follows_rovers(self, world):
+        rover = world.rover(1)
+        rover.place(1, 1, Direction.NORTH)
+        assert world.rover_at(1, 1) == 1
+        rover.move()
+        assert world.rover_at(1, 1) is None
+        assert world.rover_at(1, 2) == 1
+        rover.place(4, 4, Direction.EAST)
+        assert world.occupancy == {(4, 4): 1}
+
+    def test_place_on_other_rover(self, world):
+        world.rover(1).place(2, 2, Direction.NORTH)
+        result = world.rover(2).place(2, 2, Direction.SOUTH)
+        assert result.message == ErrorMessages.POSITION_OCCUPIED.format(x=2, y=2)
+        assert world.rover(2).position is None
+
+    def test_place_on_own_cell(self, world):
+        world.rover(1).place(2, 2, Direction.NORTH)
+        assert world.rover(1).try_place(2, 2, Direction.EAST) == Status.OK
+        assert world.occupancy == {(2, 2): 1}
+
+    def test_move_into_other_rover(self, world):
+        world.rover(1).place(2, 2, Direction.NORTH)
+        world.rover(2).place(2, 1, Direction.NORTH)
+        assert world.rover(2).try_move() == Status.MOVE_COLLISION
+        assert world.rover(2).position == Position(2, 1)
+
+    def test_move_many_stops_behind_other_rover(self, world):
+        world.rover(1).place(0, 4, Direction.NORTH)
+        world.rover(2).place(0, 0, Direction.NORTH)
+        result = world.rover(2).move_many(6)
+        assert world.rover(2).position == Position(0, 3)
+        assert result.message == ErrorMessages.MOVE_COLLISION
+        assert result.count == 3
+        assert world.rover_at(0, 3) == 2
+
+    def test_long_run_on_huge_table(self):
+        world = World(TableBounds(max_x=10**9, max_y=10**9))
+        world.rover(1).place(10**9 - 5, 3, Direction.NORTH)
+        world.rover(2).place(4, 3, Direction.NORTH)
+        rover = world.rover(3)
+        rover.place(0, 3, Direction.EAST)
+        assert rover.move_many(10**9).count == 10**9 - 3
+        assert rover.position == Position(3, 3)
+        rover.place(5, 3, Direction.EAST)
+        assert rover.move_many(10**9).count == 11
+
+    def test_shares_obstacles(self):
+        grid = ObstacleGrid.from_cells(TableBounds(), [(1, 1)])
+        world = World(TableBounds(), grid)
+        assert world.rover(5).try_place(1, 1, Direction.NORTH) == (
+            Status.POSITION_BLOCKED
+        )
+
+
+class TestRoverCommand:
+    def test_parse(self):
+        command = CommandParser().parse("rover 3 move")
+        assert isinstance(command, RoverCommand)
+        assert command.rover_id == 3
+        assert isinstance(command.command, MoveCommand)
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("ROVER 3", ErrorMessages.ROVER_REQUIRES_ARGS),
+            ("ROVER X MOVE", "Invalid ROVER command"),
+            ("ROVER 1 ROVER 2 MOVE", "Invalid ROVER command"),
+            ("ROVER 1 JUMP", "Unknown command"),
+            ("ROVERS", "Unknown command: 'ROVERS'"),
+        ],
+    )
+    def test_parse_errors(self, text, message):
+        with pytest.raises(InvalidCommandException, match=message):
+            CommandParser().parse(text)
+
+    def test_addresses_rover_in_world(self, world):
+        parser = CommandParser()
+        default = world.rover()
+        parser.parse("ROVER 2 PLACE 1,1,EAST").execute(default)
+        parser.parse("ROVER 2 MOVE").execute(default)
+        assert parser.parse("ROVER 2 REPORT").execute(default) == "2,1,EAST"
+        assert default.position is None
+
+    def test_requires_world(self):
+        with pytest.raises(InvalidCommandException, match="multi-rover"):
+            CommandParser().parse("ROVER 1 MOVE").execute(Rover(TableBounds()))
+
+    def test_cli_multi_rover(self, tmp_path, capsys):
+        mission = tmp_path / "mission.txt"
+        mission.write_text(
+            "PLACE 0,0,NORTH\n"
+            "ROVER 1 PLACE 0,1,SOUTH\n"
+            "ROVER 1 MOVE\n"
+            "MOVE\n"
+            "ROVER 1 REPORT\n"
+            "REPORT\n"
+        )
+        with pytest.raises(SystemExit):
+            main(["--batch", "--multi-rover", str(mission)])
+        assert capsys.readouterr().out == (
+            f"Error: {ErrorMessages.MOVE_COLLISION}\n"
+            f"Error: {ErrorMessages.MOVE_COLLISION}\n"
+            "0,1,SOUTH\n"
+            "0,0,NORTH\n"
+        )